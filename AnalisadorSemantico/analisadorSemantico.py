@@ -1,71 +1,123 @@
+import sys
+
 # ==============================================================================
 # ANALISADOR SEMÂNTICO
 # ==============================================================================
-# Esta classe gerencia a tabela de símbolos usando uma pilha.
-# O índice 0 da lista é o escopo Global.
+# Esta classe gerencia a tabela de símbolos.
+# Cada variável declarada vira um Simbolo, com um número (id) sequencial.
+# A busca por nome não percorre os escopos: 'ligacoes' guarda, para cada
+# nome, a pilha dos símbolos visíveis com esse nome (o último é o do escopo
+# mais interno). Entrar num escopo não custa nada; sair dele desempilha só os
+# nomes que ele declarou. Assim a busca é um único acesso a dicionário, por
+# mais escopos que estejam abertos.
+#
+# O índice 0 de tabela_escopos é o escopo Global.
 # Novos escopos (procedimentos) são empilhados no topo da lista.
 
+
+class Simbolo:
+    """ Uma variável (ou parâmetro) declarada: o endereço e o tipo vêm juntos """
+    __slots__ = ('id', 'nome', 'tipo', 'endereco', 'categoria', 'nivel')
+
+    def __init__(self, numero, nome, tipo, endereco, categoria, nivel):
+        self.id = numero           # Posição em AnalisadorSemantico.simbolos
+        self.nome = nome
+        self.tipo = tipo           # 'INTEGER' ou 'REAL'
+        self.endereco = endereco
+        self.categoria = categoria
+        self.nivel = nivel         # Profundidade do escopo (0 = global)
+
+    def __repr__(self):
+        return f"Simbolo({self.id}, {self.nome!r}, {self.tipo}, endereço {self.endereco})"
+
+
 class AnalisadorSemantico:
     def __init__(self):
-        # Inicializa a pilha com o escopo global (um dicionário vazio)
-        self.tabela_escopos = [{}] 
+        # Pilha de escopos: cada um é um dicionário nome -> Simbolo declarado nele
+        self.tabela_escopos = [{}]
+        # nome -> pilha dos símbolos visíveis com esse nome (do mais externo ao mais interno)
+        self.ligacoes = {}
+        # Todos os símbolos já declarados, na ordem (índice = id)
+        self.simbolos = []
         # Contador para gerar endereços de memória sequenciais
         self.contador_memoria = 0
+        # Tipo de cada endereço já alocado (índice = endereço). Os endereços
+        # nunca são reaproveitados, então isso forma o layout da memória.
+        self.tipos_por_endereco = []
 
     def entrar_escopo(self):
-        """ 
+        """
         Chamado quando o parser entra em um 'procedure'.
         Cria um novo dicionário vazio no topo da pilha para guardar variáveis locais.
         """
         self.tabela_escopos.append({})
 
     def sair_escopo(self):
-        """ 
+        """
         Chamado quando o parser sai de um 'procedure'.
-        Remove o escopo do topo da pilha, 'esquecendo' as variáveis locais.
+        Remove o escopo do topo da pilha, 'esquecendo' as variáveis locais:
+        cada nome declarado nele volta a mostrar o símbolo de fora (se houver).
         """
-        self.tabela_escopos.pop()
+        ligacoes = self.ligacoes
+        for nome in self.tabela_escopos.pop():
+            pilha = ligacoes[nome]
+            pilha.pop()
+            if not pilha:
+                del ligacoes[nome]
 
     def adicionar_variavel(self, nome, tipo, categoria='var'):
-        """ 
+        """
         Adiciona uma variável no ESCOPO ATUAL (o último da lista).
         Permite que uma variável local tenha o mesmo nome de uma global (Shadowing).
         """
         escopo_atual = self.tabela_escopos[-1]
-        
+
         # Verifica se a variável já existe APENAS no escopo atual
         if nome in escopo_atual:
             raise Exception(f"Erro Semântico: A variável '{nome}' já foi declarada neste escopo.")
-        
-        # Registra a variável com seus metadados
-        escopo_atual[nome] = {
-            'tipo': tipo.upper(),
-            'endereco': self.contador_memoria,
-            'categoria': categoria
-        }
-        
-        # Aloca um endereço de memória e incrementa o contador
+
+        # Registra a variável. O nome é internado: as buscas com o mesmo nome
+        # vindo do lexer (também internado) comparam só o ponteiro
+        nome = sys.intern(nome)
         endereco_alocado = self.contador_memoria
+        simbolo = Simbolo(len(self.simbolos), nome, tipo.upper(), endereco_alocado,
+                          categoria, len(self.tabela_escopos) - 1)
+        self.simbolos.append(simbolo)
+        escopo_atual[nome] = simbolo
+        pilha = self.ligacoes.get(nome)
+        if pilha is None:
+            self.ligacoes[nome] = [simbolo]
+        else:
+            pilha.append(simbolo)
+
+        # Aloca um endereço de memória e incrementa o contador
         self.contador_memoria += 1
+        self.tipos_por_endereco.append(simbolo.tipo)
         return endereco_alocado
 
-    def verificar_declaracao(self, nome):
-        """ 
-        Busca por uma variável começando do escopo mais interno (local)
-        até o mais externo (global).
+    def resolver(self, nome):
+        """
+        Busca combinada: o Simbolo visível com esse nome (do escopo mais
+        interno que o declara), com o endereço e o tipo juntos.
         """
-        # A função reversed() permite iterar da pilha do topo para a base
-        for escopo in reversed(self.tabela_escopos):
-            if nome in escopo:
-                return escopo[nome]['endereco']
-        
-        # Se percorreu todos os escopos e não achou:
-        raise Exception(f"Erro Semântico: A variável '{nome}' não foi declarada.")
+        pilha = self.ligacoes.get(nome)
+        if pilha is None:
+            # Se nenhum escopo aberto declara o nome:
+            raise Exception(f"Erro Semântico: A variável '{nome}' não foi declarada.")
+        return pilha[-1]
+
+    def verificar_declaracao(self, nome):
+        """ Endereço da variável visível com esse nome (ver resolver) """
+        return self.resolver(nome).endereco
 
     def obter_tipo(self, nome):
         """ Retorna o tipo da variável (INTEGER ou REAL) """
-        for escopo in reversed(self.tabela_escopos):
-            if nome in escopo:
-                return escopo[nome]['tipo']
-        
-        raise Exception(f"Erro Semântico: A variável '{nome}' não foi declarada.")
\ No newline at end of file
+        return self.resolver(nome).tipo
+
+    def layout_memoria(self):
+        """
+        Tabela de layout dos dados: lista com o tipo (INTEGER ou REAL) de cada
+        endereço alocado, na ordem dos endereços. A máquina usa isso para
+        montar uma memória tipada (ver CodigoObjeto/memoriaTipada.py).
+        """
+        return list(self.tipos_por_endereco)
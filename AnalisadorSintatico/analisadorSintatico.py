@@ -1,7 +1,8 @@
-import ply.yacc as yacc
-import ply.lex as lex
 import sys
 import os
+import io
+import copy
+import threading
 
 # ==============================================================================
 # CONFIGURAÇÃO DE PATHS (Para rodar de qualquer lugar)
@@ -9,8 +10,10 @@ import os
 DIRETORIO_ATUAL = os.path.dirname(os.path.abspath(__file__))
 DIRETORIO_RAIZ = os.path.dirname(DIRETORIO_ATUAL) # Sobe um nível
 
-# Adiciona pastas ao path para importar o semântico
+# Adiciona pastas ao path para importar o semântico, o formato binário e o lexer rápido
 sys.path.append(os.path.join(DIRETORIO_RAIZ, 'AnalisadorSemantico'))
+sys.path.append(os.path.join(DIRETORIO_RAIZ, 'CodigoObjeto'))
+sys.path.append(DIRETORIO_ATUAL)
 
 # Configura caminhos dos arquivos de dados
 # Tenta achar Dados na raiz (padrão) ou na pasta atual
@@ -20,6 +23,15 @@ if not os.path.exists(PASTA_DADOS):
 
 ARQUIVO_TOKENS = os.path.join(PASTA_DADOS, 'tokens.txt')
 ARQUIVO_CODIGO_OBJETO = os.path.join(PASTA_DADOS, 'codigo_objeto.txt')
+ARQUIVO_CODIGO_BINARIO = os.path.join(PASTA_DADOS, 'codigo_objeto.bin')
+
+# formatoBinario, otimizador e otimizadorArvore só são usados com --binario e -O: são importados na hora
+import memoriaTipada
+import mapaFonte
+import cacheCompilacao
+# Nós da árvore sintática, que as regras p_ montam, e a passada que gera o código
+from arvoreSintatica import *
+import geracaoCodigo
 
 # Importação do Semântico
 try:
@@ -29,17 +41,23 @@ except ImportError:
     print("AVISO: Não foi possível importar 'analisadorSemantico'. Verifique o nome do arquivo.")
     # Classe Mock para não quebrar se o arquivo não estiver lá
     class AnalisadorSemantico:
+        endereco, tipo = 0, 'INTEGER' # O próprio mock serve de símbolo no resolver
+        contador_memoria = 0
         def adicionar_variavel(self, n, t, c='var'): return 0
+        def resolver(self, n): return self
         def verificar_declaracao(self, n): return 0
         def obter_tipo(self, n): return 'INTEGER'
         def entrar_escopo(self): pass
         def sair_escopo(self): pass
+        def layout_memoria(self): return []
 
 # ==============================================================================
 # CLASSE AUXILIAR: GERADOR DE CÓDIGO
 # ==============================================================================
 # Esta classe é o "cérebro" da geração de código. Ela é responsável por guardar
 # as instruções da máquina hipotética e conversar com o analisador semântico.
+# Quem emite as instruções é a passada de geração de código sobre a árvore
+# sintática (ver geracaoCodigo.py).
 
 class GeradorCodigo:
     def __init__(self):
@@ -50,11 +68,16 @@ class GeradorCodigo:
         # Isso permite que eu valide os tipos e escopos ANTES de gerar o código.
         self.semantico = AnalisadorSemantico()
         
-        # Tabela de procedimentos: guarda nome -> {'endereco': int, 'num_params': int, 'params': [enderecos]}
+        # Tabela de procedimentos: guarda nome -> {'endereco': int, 'num_params': int, 'params': [enderecos],
+        # 'quadro': (primeiro endereço, tamanho) do quadro de ativação}
         self.tabela_procedimentos = {}
-        
-        # Pilha para rastrear quantidade de variáveis alocadas por escopo (para DESM)
-        self.variaveis_por_escopo = []
+
+        # Mapa para depuração (ver CodigoObjeto/mapaFonte.py): a linha do fonte
+        # de cada instrução emitida e o intervalo de linhas de cada procedimento.
+        # A geração de código atualiza 'linha_atual' com as linhas guardadas na árvore antes de emitir.
+        self.linha_atual = mapaFonte.SEM_LINHA
+        self.linhas_fonte = []
+        self.procedimentos_fonte = []
 
     def adicionar_instrucao(self, instrucao, argumento=None):
         """
@@ -64,6 +87,7 @@ class GeradorCodigo:
         """
         linha = f"{instrucao} {argumento}" if argumento is not None else instrucao
         self.codigo.append(linha)
+        self.linhas_fonte.append(self.linha_atual)
         
         # Eu retorno o índice (número da linha) atual.
         # Isso é CRUCIAL para o 'Backpatching': eu preciso saber o endereço dessa linha
@@ -83,8 +107,93 @@ class GeradorCodigo:
         # Reescrevo a linha com o destino correto (ex: "DSVF 50")
         self.codigo[indice_instrucao] = f"{instrucao_atual} {destino}"
 
-# Cria uma instância global do gerador para ser acessada por todas as regras do parser abaixo.
-gerador = GeradorCodigo()
+    def layout_dados(self):
+        """
+        Layout da memória de dados: uma letra por endereço alocado pelo
+        semântico ('I' = INTEGER, 'R' = REAL). Ver CodigoObjeto/memoriaTipada.py.
+        """
+        return memoriaTipada.layout_do_semantico(self.semantico.layout_memoria())
+
+    def marcar_linha(self, linha):
+        """ Linha do fonte das próximas instruções emitidas (0 = desconhecida, mantém a atual) """
+        if linha:
+            self.linha_atual = linha
+
+    def mapa_fonte(self):
+        """ Mapa PC -> linha do fonte e procedimentos (ver CodigoObjeto/mapaFonte.py) """
+        return mapaFonte.MapaFonte(self.linhas_fonte, self.procedimentos_fonte)
+
+    def programa_objeto(self, relatorio=None):
+        """ Retrato do código gerado até aqui, com os metadados (ver ProgramaObjeto) """
+        return ProgramaObjeto(self.codigo, self.layout_dados(), self.mapa_fonte(), relatorio)
+
+    def codigo_anotado(self):
+        """ Linhas do código objeto prontas para o arquivo texto (ver ProgramaObjeto) """
+        return self.programa_objeto().linhas_anotadas()
+
+    def salvar_binario(self, caminho):
+        """ Grava o código objeto no formato binário (ver ProgramaObjeto) """
+        self.programa_objeto().salvar_binario(caminho)
+
+    def otimizar(self, nivel=1):
+        """
+        Roda o otimizador (ver CodigoObjeto/otimizador.py) sobre o código já
+        gerado e com os desvios resolvidos. Devolve o relatório do otimizador.
+        """
+        import otimizador
+        self.codigo, relatorio = otimizador.otimizar(self.codigo, nivel, self.linhas_fonte,
+                                                     self.tabela_procedimentos)
+        self.linhas_fonte = relatorio.pop('linhas_fonte')
+        return relatorio
+
+
+class ProgramaObjeto:
+    """
+    Resultado de uma compilação: as linhas do código objeto, o layout de
+    dados (ver CodigoObjeto/memoriaTipada.py), o mapa do fonte (ver
+    CodigoObjeto/mapaFonte.py) e o relatório do otimizador (None em -O0).
+    """
+
+    def __init__(self, linhas, layout, mapa, relatorio=None):
+        self.linhas = list(linhas)
+        self.layout = layout
+        self.mapa = mapa
+        self.relatorio = relatorio
+
+    def linhas_anotadas(self):
+        """
+        Linhas prontas para o arquivo texto: iguais a self.linhas, mas com o
+        layout de dados e o mapa do fonte comentados na primeira linha.
+        """
+        linhas = memoriaTipada.anotar_layout(self.linhas, self.layout)
+        return mapaFonte.anotar_mapa(linhas, self.mapa)
+
+    @classmethod
+    def das_linhas_anotadas(cls, linhas, relatorio=None):
+        """ Operação inversa de linhas_anotadas (usada pelo cache, ver cacheCompilacao.py) """
+        layout = memoriaTipada.extrair_layout(linhas) or ''
+        mapa = mapaFonte.extrair_mapa(linhas)
+        if linhas:
+            linhas = [linhas[0].split('#')[0].strip()] + list(linhas[1:])
+        return cls(linhas, layout, mapa, relatorio)
+
+    def salvar(self, caminho):
+        """ Grava o código objeto no formato texto (codigo_objeto.txt) """
+        with open(caminho, 'w') as f:
+            for linha in self.linhas_anotadas():
+                f.write(linha + '\n')
+
+    def salvar_binario(self, caminho):
+        """
+        Grava o código objeto no formato binário (ver CodigoObjeto/formatoBinario.py).
+        A máquina carrega esse arquivo direto com mmap, sem ler linha por linha.
+        O layout de dados e o mapa do fonte vão juntos, nas seções 'DADO' e 'FONT'.
+        """
+        import formatoBinario
+        secoes = {mapaFonte.SECAO_FONTE: self.mapa.codificar().encode('ascii')}
+        if self.layout:
+            secoes[memoriaTipada.SECAO_LAYOUT] = self.layout.encode('ascii')
+        formatoBinario.salvar(self.linhas, caminho, secoes)
 
 
 # ==============================================================================
@@ -162,6 +271,10 @@ def t_IDENT(t):
     # Se a palavra achada está no dicionário 'reserved',
     # então é uma palavra reservada (ex: IF), senão é um IDENT (nome de variável).
     t.type = reserved.get(t.value.lower(), 'IDENT')
+    # Nome internado: todas as ocorrências do nome são o mesmo objeto str
+    # (menos memória na árvore) e a busca na tabela de símbolos compara só
+    # o ponteiro (ver AnalisadorSemantico)
+    t.value = sys.intern(t.value)
     return t
 
 def t_newline(t):
@@ -171,104 +284,160 @@ def t_newline(t):
 
 def t_error(t):
     # Tratamento de erro léxico: Caractere inválido encontrado.
-    print(f"Erro Léxico: Caractere ilegal '{t.value[0]}' na linha {t.lexer.lineno}")
+    # Nada é impresso: a análise continua e a compilação falha no fim, com a
+    # mensagem no ErroCompilacao (ver Compilador.analisar)
+    t.lexer.erros_lexicos.append(f"Caractere ilegal '{t.value[0]}' na linha {t.lexer.lineno}")
     t.lexer.skip(1) # Pula o caractere ruim
 
-# Inicializa o Lexer com as regras acima
-# o PLY (Python Lex-Yacc) detecta as funções que usam t_ e as utiliza ao chamar o comando abaixo
-lexer = lex.lex()
+# ==============================================================================
+# CONSTRUÇÃO PREGUIÇOSA DO LEXER E DO PARSER
+# ==============================================================================
+# O PLY (Python Lex-Yacc) detecta as funções que usam t_ e p_ e monta, a partir
+# delas, as tabelas do lexer e do parser. Para o compilador abrir rápido:
+#   - as tabelas ficam em lextab.py e parsetab.py, nesta pasta. São geradas uma
+#     vez e, daí em diante, só importadas (o Python guarda o .pyc delas);
+#   - o lexer é carregado em modo otimizado, sem revalidar as regras. Por isso,
+#     ao mudar as regras t_ é preciso apagar o lextab.py para ele ser refeito.
+#     O parser confere a assinatura da gramática e refaz o parsetab.py sozinho;
+#   - nada de arquivo de depuração (parser.out);
+#   - o PLY só é importado, e as tabelas só são carregadas, na primeira
+#     compilação (obter_lexer/obter_parser), e não ao importar este módulo.
+
+PASTA_TABELAS = DIRETORIO_ATUAL
+
+_lexer = None
+_lexer_rapido = None
+_parser = None
+_trava_construcao = threading.Lock() # Duas threads não montam (nem gravam) as tabelas ao mesmo tempo
+
+def obter_lexer():
+    """ Lexer base, montado na primeira chamada. Quem for usar deve fazer um clone() """
+    global _lexer
+    with _trava_construcao:
+        if _lexer is None:
+            import ply.lex as lex
+            _lexer = lex.lex(module=sys.modules[__name__], optimize=True,
+                             lextab='lextab', outputdir=PASTA_TABELAS)
+            _lexer.erros_lexicos = [] # Cada clone recebe a sua lista no Compilador.analisar
+    return _lexer
+
+def obter_lexer_rapido():
+    """ Lexer rápido (ver lexerRapido.py), montado na primeira chamada. Também deve ser clonado """
+    global _lexer_rapido
+    with _trava_construcao:
+        if _lexer_rapido is None:
+            import lexerRapido
+            _lexer_rapido = lexerRapido.LexerRapido(vars(sys.modules[__name__]))
+    return _lexer_rapido
 
 # --- Função Auxiliar de Saída ---
+# O arquivo tokens.txt sai da mesma passada de análise léxica que alimenta o
+# parser: cada token lido pelo parser também é escrito, já formatado, no
+# arquivo (ver tokens_com_copia). Não existe mais uma segunda passada nem a
+# lista de todos os tokens na memória.
+
+OPERADORES = {'ASSIGN', 'EQ', 'NEQ', 'LT', 'GT', 'LTE', 'GTE', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE'}
+
+def formatar_token(tok):
+    """ Linha do tokens.txt para o token: [Tipo, Valor] """
+    # Traduz os nomes técnicos do PLY para nomes legíveis
+    if tok.type in reserved.values(): tipo_formatado = "Palavras Reservadas"
+    elif tok.type == 'IDENT': tipo_formatado = "Identificador"
+    elif tok.type in ('NUM_INT', 'NUM_REAL'): tipo_formatado = "Numeral"
+    elif tok.type in OPERADORES: tipo_formatado = "Operador"
+    else: tipo_formatado = "Pontuacao"
+    return f"[{tipo_formatado}, {tok.value}]"
+
+def tokens_com_copia(meu_lexer, destino):
+    """
+    Função de tokens para o parser (tokenfunc): devolve o próximo token do
+    lexer e, de passagem, escreve a linha formatada dele em 'destino'.
+    """
+    proximo = meu_lexer.token
+    escrever = destino.write
+    def token():
+        tok = proximo()
+        if tok is not None:
+            escrever(formatar_token(tok) + '\n')
+        return tok
+    return token
 
 def gerar_arquivo_tokens_formatado(codigo_fonte):
     """
-    Esta função gera um arquivo 'tokens.txt' listando todos os tokens encontrados,
-    formatados como [Tipo, Valor].
+    Gera só o arquivo 'tokens.txt' (sem compilar), listando todos os tokens
+    encontrados, formatados como [Tipo, Valor]. Para compilar e gerar o arquivo
+    na mesma passada, use Compilador.compilar(codigo_fonte, tokens=arquivo).
     """
     print(f"--- Gerando arquivo de tokens em: {ARQUIVO_TOKENS} ---")
     # Cria um lexer temporário só para isso
-    meu_lexer = lex.lex()
+    meu_lexer = obter_lexer().clone()
+    meu_lexer.lineno = 1
     meu_lexer.input(codigo_fonte)
-    lista_saida = []
-    
-    while True:
-        tok = meu_lexer.token()
-        if not tok: break # Fim do arquivo
-        
-        # Traduz os nomes técnicos do PLY para nomes legíveis
-        tipo_formatado = ""
-        if tok.type in reserved.values(): tipo_formatado = "Palavras Reservadas"
-        elif tok.type == 'IDENT': tipo_formatado = "Identificador"
-        elif tok.type in ['NUM_INT', 'NUM_REAL']: tipo_formatado = "Numeral"
-        elif tok.type in ['ASSIGN', 'EQ', 'NEQ', 'LT', 'GT', 'LTE', 'GTE', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE']: tipo_formatado = "Operador"
-        else: tipo_formatado = "Pontuacao"
-            
-        lista_saida.append(f"[{tipo_formatado}, {tok.value}]")
-        
-    # Salvo no arquivo
     with open(ARQUIVO_TOKENS, 'w') as f:
-        for l in lista_saida: f.write(l + '\n')
+        token = tokens_com_copia(meu_lexer, f)
+        while token():
+            pass
     print("Arquivo de tokens gerado com sucesso.")
 
 
 # ==============================================================================
-# PARTE 2: ANALISADOR SINTÁTICO E SEMÂNTICO (PARSER)
+# PARTE 2: ANALISADOR SINTÁTICO (PARSER)
 # ==============================================================================
 # Gramática BNF. Cada função 'p_' representa uma regra de produção.
 # Quando o parser reconhece a estrutura, ele executa o código Python dentro da função.
+# As regras não emitem código: cada uma monta um nó da árvore sintática (ver
+# arvoreSintatica.py) em p[0]. A análise semântica e a geração do código
+# objeto são feitas depois, sobre a árvore pronta (ver geracaoCodigo.py).
 
 def p_programa(p):
     '''programa : PROGRAM IDENT corpo DOT'''
     # Regra inicial: Programa começa com 'program', tem um nome, um corpo e termina com ponto.
-    # Quando chego aqui, o programa todo foi processado com sucesso.
-    gerador.adicionar_instrucao("PARA") # Gero a instrução de parada da máquina.
-    print("Análise Sintática e Semântica concluída com sucesso!")
+    # Quando chego aqui, o programa todo foi reconhecido: a árvore é o resultado do parse.
+    declaracoes, comandos = p[3]
+    p[0] = Programa(p[2], declaracoes, comandos, p.lineno(4))
 
 def p_corpo(p):
     '''corpo : dc BEGIN comandos END'''
     # Estrutura do corpo: Declarações (dc) -> begin -> comandos -> end
-    pass
+    p[0] = (p[1], p[3])
 
 # --- Regras de Declaração (dc) ---
 
+# As listas da gramática (declarações, comandos, variáveis, parâmetros e
+# argumentos) são recursivas à ESQUERDA: o parser LALR reduz cada item assim
+# que ele termina, e a pilha de estados fica do mesmo tamanho em qualquer
+# quantidade de itens. Com recursão à direita, nada era reduzido antes do fim
+# da lista e a pilha crescia um nível por comando.
+
 def p_dc(p):
-    '''dc : dc_v mais_dc
-          | dc_p mais_dc
+    '''dc : lista_dc
+          | lista_dc SEMICOLON
           | empty'''
-    # Declarações podem ser: variáveis (dc_v), procedimentos (dc_p) ou nenhuma (empty).
-    # Permite múltiplas declarações encadeadas através da regra 'mais_dc'.
+    # Declarações podem ser: uma lista de declarações, com ou sem ; no final, ou nenhuma (empty).
     # Exemplo: var a: integer; var b: real; procedure teste begin end
-    pass
+    p[0] = p[1] if p[1] is not None else []
 
-def p_mais_dc(p):
-    '''mais_dc : SEMICOLON dc
-               | empty'''
+def p_lista_dc(p):
+    '''lista_dc : lista_dc SEMICOLON declaracao
+                | declaracao'''
     # Permite encadear múltiplas declarações separadas por ponto e vírgula.
-    # Se não houver ponto e vírgula, assume que não há mais declarações (empty).
     # Exemplo: var a: integer; var b: real (o ; permite continuar declarando)
-    pass
+    if len(p) > 2:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else: p[0] = [p[1]]
+
+def p_declaracao(p):
+    '''declaracao : dc_v
+                  | dc_p'''
+    # Uma declaração: variáveis (dc_v) ou procedimento (dc_p).
+    p[0] = p[1]
 
 def p_dc_v(p):
     '''dc_v : VAR variaveis COLON tipo_var'''
     # DECLARAÇÃO DE VARIÁVEIS (ex: var a, b : integer)
-    # INTEGRAÇÃO SEMÂNTICA:
-    lista_vars = p[2] # Lista de nomes vinda de p_variaveis
-    tipo = p[4]       # Tipo (REAL ou INTEGER) vindo de p_tipo_var
-    
-    for var_nome in lista_vars:
-        try:
-            # Passo 1: Registro no Semântico. Se duplicar, ele dá erro.
-            gerador.semantico.adicionar_variavel(var_nome, tipo)
-            
-            # Passo 2: Se ok, aloco espaço na memória (Geração de Código)
-            gerador.adicionar_instrucao("ALME", 1)
-            
-            # Se estivermos dentro de um procedimento, incrementa contador
-            if gerador.variaveis_por_escopo:
-                gerador.variaveis_por_escopo[-1] += 1
-        except Exception as e:
-            print(f"ERRO SEMÂNTICO na linha {p.lineno(1)}: {e}")
-            sys.exit(1) # Interrompo a compilação
+    # p[2] é a lista de nomes vinda de p_variaveis e p[4] o tipo (REAL ou INTEGER)
+    p[0] = DeclaracaoVariaveis(p[2], p[4], p.lineno(1))
 
 def p_tipo_var(p):
     '''tipo_var : REAL
@@ -276,149 +445,93 @@ def p_tipo_var(p):
     p[0] = p[1] # Retorno o tipo encontrado para usar na regra acima
 
 def p_variaveis(p):
-    '''variaveis : IDENT mais_var'''
+    '''variaveis : variaveis COMMA IDENT
+                 | IDENT'''
     # Recursão para pegar múltiplas variáveis (a, b, c)
-    # Se p[2] retornar uma lista, somo com a variável atual.
-    if p[2]: p[0] = [p[1]] + p[2]
+    # Cada nova variável entra no fim da lista que já veio montada.
+    if len(p) > 2:
+        p[1].append(p[3])
+        p[0] = p[1]
     else: p[0] = [p[1]]
 
-def p_mais_var(p):
-    '''mais_var : COMMA variaveis
-                | empty'''
-    if len(p) > 2: p[0] = p[2] # Continua a lista
-    else: p[0] = [] # Fim da lista
-
 # --- Regras de Procedures ---
-# Aqui adiciono os marcadores para abrir e fechar escopo corretamente
 def p_inicio_escopo(p):
     '''inicio_escopo : empty'''
-    gerador.semantico.entrar_escopo()
-    # Inicia contador de variáveis para este escopo
-    gerador.variaveis_por_escopo.append(0)
-    # Gera pulo para não executar declaração do procedure
-    instrucao_pulo = gerador.adicionar_instrucao("DSVI", -1)
-    # Marca onde o procedimento começa (após o DSVI)
-    endereco_inicio_proc = len(gerador.codigo)
-    p[0] = {'pulo': instrucao_pulo, 'inicio': endereco_inicio_proc}
-
-def p_fim_escopo(p):
-    '''fim_escopo : empty'''
-    # Desaloca todas as variáveis do escopo (parâmetros + locais)
-    num_vars = gerador.variaveis_por_escopo.pop() if gerador.variaveis_por_escopo else 0
-    if num_vars > 0:
-        gerador.adicionar_instrucao("DESM", num_vars)
-    gerador.semantico.sair_escopo()
-    # Adiciona retorno
-    gerador.adicionar_instrucao("RTPR")
+    # Marcador logo após o nome do procedimento: guarda a linha onde o lexer
+    # está, que é a linha do DSVI que pula o corpo no código objeto
+    p[0] = p.lexer.lineno
 
 def p_dc_p(p):
     # Regra Procedure: procedure nome (params) corpo
-    # Usamos inicio_escopo e fim_escopo para delimitar variáveis locais
-    '''dc_p : PROCEDURE IDENT inicio_escopo parameters corpo_p fim_escopo'''
-    nome_proc = p[2]
-    info_escopo = p[3]
-    indice_pulo = info_escopo['pulo']
-    endereco_inicio = info_escopo['inicio']
-    enderecos_params = p[4] if p[4] else []
-    
-    # NÃO insere ARMZs no meio do código, isso quebra os saltos
-    # Em vez disso, guardo apenas a info e processo na chamada
-    
-    gerador.tabela_procedimentos[nome_proc] = {
-        'endereco': endereco_inicio,
-        'num_params': len(enderecos_params),
-        'params': enderecos_params
-    }
-    
-    # Corrige o salto para pular todo o corpo do procedimento
-    destino = len(gerador.codigo)
-    gerador.corrigir_salto(indice_pulo, destino)
+    '''dc_p : PROCEDURE IDENT inicio_escopo parameters corpo_p'''
+    parametros, linha_parametros = p[4]
+    declaracoes, comandos, linha_fim = p[5]
+    p[0] = Procedimento(p[2], parametros, declaracoes, comandos,
+                        p.lineno(1), p[3], linha_parametros, linha_fim)
 
 def p_parameters(p):
     '''parameters : LPAREN lista_par RPAREN
                   | empty'''
+    # Devolve (grupos de parâmetros, linha do ')'); sem parênteses, ([], 0)
     if len(p) > 2:
-        # Retorna a lista de endereços dos parâmetros
-        enderecos = p[2] if p[2] else []
-        # Após alocar todos os parâmetros, gera ARMZs para desempilhar da pilha
-        # Os parâmetros são desempilhados na MESMA ordem (pois pilha guarda último empilhado no topo)
-        for endereco in enderecos:
-            gerador.adicionar_instrucao("ARMZ", endereco)
-        p[0] = enderecos
+        p[0] = (p[2], p.lineno(3))
     else:
-        p[0] = []
+        p[0] = ([], 0)
 
 def p_lista_par(p):
-    '''lista_par : variaveis COLON tipo_var mais_par'''
-    # Parâmetros de função
-    lista_vars = p[1]
-    tipo = p[3]
-    enderecos_params = []
-    for var_nome in lista_vars:
-        try:
-            endereco = gerador.semantico.adicionar_variavel(var_nome, tipo)
-            gerador.adicionar_instrucao("ALME", 1)
-            # Incrementa contador de variáveis no escopo do procedimento
-            if gerador.variaveis_por_escopo:
-                gerador.variaveis_por_escopo[-1] += 1
-            enderecos_params.append(endereco)
-        except Exception as e:
-            print(f"ERRO SEMÂNTICO (Parâmetros): {e}")
-            sys.exit(1)
-    
-    # Acumula com os parâmetros que vem depois (de mais_par)
-    if p[4]:
-        enderecos_params.extend(p[4])
-    
-    # Retorna TODOS os endereços dos parâmetros
-    p[0] = enderecos_params
-
-def p_mais_par(p):
-    '''mais_par : SEMICOLON lista_par
-                | empty'''
+    '''lista_par : lista_par SEMICOLON grupo_par
+                 | grupo_par'''
+    # Lista dos grupos de parâmetros, na ordem do fonte
     if len(p) > 2:
-        p[0] = p[2]  # Retorna os endereços dos próximos parâmetros
-    else:
-        p[0] = []
+        p[1].append(p[3])
+        p[0] = p[1]
+    else: p[0] = [p[1]]
+
+def p_grupo_par(p):
+    '''grupo_par : variaveis COLON tipo_var'''
+    # Parâmetros de função: a linha do grupo é a do ':'
+    p[0] = DeclaracaoVariaveis(p[1], p[3], p.lineno(2))
 
 def p_corpo_p(p):
     '''corpo_p : dc_loc BEGIN comandos END'''
     # Corpo de um procedimento: declarações locais seguidas de bloco begin-end.
     # Exemplo: var x: integer; begin x := 10; write(x) end
-    pass
+    # A linha do 'end' é a do SAPR e do RTPR no código objeto
+    p[0] = (p[1], p[3], p.lineno(4))
 
 # --- Declarações Locais ---
 # Variáveis declaradas dentro de procedimentos (escopo local)
 
 def p_dc_loc(p):
-    '''dc_loc : dc_v mais_dcloc
+    '''dc_loc : lista_dc_loc
+              | lista_dc_loc SEMICOLON
               | empty'''
     # Declarações locais de variáveis dentro de procedimentos.
-    # Pode ter várias declarações (mais_dcloc) ou nenhuma (empty).
-    pass
+    # Pode ter várias declarações (lista_dc_loc) ou nenhuma (empty).
+    p[0] = p[1] if p[1] is not None else []
 
-def p_mais_dcloc(p):
-    # O SEMICOLON é separador. Se tem, espera mais uma declaração.
-    # Se não tem, empty.
-    '''mais_dcloc : SEMICOLON dc_loc
-                  | empty'''
-    pass
+def p_lista_dc_loc(p):
+    # O SEMICOLON é separador. Se tem, pode vir mais uma declaração.
+    '''lista_dc_loc : lista_dc_loc SEMICOLON dc_v
+                    | dc_v'''
+    if len(p) > 2:
+        p[1].append(p[3])
+        p[0] = p[1]
+    else: p[0] = [p[1]]
 # -----------------------------------------
 
 # --- Regras de Comandos ---
 
 def p_comandos(p):
-    '''comandos : comando mais_comandos'''
-    # Reconhece uma sequência de comandos: um comando seguido de mais comandos.
+    '''comandos : comandos comando
+                | comando'''
+    # Reconhece uma sequência de comandos: os comandos anteriores seguidos de mais um.
     # Exemplo: a := 10; b := 20; write(a)
-    pass
-
-def p_mais_comandos(p):
-    '''mais_comandos : comandos
-                     | empty'''
-    # Permite encadear múltiplos comandos ou finalizar a sequência (empty).
     # Recursivo: permite quantos comandos forem necessários.
-    pass
+    if len(p) > 2:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else: p[0] = [p[1]]
 
 # --- REGRA AUXILIAR PARA PONTO E VÍRGULA OPCIONAL ---
 # Necessária para comandos read/write/assign que podem ou não ter ;
@@ -431,161 +544,47 @@ def p_comando_read(p):
     # Aceita ; opcional no final
     '''comando : READ LPAREN IDENT RPAREN pt_virgula_opc'''
     # Comando READ (Leitura)
-    gerador.adicionar_instrucao("LEIT") # Gera instrução de ler input
-    try:
-        # Validação Semântica: A variável existe?
-        endereco = gerador.semantico.verificar_declaracao(p[3])
-        # Se existe, salvo o valor lido no endereço dela (ARMZ)
-        gerador.adicionar_instrucao("ARMZ", endereco)
-    except Exception as e:
-        print(f"ERRO SEMÂNTICO: {e}")
-        sys.exit(1)
+    p[0] = Leitura(p[3], p.lineno(1))
 
 def p_comando_write(p):
     # Aceita ; opcional no final
     '''comando : WRITE LPAREN IDENT RPAREN pt_virgula_opc'''
     # Comando WRITE (Escrita)
-    try:
-        # Validação Semântica: Busco onde a variável está
-        endereco = gerador.semantico.verificar_declaracao(p[3])
-        # Carrego o valor dela pra pilha (CRVL)
-        gerador.adicionar_instrucao("CRVL", endereco)
-        # Imprimo (IMPR)
-        gerador.adicionar_instrucao("IMPR")
-    except Exception as e:
-        print(f"ERRO SEMÂNTICO: {e}")
-        sys.exit(1)
+    p[0] = Escrita(p[3], p.lineno(1))
 
 def p_comando_assign(p):
     # Aceita ; opcional no final
     '''comando : IDENT ASSIGN expressao pt_virgula_opc'''
     # Comando de Atribuição (Ex: x := 10)
-    try:
-        # Validação Semântica: Variável alvo existe?
-        endereco = gerador.semantico.verificar_declaracao(p[1])
-        
-        # Nota: O valor da 'expressao' já foi calculado e está no topo da pilha
-        # graças à execução prévia da regra 'expressao' (parser ascendente).
-        
-        # Então eu só salvo o topo da pilha na variável (ARMZ)
-        gerador.adicionar_instrucao("ARMZ", endereco)
-    except Exception as e:
-        print(f"ERRO SEMÂNTICO: {e}")
-        sys.exit(1)
+    p[0] = Atribuicao(p[1], p[3], p.lineno(1))
 
 def p_comando_if(p):
     '''comando : IF condicao THEN comandos pfalsa DOLLAR'''
-    # BACKPATCHING DO IF
-    indice_dsvf = p[2]
-    resultado_pfalsa = p[5]
-    
-    destino_final = len(gerador.codigo)
-    
-    if resultado_pfalsa:
-        # Tem ELSE: resultado_pfalsa é uma tupla (indice_dsvi, inicio_else)
-        indice_dsvi, inicio_else = resultado_pfalsa
-        # DSVF pula para o início do ELSE
-        gerador.corrigir_salto(indice_dsvf, inicio_else)
-        # DSVI do fim do THEN pula para o fim
-        gerador.corrigir_salto(indice_dsvi, destino_final)
-    else:
-        # Sem ELSE: DSVF pula direto para o fim
-        gerador.corrigir_salto(indice_dsvf, destino_final)
+    # pfalsa é a lista de comandos do ELSE, ou None quando não tem ELSE
+    p[0] = Se(p[2], p[4], p[5], p.lineno(1))
 
 def p_condicao(p):
     '''condicao : expressao relacao expressao'''
-    # Avalia condições relacionais (ex: a > 10, b <= 5).
-    # As expressões já foram calculadas e estão na pilha.
-    # Gera a instrução de comparação apropriada seguida de desvio condicional (DSVF).
-    op = p[2]  # Operador relacional retornado pela regra 'relacao'
-    if op == '=': gerador.adicionar_instrucao("CPIG")    # Igual
-    elif op == '<>': gerador.adicionar_instrucao("CDIF") # Diferente
-    elif op == '>=': gerador.adicionar_instrucao("CPMA") # Maior ou Igual
-    elif op == '<=': gerador.adicionar_instrucao("CPMI") # Menor ou Igual
-    elif op == '>': gerador.adicionar_instrucao("CMAI")  # Maior
-    elif op == '<': gerador.adicionar_instrucao("CMEN")  # Menor
-    
-    # Gera desvio condicional com endereço placeholder (-1) para backpatching posterior
-    instrucao_salto = gerador.adicionar_instrucao("DSVF", -1)
-    p[0] = instrucao_salto
+    # Condições relacionais (ex: a > 10, b <= 5); p[2] é o operador retornado por 'relacao'
+    p[0] = Condicao(p[2], p[1], p[3])
 
 def p_pfalsa(p):
-    '''pfalsa : marca_else ELSE comandos
+    '''pfalsa : ELSE comandos
               | empty'''
     if len(p) > 2:
-        # Retorna (índice do DSVI, início do ELSE)
-        indice_dsvi = p[1]
-        inicio_else = indice_dsvi + 1
-        p[0] = (indice_dsvi, inicio_else)
+        p[0] = p[2]
     else:
         p[0] = None
 
-def p_marca_else(p):
-    '''marca_else : empty'''
-    # Gera DSVI para o THEN pular o ELSE
-    indice = gerador.adicionar_instrucao("DSVI", -1)
-    p[0] = indice
-
 def p_comando_while(p):
     '''comando : WHILE condicao DO comandos DOLLAR'''
-    # BACKPATCHING DO WHILE
-    # p[2] é o índice do DSVF gerado pela condição
-    indice_dsvf = p[2]
-    
-    # Preciso voltar para o INÍCIO da avaliação da condição,
-    # antes dos CRVLs que carregam os operandos.
-    # A condição gera: CRVL CRVL comparação DSVF
-    # Então o início é 3 instruções antes do DSVF
-    inicio_while = indice_dsvf - 3
-    
-    # Gero um salto incondicional de volta ao início do WHILE
-    gerador.adicionar_instrucao("DSVI", inicio_while)
-    
-    # O destino da saída é a linha atual (fim do loop)
-    destino_saida = len(gerador.codigo)
-    
-    # Corrijo o DSVF para pular para fora do loop se a condição falhar
-    gerador.corrigir_salto(indice_dsvf, destino_saida)
+    p[0] = Enquanto(p[2], p[4], p.lineno(1))
 
 # --- Regras de Suporte (Chamadas de Procedimentos) ---
 def p_comando_chamada(p):
     # Aceita ; opcional no final
     '''comando : IDENT lista_arg pt_virgula_opc'''
-    nome_proc = p[1]
-    argumentos = p[2] if p[2] else []
-    
-    # Verifica se o procedimento foi declarado
-    if nome_proc not in gerador.tabela_procedimentos:
-        print(f"ERRO SEMÂNTICO: Procedimento '{nome_proc}' não foi declarado.")
-        return
-    
-    info_proc = gerador.tabela_procedimentos[nome_proc]
-    endereco_proc = info_proc['endereco']
-    num_params = info_proc['num_params']
-    enderecos_params = info_proc['params']
-    
-    # Verifica se o número de argumentos está correto
-    if len(argumentos) != num_params:
-        print(f"ERRO SEMÂNTICO: Procedimento '{nome_proc}' espera {num_params} argumentos, mas recebeu {len(argumentos)}.")
-        return
-    
-    # Calcula endereço de retorno (linha após CHPR)
-    # PUSHER será na linha atual, depois vêm num_params linhas de PARAM, depois CHPR
-    # Então retorno = linha_atual + 1 (PUSHER) + num_params (PARAMs) + 1 (CHPR) = linha_atual + num_params + 2
-    endereco_retorno = len(gerador.codigo) + num_params + 2
-    
-    # Gera PUSHER com endereço de retorno
-    gerador.adicionar_instrucao("PUSHER", endereco_retorno)
-    
-    # Para cada argumento, gera PARAM com o endereço do argumento
-    # PARAMs são gerados na ordem REVERSA para que o primeiro argumento
-    # fique no topo da pilha (LIFO), permitindo desempilhamento correto com ARMZ
-    for arg_nome in reversed(argumentos):
-        endereco_arg = gerador.semantico.verificar_declaracao(arg_nome)
-        gerador.adicionar_instrucao("PARAM", endereco_arg)
-    
-    # Gera chamada ao procedimento
-    gerador.adicionar_instrucao("CHPR", endereco_proc)
+    p[0] = Chamada(p[1], p[2], p.lineno(1))
 
 def p_lista_arg(p):
     '''lista_arg : LPAREN argumentos RPAREN
@@ -595,26 +594,20 @@ def p_lista_arg(p):
     # Exemplo: soma(a, b) ou teste (sem argumentos)
     if len(p) > 2:
         # Tem parênteses: retorna a lista de nomes dos argumentos
-        p[0] = p[2] if p[2] else []
+        p[0] = p[2]
     else:
         # Não tem parênteses: procedimento sem argumentos
         p[0] = []
 
 def p_argumentos(p):
-    '''argumentos : IDENT mais_ident'''
+    '''argumentos : argumentos COMMA IDENT
+                  | IDENT'''
     # Retorna lista de nomes dos argumentos
-    lista = [p[1]]
-    if p[2]:
-        lista.extend(p[2])
-    p[0] = lista
-
-def p_mais_ident(p):
-    '''mais_ident : COMMA argumentos
-                  | empty'''
     if len(p) > 2:
-        p[0] = p[2]  # Continua a lista
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
-        p[0] = []
+        p[0] = [p[1]]
 
 # --- Regras Matemáticas e Lógicas ---
 def p_relacao(p):
@@ -627,20 +620,27 @@ def p_relacao(p):
     # Mapeio os operadores do código fonte e APENAS RETORNO O SÍMBOLO.
     p[0] = p[1]
 
+# outros_termos e mais_fatores devolvem o resto da expressão como
+# (operador, operando da direita), ou None quando acabou
+
+def encadear(esquerda, resto):
+    """ Junta o operando da esquerda com o resto da expressão (ou devolve ele sozinho) """
+    if resto is None:
+        return esquerda
+    return Binaria(resto[0], esquerda, resto[1])
+
 def p_expressao(p):
     '''expressao : termo outros_termos'''
-    pass
+    p[0] = encadear(p[1], p[2])
 
 def p_outros_termos(p):
     '''outros_termos : op_ad termo outros_termos
                      | empty'''
-    # GERAÇÃO DE CÓDIGO AQUI:
-    # A estrutura é: expressao -> termo (já empilhado) outros_termos
-    # outros_termos -> op (p[1]) termo (p[2] - já empilhado) ...
-    # Assim que p[2] termina, o segundo operando está na pilha
+    # outros_termos -> op (p[1]) termo (p[2]) ...
     if len(p) > 2:
-        if p[1] == '+': gerador.adicionar_instrucao("SOMA")
-        elif p[1] == '-': gerador.adicionar_instrucao("SUBT")
+        p[0] = (p[1], encadear(p[2], p[3]))
+    else:
+        p[0] = None
 
 def p_op_ad(p):
     '''op_ad : PLUS
@@ -653,7 +653,8 @@ def p_termo(p):
     # Define um termo matemático: pode ter sinal negativo opcional, um fator base
     # e operações de multiplicação/divisão encadeadas.
     # Exemplo: -5 * 3 / 2 (op_un=-5, fator=3, mais_fatores=/2)
-    pass
+    # O sinal (op_un) não gera código: a máquina não tem instrução de inversão.
+    p[0] = encadear(p[2], p[3])
 
 def p_op_un(p):
     '''op_un : MINUS
@@ -666,12 +667,11 @@ def p_op_un(p):
 def p_mais_fatores(p):
     '''mais_fatores : op_mul fator mais_fatores
                     | empty'''
-    # GERAÇÃO DE CÓDIGO AQUI:
-    # termo -> fator (já empilhado) mais_fatores
-    # mais_fatores -> op (p[1]) fator (p[2] - já empilhado) ...
+    # mais_fatores -> op (p[1]) fator (p[2]) ...
     if len(p) > 2:
-        if p[1] == '*': gerador.adicionar_instrucao("MULT")
-        elif p[1] == '/': gerador.adicionar_instrucao("DIVI")
+        p[0] = (p[1], encadear(p[2], p[3]))
+    else:
+        p[0] = None
 
 def p_op_mul(p):
     '''op_mul : TIMES
@@ -684,50 +684,174 @@ def p_op_mul(p):
 def p_fator_id(p):
     '''fator : IDENT'''
     # Fator Variável: Se aparece um nome na conta (ex: a + 10)
-    try:
-        # Busco o endereço da variável
-        endereco = gerador.semantico.verificar_declaracao(p[1])
-        # Carrego o valor da memória para o topo da pilha (CRVL)
-        gerador.adicionar_instrucao("CRVL", endereco)
-    except Exception as e:
-        print(f"ERRO SEMÂNTICO: {e}")
-        sys.exit(1)
+    p[0] = Variavel(p[1], p.lineno(1))
 
 def p_fator_num(p):
     '''fator : NUM_INT
              | NUM_REAL'''
     # Fator Numérico: Se aparece um número literal (ex: 10)
-    # Carrego a constante para o topo da pilha (CRCT)
-    gerador.adicionar_instrucao("CRCT", p[1])
+    p[0] = Constante(p[1], p.lineno(1))
 
 def p_fator_grupo(p):
     '''fator : LPAREN expressao RPAREN'''
-    # Expressão entre parênteses: A lógica já foi resolvida recursivamente em 'expressao'
-    pass
+    # Expressão entre parênteses: o nó já foi montado em 'expressao'
+    p[0] = p[2]
 
 def p_empty(p):
     'empty :'
     pass
 
-def p_error(p):
-    # Tratamento de Erro Sintático
+def mensagem_erro_sintatico(p):
+    """ Texto do erro sintático no token p (None: fim do arquivo) """
     if p:
-        print(f"Erro Sintático: Token inesperado '{p.value}' na linha {p.lineno}")
-    else:
-        print("Erro Sintático: Fim de arquivo inesperado")
+        return f"Erro Sintático: Token inesperado '{p.value}' na linha {p.lineno}"
+    return "Erro Sintático: Fim de arquivo inesperado"
+
+def p_error(p):
+    # Tratamento de Erro Sintático. O Compilador troca esta função, na cópia do
+    # parser de cada compilação, por uma que guarda a mensagem (ver
+    # Compilador.analisar); aqui ela só é impressa
+    print(mensagem_erro_sintatico(p))
+
+def obter_parser():
+    """
+    Parser base, montado na primeira chamada. As tabelas LALR são carregadas uma
+    única vez; o Compilador não usa este parser direto: cada compilação trabalha
+    numa cópia dele, que compartilha as tabelas (somente leitura) mas tem as
+    suas próprias pilhas de estados.
+    """
+    global _parser
+    with _trava_construcao:
+        if _parser is None:
+            import ply.yacc as yacc
+            _parser = yacc.yacc(module=sys.modules[__name__], debug=False,
+                                tabmodule='parsetab', outputdir=PASTA_TABELAS)
+    return _parser
+
+
+# ==============================================================================
+# COMPILADOR
+# ==============================================================================
+
+class ErroCompilacao(Exception):
+    """ A compilação falhou; a mensagem traz os erros encontrados, um por linha (nada é impresso) """
+
+
+class Compilador:
+    """
+    Ponto de entrada do compilador: compilar(codigo_fonte) -> ProgramaObjeto.
+    A compilação tem duas passadas, que também podem ser chamadas separadas:
+      - analisar(codigo_fonte) -> árvore sintática (ver arvoreSintatica.py);
+      - gerar(arvore) -> ProgramaObjeto (semântica e código, ver geracaoCodigo.py).
+    Quem quiser transformar a árvore (otimizações, por exemplo) faz isso entre
+    as duas.
+    Cada chamada usa um lexer, um parser e um GeradorCodigo (com o seu
+    AnalisadorSemantico) só dela, então a mesma instância pode ser usada
+    várias vezes e por várias threads ao mesmo tempo.
+    Com lexer_rapido=True, os tokens vêm do lexer escrito à mão (ver
+    lexerRapido.py) em vez do lexer do PLY; os tokens são os mesmos.
+    Com um 'cache' (cacheCompilacao.CacheCompilacao), um fonte já compilado
+    com o mesmo nível não passa por nenhuma das duas passadas.
+    Os erros não são impressos: encerram a compilação com ErroCompilacao, que
+    traz as mensagens. Com verboso=True (o main.py), o fim da análise é
+    anunciado.
+    """
+
+    def __init__(self, nivel=0, lexer_rapido=False, cache=None, verboso=False):
+        self.nivel = nivel # Nível de otimização (ver CodigoObjeto/otimizador.py)
+        self.lexer_rapido = lexer_rapido
+        self.cache = cache
+        self.verboso = verboso
+
+    def compilar(self, codigo_fonte, tokens=None):
+        """
+        Compila o código fonte. Se 'tokens' for um arquivo aberto para escrita,
+        as linhas do tokens.txt são escritas nele durante a própria análise (a
+        mesma passada do lexer que alimenta o parser). Com None, nada é escrito.
+        """
+        if self.cache is not None:
+            return self.compilar_com_cache(codigo_fonte, tokens)
+        return self.gerar(self.analisar(codigo_fonte, tokens))
+
+    def compilar_com_cache(self, codigo_fonte, tokens=None):
+        """
+        Como compilar, passando pelo cache: num acerto, o ProgramaObjeto (e o
+        texto dos tokens, se pedido) sai da entrada; numa falha, o programa é
+        compilado e guardado. Programas com erro não são guardados.
+        """
+        chave = cacheCompilacao.chave_compilacao(codigo_fonte, self.nivel)
+        entrada = self.cache.ler(chave, com_tokens=tokens is not None)
+        if entrada is not None:
+            if tokens is not None:
+                tokens.write(entrada['tokens'])
+            return ProgramaObjeto.das_linhas_anotadas(entrada['linhas'], entrada['relatorio'])
+
+        # Os tokens passam por uma cópia na memória para irem também para o cache
+        copia = io.StringIO() if tokens is not None else None
+        try:
+            programa = self.gerar(self.analisar(codigo_fonte, copia))
+        finally:
+            if tokens is not None:
+                tokens.write(copia.getvalue())
+        self.cache.gravar(chave, programa.linhas_anotadas(), programa.relatorio,
+                          copia.getvalue() if copia is not None else None)
+        return programa
+
+    def analisar(self, codigo_fonte, tokens=None):
+        """ Análise léxica e sintática: devolve a árvore (arvoreSintatica.Programa) """
+        meu_lexer = (obter_lexer_rapido() if self.lexer_rapido else obter_lexer()).clone()
+        meu_lexer.lineno = 1 # As linhas do mapa do fonte começam em 1
+        meu_lexer.erros_lexicos = [] # O clone do PLY compartilharia a lista do lexer base
+        meu_lexer.input(codigo_fonte)
+        meu_parser = copy.copy(obter_parser())
+        # Os erros sintáticos ficam guardados na cópia do parser, como os léxicos no lexer
+        erros_sintaticos = meu_parser.erros_sintaticos = []
+        meu_parser.errorfunc = lambda p: erros_sintaticos.append(mensagem_erro_sintatico(p))
+        # O fonte já está no lexer (o lexer rápido troca o seu token() no input)
+        arvore = meu_parser.parse(lexer=meu_lexer,
+                                  tokenfunc=tokens_com_copia(meu_lexer, tokens) if tokens else None)
+
+        # O lexer pula os caracteres ilegais: o parser pode ter chegado ao fim
+        # de um programa que, sem eles, é válido. Se não chegou no programa
+        # inteiro, a compilação também falhou
+        erros = [f"Erro Léxico: {mensagem}" for mensagem in meu_lexer.erros_lexicos]
+        erros += erros_sintaticos
+        if erros or not isinstance(arvore, Programa):
+            raise ErroCompilacao("\n".join(erros) or "Erro Sintático: programa incompleto")
+        return arvore
+
+    def gerar(self, arvore):
+        """
+        Análise semântica e geração do código objeto da árvore; devolve o
+        ProgramaObjeto. Com otimização, a árvore é otimizada antes (e alterada
+        no lugar, ver otimizadorArvore.py) e o código objeto depois.
+        """
+        if self.nivel > 0:
+            import otimizadorArvore
+            contagem_arvore = otimizadorArvore.otimizar(arvore)
+
+        gerador = GeradorCodigo()
+        gerador.adicionar_instrucao("INPP")
+        try:
+            geracaoCodigo.EmissorCodigo(gerador, self.verboso).emitir(arvore)
+        except geracaoCodigo.ErroSemantico as e:
+            # O primeiro erro semântico encerra a geração
+            raise ErroCompilacao(str(e))
+
+        relatorio = None
+        if self.nivel > 0:
+            relatorio = gerador.otimizar(self.nivel)
+            relatorio['arvore'] = contagem_arvore
+        return gerador.programa_objeto(relatorio)
 
-# Inicializo o Parser
-parser = yacc.yacc()
 
 if __name__ == '__main__':
     try:
         with open(os.path.join(PASTA_DADOS, 'codigo.txt'), 'r') as f:
             code = f.read()
-        gerar_arquivo_tokens_formatado(code)
-        gerador.adicionar_instrucao("INPP")
-        parser.parse(code, lexer=lexer)
-        with open(ARQUIVO_CODIGO_OBJETO, 'w') as f:
-            for l in gerador.codigo: f.write(l+'\n')
+        with open(ARQUIVO_TOKENS, 'w') as f:
+            programa = Compilador(verboso=True).compilar(code, tokens=f)
+        programa.salvar(ARQUIVO_CODIGO_OBJETO)
         print("Execução direta concluída.")
     except Exception as e:
         print(e)
\ No newline at end of file
@@ -0,0 +1,171 @@
+# ==============================================================================
+# ÁRVORE SINTÁTICA (REPRESENTAÇÃO INTERMEDIÁRIA)
+# ==============================================================================
+# As regras p_ do parser não emitem mais instruções da máquina: cada uma monta
+# um nó desta árvore. A geração do código objeto é uma passada separada, que
+# percorre a árvore já pronta (ver geracaoCodigo.py). Entre as duas, passos de
+# otimização podem ler e reescrever a árvore sem mexer nas regras da gramática.
+#
+# Os nós usam __slots__ (sem um __dict__ por nó), porque um programa grande
+# tem um nó por comando e por operando. Cada nó guarda as linhas do fonte de
+# que a geração de código precisa para o mapa do fonte (ver mapaFonte.py).
+#
+# Formato da árvore:
+#   Programa       nome, declaracoes, comandos, linha_fim
+#   declarações:   DeclaracaoVariaveis, Procedimento
+#   comandos:      Leitura, Escrita, Atribuicao, Se, Enquanto, Chamada
+#   expressões:    Binaria, Variavel, Constante (e Condicao nos if/while)
+# As listas (declarações, comandos, parâmetros) são listas do Python, na ordem
+# do fonte. As expressões seguem a gramática: 'a - b - c' é lida como
+# Binaria('-', a, Binaria('-', b, c)), pois outros_termos e mais_fatores são
+# recursivas à direita.
+
+
+class No:
+    """ Base dos nós: só dá um repr legível a partir dos __slots__ """
+    __slots__ = ()
+
+    def __repr__(self):
+        campos = ', '.join(f"{nome}={getattr(self, nome)!r}" for nome in self.__slots__)
+        return f"{type(self).__name__}({campos})"
+
+
+# --- Programa e Declarações ---
+
+class Programa(No):
+    """ program nome; declarações (variáveis e procedimentos, na ordem); begin comandos end. """
+    __slots__ = ('nome', 'declaracoes', 'comandos', 'linha_fim')
+
+    def __init__(self, nome, declaracoes, comandos, linha_fim):
+        self.nome = nome
+        self.declaracoes = declaracoes
+        self.comandos = comandos
+        self.linha_fim = linha_fim # Linha do '.' final (onde fica o PARA)
+
+
+class DeclaracaoVariaveis(No):
+    """ var a, b: integer (também usada para cada grupo de parâmetros) """
+    __slots__ = ('nomes', 'tipo', 'linha')
+
+    def __init__(self, nomes, tipo, linha):
+        self.nomes = nomes
+        self.tipo = tipo
+        self.linha = linha # Linha do 'var' (ou do ':' de um grupo de parâmetros)
+
+
+class Procedimento(No):
+    """ procedure nome (parâmetros) declarações locais begin comandos end """
+    __slots__ = ('nome', 'parametros', 'declaracoes', 'comandos',
+                 'linha', 'linha_escopo', 'linha_parametros', 'linha_fim')
+
+    def __init__(self, nome, parametros, declaracoes, comandos,
+                 linha, linha_escopo, linha_parametros, linha_fim):
+        self.nome = nome
+        self.parametros = parametros     # [DeclaracaoVariaveis], um por grupo
+        self.declaracoes = declaracoes   # [DeclaracaoVariaveis] locais
+        self.comandos = comandos
+        self.linha = linha                       # Linha do 'procedure'
+        self.linha_escopo = linha_escopo         # Linha logo após o nome (DSVI que pula o corpo)
+        self.linha_parametros = linha_parametros # Linha do ')' (0 = sem parâmetros)
+        self.linha_fim = linha_fim               # Linha do 'end'
+
+
+# --- Comandos ---
+
+class Leitura(No):
+    """ read(nome) """
+    __slots__ = ('nome', 'linha')
+
+    def __init__(self, nome, linha):
+        self.nome = nome
+        self.linha = linha
+
+
+class Escrita(No):
+    """ write(nome) """
+    __slots__ = ('nome', 'linha')
+
+    def __init__(self, nome, linha):
+        self.nome = nome
+        self.linha = linha
+
+
+class Atribuicao(No):
+    """ nome := expressao """
+    __slots__ = ('nome', 'expressao', 'linha')
+
+    def __init__(self, nome, expressao, linha):
+        self.nome = nome
+        self.expressao = expressao
+        self.linha = linha
+
+
+class Se(No):
+    """ if condicao then comandos [else comandos] $ (senao = None sem else) """
+    __slots__ = ('condicao', 'entao', 'senao', 'linha')
+
+    def __init__(self, condicao, entao, senao, linha):
+        self.condicao = condicao
+        self.entao = entao
+        self.senao = senao
+        self.linha = linha
+
+
+class Enquanto(No):
+    """ while condicao do comandos $ """
+    __slots__ = ('condicao', 'corpo', 'linha')
+
+    def __init__(self, condicao, corpo, linha):
+        self.condicao = condicao
+        self.corpo = corpo
+        self.linha = linha
+
+
+class Chamada(No):
+    """ nome(argumentos), ou só nome """
+    __slots__ = ('nome', 'argumentos', 'linha')
+
+    def __init__(self, nome, argumentos, linha):
+        self.nome = nome
+        self.argumentos = argumentos # Nomes das variáveis passadas
+        self.linha = linha
+
+
+# --- Expressões ---
+
+class Condicao(No):
+    """ expressao relacao expressao (operador: '=', '<>', '<', '<=', '>', '>=') """
+    __slots__ = ('operador', 'esquerda', 'direita')
+
+    def __init__(self, operador, esquerda, direita):
+        self.operador = operador
+        self.esquerda = esquerda
+        self.direita = direita
+
+
+class Binaria(No):
+    """ esquerda operador direita (operador: '+', '-', '*', '/') """
+    __slots__ = ('operador', 'esquerda', 'direita')
+
+    def __init__(self, operador, esquerda, direita):
+        self.operador = operador
+        self.esquerda = esquerda
+        self.direita = direita
+
+
+class Variavel(No):
+    """ Uso de uma variável numa expressão """
+    __slots__ = ('nome', 'linha')
+
+    def __init__(self, nome, linha):
+        self.nome = nome
+        self.linha = linha
+
+
+class Constante(No):
+    """ Número literal (int ou float) """
+    __slots__ = ('valor', 'linha')
+
+    def __init__(self, valor, linha):
+        self.valor = valor
+        self.linha = linha
@@ -0,0 +1,259 @@
+import os
+import json
+import struct
+import hashlib
+import threading
+
+try:
+    import fcntl # Trava do arquivo de estatísticas (não existe no Windows)
+except ImportError:
+    fcntl = None
+
+# ==============================================================================
+# CACHE DA COMPILAÇÃO (CÓDIGO OBJETO ENDEREÇADO PELO CONTEÚDO)
+# ==============================================================================
+# O mesmo programa LALG é compilado muitas vezes (cada "python main.py" compila
+# o Dados/codigo.txt do zero). O cache guarda o resultado de cada compilação
+# num arquivo cujo nome é o hash do que determina esse resultado:
+#   sha256(versão do compilador, nível de otimização, texto do fonte)
+# Num acerto, o Compilador (ver analisadorSintatico.py) monta o ProgramaObjeto
+# direto do arquivo, sem análise léxica, sintática, semântica nem geração.
+# O lexer escolhido não entra na chave: os dois geram os mesmos tokens.
+#
+# Cada entrada é um JSON com:
+#   - 'linhas': o código objeto com o layout de dados e o mapa do fonte
+#     comentados na primeira linha (o mesmo texto do codigo_objeto.txt);
+#   - 'relatorio': o relatório do otimizador (None em -O0);
+#   - 'tokens': o texto do tokens.txt, se a compilação gravou os tokens (um
+#     acerto que precisa dos tokens e não os tem conta como falha).
+#
+# Tamanho: quando o total das entradas passa de 'tamanho_maximo', as usadas
+# há mais tempo são apagadas (LRU). Cada acerto atualiza a data de modificação
+# do arquivo, que serve de "último uso".
+#
+# Vários processos ao mesmo tempo:
+#   - a gravação é feita num arquivo temporário e trocada com os.replace
+#     (atômico): ninguém lê uma entrada pela metade;
+#   - uma entrada ilegível, de outra versão ou apagada por outro processo no
+#     meio da leitura é só uma falha (o programa é compilado de novo);
+#   - na limpeza, um arquivo que outro processo já apagou é ignorado;
+#   - uma gravação que falha (pasta sem permissão, disco cheio, caminho
+#     inválido) só deixa de guardar a entrada: a compilação já deu certo.
+#
+# Acertos e falhas: além dos contadores do próprio objeto, o arquivo
+# 'estatisticas' da pasta guarda os totais de todas as execuções em dois
+# inteiros de 64 bits (16 bytes, sempre). Cada consulta lê, soma e regrava os
+# dois com o arquivo travado (fcntl.lockf), então vários processos não perdem
+# contagens; sem fcntl (Windows), duas consultas ao mesmo tempo podem perder
+# uma contagem, mas o arquivo nunca cresce.
+#
+# Versão do compilador: o hash do código dos módulos que decidem o código
+# gerado (MODULOS_COMPILADOR), calculado uma vez por processo. Qualquer
+# mudança num deles invalida as entradas antigas, sem número para aumentar.
+
+TAMANHO_MAXIMO = 64 * 1024 * 1024 # Bytes
+EXTENSAO = '.json'
+ARQUIVO_ESTATISTICAS = 'estatisticas'
+ACERTO, FALHA = 0, 1 # Posição de cada contador no arquivo de estatísticas
+CONTADORES = struct.Struct('<qq') # (acertos, falhas)
+
+_PASTA = os.path.dirname(os.path.abspath(__file__))
+_RAIZ = os.path.dirname(_PASTA)
+
+# Tudo o que entra no texto guardado numa entrada: tokens, árvore, semântica,
+# geração, otimizações, layout de dados, mapa do fonte e o formato da entrada
+MODULOS_COMPILADOR = (
+    os.path.join(_PASTA, 'analisadorSintatico.py'),
+    os.path.join(_PASTA, 'lexerRapido.py'),
+    os.path.join(_PASTA, 'arvoreSintatica.py'),
+    os.path.join(_PASTA, 'geracaoCodigo.py'),
+    os.path.join(_PASTA, 'otimizadorArvore.py'),
+    os.path.join(_PASTA, 'cacheCompilacao.py'),
+    os.path.join(_RAIZ, 'AnalisadorSemantico', 'analisadorSemantico.py'),
+    os.path.join(_RAIZ, 'CodigoObjeto', 'instrucoes.py'),
+    os.path.join(_RAIZ, 'CodigoObjeto', 'otimizador.py'),
+    os.path.join(_RAIZ, 'CodigoObjeto', 'memoriaTipada.py'),
+    os.path.join(_RAIZ, 'CodigoObjeto', 'mapaFonte.py'),
+)
+
+_versao = None
+
+
+def versao_compilador():
+    """ Hash do código dos MODULOS_COMPILADOR (calculado na primeira chamada do processo) """
+    global _versao
+    if _versao is None:
+        resumo = hashlib.sha256()
+        for caminho in MODULOS_COMPILADOR:
+            resumo.update(os.path.basename(caminho).encode('utf-8') + b'\0')
+            try:
+                with open(caminho, 'rb') as f:
+                    resumo.update(f.read())
+            except OSError:
+                pass # Módulo ausente: o nome já entrou no hash
+            resumo.update(b'\0')
+        _versao = resumo.hexdigest()
+    return _versao
+
+
+def chave_compilacao(codigo_fonte, nivel=0):
+    """ Hash do fonte, da versão do compilador e do nível: nome da entrada no cache """
+    conteudo = repr((versao_compilador(), nivel, codigo_fonte)).encode('utf-8')
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+class CacheCompilacao:
+    """ Pasta de entradas do cache (ver o topo do arquivo) """
+
+    def __init__(self, pasta, tamanho_maximo=TAMANHO_MAXIMO):
+        self.pasta = pasta
+        self.tamanho_maximo = tamanho_maximo
+        # Consultas feitas por este objeto (as de todos os processos ficam no arquivo)
+        self.acertos = 0
+        self.falhas = 0
+        self.gravadas = 0 # Entradas que este objeto conseguiu gravar
+
+    def caminho(self, chave):
+        return os.path.join(self.pasta, chave + EXTENSAO)
+
+    def ler(self, chave, com_tokens=False):
+        """
+        Entrada da chave (dict com 'linhas', 'relatorio' e 'tokens') ou None.
+        Com com_tokens=True, uma entrada gravada sem os tokens não serve.
+        """
+        caminho = self.caminho(chave)
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                entrada = json.load(f)
+        except (OSError, ValueError):
+            entrada = None # Não existe, foi apagada agora ou está corrompida
+
+        if (not isinstance(entrada, dict) or entrada.get('versao') != versao_compilador()
+                or entrada.get('chave') != chave or (com_tokens and entrada.get('tokens') is None)):
+            self.registrar(FALHA)
+            return None
+
+        try:
+            os.utime(caminho) # Último uso, para a limpeza LRU
+        except OSError:
+            pass
+        self.registrar(ACERTO)
+        return entrada
+
+    def gravar(self, chave, linhas, relatorio=None, tokens=None):
+        """
+        Guarda o resultado de uma compilação e apaga as entradas antigas se
+        passar do tamanho. Devolve False se não conseguiu gravar (o cache
+        continua funcionando, só sem essa entrada).
+        """
+        entrada = {'versao': versao_compilador(), 'chave': chave, 'linhas': list(linhas),
+                   'relatorio': relatorio, 'tokens': tokens}
+        caminho = self.caminho(chave)
+        temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(entrada, f, ensure_ascii=False)
+            os.replace(temporario, caminho) # Troca atômica: ninguém lê um arquivo pela metade
+        except OSError:
+            try:
+                os.remove(temporario) # O que ficou de uma gravação pela metade
+            except OSError:
+                pass
+            return False
+        self.gravadas += 1
+        self.limpar()
+        return True
+
+    def limpar(self):
+        """ Apaga as entradas usadas há mais tempo até o total caber no limite; devolve quantas """
+        entradas = []
+        try:
+            with os.scandir(self.pasta) as arquivos:
+                for arquivo in arquivos:
+                    if not arquivo.name.endswith(EXTENSAO):
+                        continue
+                    try:
+                        info = arquivo.stat()
+                    except OSError:
+                        continue # Apagado por outro processo
+                    entradas.append((info.st_mtime, info.st_size, arquivo.path))
+        except OSError:
+            return 0
+
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        removidas = 0
+        for _, tamanho, caminho in sorted(entradas):
+            if total <= self.tamanho_maximo:
+                break
+            try:
+                os.remove(caminho)
+                removidas += 1
+            except OSError:
+                pass # Outro processo já apagou (ou ainda está lendo, no Windows)
+            total -= tamanho
+        return removidas
+
+    def tamanho(self):
+        """ (número de entradas, bytes) da pasta """
+        quantidade = total = 0
+        try:
+            with os.scandir(self.pasta) as arquivos:
+                for arquivo in arquivos:
+                    if arquivo.name.endswith(EXTENSAO):
+                        try:
+                            total += arquivo.stat().st_size
+                            quantidade += 1
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+        return quantidade, total
+
+    def registrar(self, marca):
+        """ Conta a consulta (ACERTO ou FALHA) no objeto e no arquivo de estatísticas """
+        if marca == ACERTO:
+            self.acertos += 1
+        else:
+            self.falhas += 1
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+            arquivo = os.open(os.path.join(self.pasta, ARQUIVO_ESTATISTICAS), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.lockf(arquivo, fcntl.LOCK_EX) # Liberada ao fechar
+                contadores = list(ler_contadores(os.read(arquivo, CONTADORES.size)))
+                contadores[marca] += 1
+                os.lseek(arquivo, 0, os.SEEK_SET)
+                os.write(arquivo, CONTADORES.pack(*contadores))
+                os.ftruncate(arquivo, CONTADORES.size) # Um arquivo de outro formato vira o de 16 bytes
+            finally:
+                os.close(arquivo)
+        except OSError:
+            pass # Sem estatística, o cache continua funcionando
+
+    def estatisticas(self):
+        """ (acertos, falhas) de todas as consultas já feitas nesta pasta """
+        try:
+            with open(os.path.join(self.pasta, ARQUIVO_ESTATISTICAS), 'rb') as f:
+                if fcntl is not None:
+                    fcntl.lockf(f, fcntl.LOCK_SH)
+                return ler_contadores(f.read(CONTADORES.size))
+        except OSError:
+            return 0, 0
+
+
+def ler_contadores(dados):
+    """ (acertos, falhas) dos bytes do arquivo de estatísticas; zerados se ele não tiver o formato """
+    if len(dados) != CONTADORES.size:
+        return 0, 0
+    return CONTADORES.unpack(dados)
+
+
+def formatar_taxas(acertos, falhas):
+    """ Texto curto com as taxas de acerto e de falha (usado pelo main.py) """
+    consultas = acertos + falhas
+    if not consultas:
+        return "nenhuma consulta"
+    return (f"{acertos} acertos e {falhas} falhas em {consultas} consultas "
+            f"({100 * acertos / consultas:.1f}% de acertos, {100 * falhas / consultas:.1f}% de falhas)")
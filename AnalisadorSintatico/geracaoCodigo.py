@@ -0,0 +1,275 @@
+from arvoreSintatica import *
+
+# ==============================================================================
+# GERAÇÃO DE CÓDIGO A PARTIR DA ÁRVORE SINTÁTICA
+# ==============================================================================
+# Passada de back end: percorre a árvore montada pelo parser (ver
+# arvoreSintatica.py) e emite, num GeradorCodigo, o código objeto da máquina
+# hipotética. A análise semântica (declarações, escopos e endereços) também é
+# feita aqui, na ordem do fonte, com o AnalisadorSemantico do gerador.
+#
+# A árvore é percorrida em pós-ordem, que é a ordem em que as regras do parser
+# ascendente emitiam as instruções: o código gerado e as linhas do mapa do
+# fonte são os mesmos de quando o parser emitia direto. A diferença é que cada
+# comando agora é visto inteiro: o 'while' sabe onde começa a sua condição,
+# em vez de supor que ela tem sempre 3 instruções antes do DSVF.
+
+# Instrução de cada operador
+OPERACOES = {'+': "SOMA", '-': "SUBT", '*': "MULT", '/': "DIVI"}
+COMPARACOES = {'=': "CPIG", '<>': "CDIF", '>=': "CPMA", '<=': "CPMI", '>': "CMAI", '<': "CMEN"}
+
+
+class ErroSemantico(Exception):
+    """ Erro semântico que interrompe a geração (a mensagem é o texto do erro) """
+
+
+class EmissorCodigo:
+    """
+    Gera o código objeto de uma árvore (arvoreSintatica.Programa) no gerador.
+    O primeiro erro semântico encerra a geração com ErroSemantico, sem imprimir
+    nada (o Compilador transforma isso em ErroCompilacao). Com verboso=True, o fim da
+    análise também é anunciado.
+    """
+
+    def __init__(self, gerador, verboso=False):
+        self.gerador = gerador
+        self.verboso = verboso
+        self.semantico = gerador.semantico
+        self._comandos = {
+            Leitura: self.emitir_leitura,
+            Escrita: self.emitir_escrita,
+            Atribuicao: self.emitir_atribuicao,
+            Se: self.emitir_se,
+            Enquanto: self.emitir_enquanto,
+            Chamada: self.emitir_chamada,
+        }
+
+    def emitir(self, programa):
+        """ Emite o programa inteiro (o INPP já deve estar no gerador) """
+        gerador = self.gerador
+        for declaracao in programa.declaracoes:
+            if isinstance(declaracao, Procedimento):
+                self.emitir_procedimento(declaracao)
+            else:
+                self.emitir_variaveis(declaracao)
+        self.emitir_comandos(programa.comandos)
+        gerador.marcar_linha(programa.linha_fim)
+        gerador.adicionar_instrucao("PARA") # Gero a instrução de parada da máquina.
+        if self.verboso:
+            print("Análise Sintática e Semântica concluída com sucesso!")
+
+    # --- Declarações ---
+
+    def emitir_variaveis(self, declaracao, alocar=True):
+        """
+        var a, b: integer -> registra no semântico e aloca (ALME 1) cada uma.
+        As locais de um procedimento (alocar=False) ficam no quadro de ativação.
+        """
+        gerador = self.gerador
+        gerador.marcar_linha(declaracao.linha)
+        for var_nome in declaracao.nomes:
+            try:
+                # Passo 1: Registro no Semântico. Se duplicar, ele dá erro.
+                self.semantico.adicionar_variavel(var_nome, declaracao.tipo)
+                # Passo 2: Se ok, aloco espaço na memória
+                if alocar:
+                    gerador.adicionar_instrucao("ALME", 1)
+            except Exception as e:
+                raise ErroSemantico(f"ERRO SEMÂNTICO na linha {declaracao.linha}: {e}") # Interrompo a compilação
+
+    def emitir_parametros(self, grupo):
+        """ Declara um grupo de parâmetros (no quadro de ativação); devolve os endereços """
+        gerador = self.gerador
+        enderecos_params = []
+        gerador.marcar_linha(grupo.linha)
+        for var_nome in grupo.nomes:
+            try:
+                endereco = self.semantico.adicionar_variavel(var_nome, grupo.tipo)
+                enderecos_params.append(endereco)
+            except Exception as e:
+                raise ErroSemantico(f"ERRO SEMÂNTICO (Parâmetros): {e}")
+        return enderecos_params
+
+    def emitir_procedimento(self, procedimento):
+        gerador = self.gerador
+        # Abre o escopo e gera o pulo para não executar a declaração do procedure
+        self.semantico.entrar_escopo()
+        gerador.marcar_linha(procedimento.linha_escopo)
+        indice_pulo = gerador.adicionar_instrucao("DSVI", -1)
+        # Marca onde o procedimento começa (após o DSVI)
+        endereco_inicio = len(gerador.codigo)
+
+        # Quadro de ativação: os parâmetros e as locais recebem endereços
+        # seguidos, a partir do próximo endereço livre. O tamanho já se sabe
+        # aqui, e uma instrução só guarda e zera o quadro inteiro na entrada
+        # (ENPR) e devolve os valores guardados na saída (SAPR). Com o ALME e
+        # o DESM de antes, uma local lida antes de receber um valor podia ter
+        # o da chamada anterior (sempre na memória tipada; na memória em lista
+        # quando havia globais declaradas depois do procedimento)
+        quadro = (self.semantico.contador_memoria,
+                  sum(len(grupo.nomes) for grupo in procedimento.parametros + procedimento.declaracoes))
+        if quadro[1]:
+            gerador.adicionar_instrucao("ENPR", f"{quadro[0]} {quadro[1]}")
+
+        # Os grupos de parâmetros são declarados do último para o primeiro;
+        # a lista de endereços fica na ordem do fonte
+        enderecos_grupos = [self.emitir_parametros(grupo) for grupo in reversed(procedimento.parametros)]
+        enderecos_params = [endereco for grupo in reversed(enderecos_grupos) for endereco in grupo]
+        gerador.marcar_linha(procedimento.linha_parametros)
+        # Após alocar todos os parâmetros, gera ARMZs para desempilhar da pilha
+        # Os parâmetros são desempilhados na MESMA ordem (pois pilha guarda último empilhado no topo)
+        for endereco in enderecos_params:
+            gerador.adicionar_instrucao("ARMZ", endereco)
+
+        # Já fica visível para as chamadas do próprio corpo (recursão): cada
+        # ativação tem o seu quadro
+        gerador.tabela_procedimentos[procedimento.nome] = {
+            'endereco': endereco_inicio,
+            'num_params': len(enderecos_params),
+            'params': enderecos_params,
+            'quadro': quadro
+        }
+
+        for declaracao in procedimento.declaracoes:
+            self.emitir_variaveis(declaracao, alocar=False)
+        self.emitir_comandos(procedimento.comandos)
+
+        # O SAPR e o RTPR ficam na linha do 'end'
+        gerador.marcar_linha(procedimento.linha_fim)
+        if quadro[1]:
+            gerador.adicionar_instrucao("SAPR", f"{quadro[0]} {quadro[1]}")
+        self.semantico.sair_escopo()
+        gerador.adicionar_instrucao("RTPR")
+
+        # O procedimento vai da linha do 'procedure' até a linha do seu 'end'
+        gerador.procedimentos_fonte.append((procedimento.nome, procedimento.linha, gerador.linha_atual))
+        # Corrige o salto para pular todo o corpo do procedimento
+        gerador.corrigir_salto(indice_pulo, len(gerador.codigo))
+
+    # --- Comandos ---
+
+    def emitir_comandos(self, comandos):
+        despacho = self._comandos
+        for comando in comandos:
+            despacho[type(comando)](comando)
+
+    def endereco(self, nome):
+        """ Endereço da variável; erro semântico se ela não foi declarada """
+        try:
+            return self.semantico.verificar_declaracao(nome)
+        except Exception as e:
+            raise ErroSemantico(f"ERRO SEMÂNTICO: {e}")
+
+    def erro(self, mensagem):
+        """ Interrompe a geração com o erro semântico """
+        raise ErroSemantico(f"ERRO SEMÂNTICO: {mensagem}")
+
+    def emitir_leitura(self, comando):
+        gerador = self.gerador
+        gerador.marcar_linha(comando.linha)
+        gerador.adicionar_instrucao("LEIT") # Gera instrução de ler input
+        # Salvo o valor lido no endereço da variável (ARMZ)
+        gerador.adicionar_instrucao("ARMZ", self.endereco(comando.nome))
+
+    def emitir_escrita(self, comando):
+        gerador = self.gerador
+        gerador.marcar_linha(comando.linha)
+        # Carrego o valor da variável pra pilha (CRVL) e imprimo (IMPR)
+        gerador.adicionar_instrucao("CRVL", self.endereco(comando.nome))
+        gerador.adicionar_instrucao("IMPR")
+
+    def emitir_atribuicao(self, comando):
+        gerador = self.gerador
+        # O valor da expressão fica no topo da pilha; depois é só salvar (ARMZ)
+        self.emitir_expressao(comando.expressao)
+        gerador.marcar_linha(comando.linha)
+        gerador.adicionar_instrucao("ARMZ", self.endereco(comando.nome))
+
+    def emitir_se(self, comando):
+        gerador = self.gerador
+        # BACKPATCHING DO IF
+        indice_dsvf = self.emitir_condicao(comando.condicao)
+        self.emitir_comandos(comando.entao)
+        if comando.senao is not None:
+            # DSVI para o THEN pular o ELSE; o DSVF pula para o início do ELSE
+            indice_dsvi = gerador.adicionar_instrucao("DSVI", -1)
+            gerador.corrigir_salto(indice_dsvf, indice_dsvi + 1)
+            self.emitir_comandos(comando.senao)
+            gerador.corrigir_salto(indice_dsvi, len(gerador.codigo))
+        else:
+            # Sem ELSE: DSVF pula direto para o fim
+            gerador.corrigir_salto(indice_dsvf, len(gerador.codigo))
+
+    def emitir_enquanto(self, comando):
+        gerador = self.gerador
+        # BACKPATCHING DO WHILE: o salto de volta vai para o início da condição
+        inicio_while = len(gerador.codigo)
+        indice_dsvf = self.emitir_condicao(comando.condicao)
+        self.emitir_comandos(comando.corpo)
+        gerador.marcar_linha(comando.linha)
+        gerador.adicionar_instrucao("DSVI", inicio_while)
+        # O DSVF pula para fora do loop se a condição falhar
+        gerador.corrigir_salto(indice_dsvf, len(gerador.codigo))
+
+    def emitir_chamada(self, comando):
+        gerador = self.gerador
+        nome_proc = comando.nome
+        argumentos = comando.argumentos
+        gerador.marcar_linha(comando.linha)
+
+        # Verifica se o procedimento foi declarado
+        if nome_proc not in gerador.tabela_procedimentos:
+            self.erro(f"Procedimento '{nome_proc}' não foi declarado.")
+
+        info_proc = gerador.tabela_procedimentos[nome_proc]
+        num_params = info_proc['num_params']
+
+        # Verifica se o número de argumentos está correto
+        if len(argumentos) != num_params:
+            self.erro(f"Procedimento '{nome_proc}' espera {num_params} argumentos, mas recebeu {len(argumentos)}.")
+
+        # Retorno = PUSHER + num_params PARAMs + CHPR depois da instrução atual
+        endereco_retorno = len(gerador.codigo) + num_params + 2
+        gerador.adicionar_instrucao("PUSHER", endereco_retorno)
+
+        # PARAMs na ordem REVERSA, para que o primeiro argumento fique no topo
+        # da pilha (LIFO), permitindo desempilhamento correto com ARMZ
+        for arg_nome in reversed(argumentos):
+            gerador.adicionar_instrucao("PARAM", self.endereco(arg_nome))
+
+        gerador.adicionar_instrucao("CHPR", info_proc['endereco'])
+
+    # --- Expressões ---
+
+    def emitir_condicao(self, condicao):
+        """ Expressões, comparação e DSVF com destino a corrigir; devolve o índice do DSVF """
+        self.emitir_expressao(condicao.esquerda)
+        self.emitir_expressao(condicao.direita)
+        self.gerador.adicionar_instrucao(COMPARACOES[condicao.operador])
+        return self.gerador.adicionar_instrucao("DSVF", -1)
+
+    def emitir_expressao(self, expressao):
+        """
+        Pós-ordem da expressão: operandos primeiro, operador depois. Usa uma
+        pilha própria em vez de recursão, para expressões longas (a + b + ...)
+        não esbarrarem no limite de recursão do Python. As instruções são as
+        genéricas (SOMA, CMEN...) para qualquer tipo: versões separadas por
+        tipo não ficaram mais rápidas (ver "Operações Tipadas" no README).
+        """
+        gerador = self.gerador
+        pendentes = [expressao]
+        while pendentes:
+            no = pendentes.pop()
+            tipo = type(no)
+            if tipo is Binaria:
+                pendentes.append(OPERACOES[no.operador])
+                pendentes.append(no.direita)
+                pendentes.append(no.esquerda)
+            elif tipo is str:
+                gerador.adicionar_instrucao(no) # Operador, depois dos dois operandos
+            elif tipo is Variavel:
+                gerador.marcar_linha(no.linha)
+                gerador.adicionar_instrucao("CRVL", self.endereco(no.nome))
+            else:
+                gerador.marcar_linha(no.linha)
+                gerador.adicionar_instrucao("CRCT", no.valor)
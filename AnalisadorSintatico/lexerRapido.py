@@ -0,0 +1,145 @@
+import re
+import sys
+import functools
+
+# ==============================================================================
+# LEXER RÁPIDO (ALTERNATIVA AO PLY LEX)
+# ==============================================================================
+# O lexer do PLY casa a expressão mestra a cada token, confere o t_ignore
+# caractere por caractere e chama uma função Python por token (t_IDENT,
+# t_NUM_INT, t_newline...). Em fontes LALG grandes, gerados por programa, a
+# análise léxica passa a dominar o tempo de compilação.
+#
+# Este lexer produz exatamente os mesmos tokens (tipo, valor, linha e posição)
+# que as regras t_ do analisadorSintatico.py, mas:
+#   - monta uma única expressão mestra, com um grupo nomeado por regra e um
+#     para o caractere ilegal, e os caracteres do t_ignore antes de cada token
+#     entram no mesmo casamento; assim o finditer cobre o fonte inteiro numa
+#     passada só;
+#   - trata as ações das regras (conversão dos números, palavras reservadas,
+#     contagem de linhas, comentários) direto no laço, sem chamar funções.
+#
+# A expressão mestra é montada a partir das próprias regras t_, na mesma ordem
+# de prioridade do PLY (funções na ordem em que foram definidas, depois as
+# strings da maior para a menor), então os dois lexers não saem de sincronia.
+# As ações, porém, são escritas aqui: uma regra t_ com função nova precisa ser
+# ensinada a este lexer (senão ele recusa as regras na construção).
+#
+# Ele tem a interface que o parser do PLY usa (input, token e lineno), então
+# pode ser passado direto em parser.parse(lexer=...).
+
+# Regras em função que este lexer sabe tratar (as ações estão em _gerar_tokens)
+REGRAS_COM_ACAO = {
+    'COMMENT',   # Comentário: nada a emitir
+    'newline',   # Só conta as linhas
+    'NUM_REAL',  # float(valor)
+    'NUM_INT',   # int(valor)
+    'IDENT',     # Palavra reservada ou IDENT
+}
+
+GRUPO_ERRO = '_ERRO'
+GRUPO_FIM = '_FIM' # Caracteres do t_ignore no fim do fonte, sem token depois
+
+
+class Token:
+    """ Token no mesmo formato do LexToken do PLY """
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, tipo, valor, linha, posicao):
+        self.type = tipo
+        self.value = valor
+        self.lineno = linha
+        self.lexpos = posicao
+
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+def montar_expressao(regras):
+    """
+    Expressão mestra compilada a partir das regras t_ (o dicionário do
+    módulo), na ordem de prioridade do PLY. O nome de cada grupo é o tipo do
+    token. Devolve (expressão, tipos das regras em string, que viram token direto).
+    """
+    funcoes = []
+    strings = []
+    for nome, regra in regras.items():
+        if not nome.startswith('t_') or nome in ('t_ignore', 't_error'):
+            continue
+        tipo = nome[2:]
+        if callable(regra):
+            if tipo not in REGRAS_COM_ACAO:
+                raise ValueError(f"A regra '{nome}' não tem equivalente no lexer rápido.")
+            funcoes.append((regra.__code__.co_firstlineno, tipo, regra.__doc__))
+        else:
+            strings.append((tipo, regra))
+    funcoes.sort()
+    strings.sort(key=lambda regra: len(regra[1]), reverse=True)
+
+    partes = [f"(?P<{tipo}>{padrao})" for _, tipo, padrao in funcoes]
+    partes += [f"(?P<{tipo}>{padrao})" for tipo, padrao in strings]
+    partes.append(f"(?P<{GRUPO_FIM}>\\Z)")
+    partes.append(f"(?P<{GRUPO_ERRO}>[\\s\\S])")
+    # Os caracteres do t_ignore antes de cada token entram no mesmo casamento
+    ignorar = regras.get('t_ignore', '')
+    prefixo = f"[{re.escape(ignorar)}]*" if ignorar else ''
+    # O PLY compila a expressão mestra com re.VERBOSE; aqui também, para os padrões valerem igual
+    expressao = re.compile(f"{prefixo}(?:{'|'.join(partes)})", re.VERBOSE)
+    return expressao, frozenset(tipo for tipo, _ in strings)
+
+
+class LexerRapido:
+    """ Lexer de LALG com a interface do lexer do PLY (input/token/lineno/clone) """
+
+    def __init__(self, regras, expressao=None):
+        self.regras = regras
+        self.reservadas = regras['reserved']
+        self.expressao, self.simples = expressao or montar_expressao(regras)
+        self.lineno = 1
+        self.erros_lexicos = [] # Mensagens dos caracteres ilegais pulados (ver Compilador.analisar)
+        self._tokens = iter(())
+
+    def clone(self):
+        """ Outro lexer com as mesmas regras (a expressão mestra é compartilhada) """
+        return LexerRapido(self.regras, (self.expressao, self.simples))
+
+    def input(self, codigo_fonte):
+        self._tokens = self._gerar_tokens(codigo_fonte)
+        # O parser do PLY pega lexer.token depois do input e chama uma vez por
+        # token: aqui ele recebe direto o next do gerador, sem passar por um
+        # método Python a cada chamada
+        self.token = functools.partial(next, self._tokens, None)
+
+    def token(self):
+        """ Próximo token (None no fim do fonte), como o lexer.token() do PLY """
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+    def _gerar_tokens(self, codigo_fonte):
+        reservadas = self.reservadas
+        simples = self.simples
+        linha = self.lineno
+        # Os casos mais frequentes primeiro: pontuação/operadores e identificadores
+        for m in self.expressao.finditer(codigo_fonte):
+            tipo = m.lastgroup
+            if tipo in simples:
+                yield Token(tipo, m.group(tipo), linha, m.start(tipo))
+            elif tipo == 'IDENT':
+                valor = sys.intern(m.group(tipo)) # Como no t_IDENT
+                yield Token(reservadas.get(valor.lower(), 'IDENT'), valor, linha, m.start(tipo))
+            elif tipo == 'newline':
+                linha += m.end() - m.start(tipo)
+                self.lineno = linha # O parser lê p.lexer.lineno durante a análise
+            elif tipo == 'NUM_INT':
+                yield Token(tipo, int(m.group(tipo)), linha, m.start(tipo))
+            elif tipo == 'NUM_REAL':
+                yield Token(tipo, float(m.group(tipo)), linha, m.start(tipo))
+            elif tipo == 'COMMENT':
+                continue # Como no t_COMMENT, as quebras de linha do comentário não contam
+            elif tipo == GRUPO_FIM:
+                continue # Espaços ou tabs depois do último token: o PLY também só os ignora
+            else:
+                # Caractere ilegal: mesma mensagem do t_error; o caractere ruim é pulado
+                self.erros_lexicos.append(f"Caractere ilegal '{m.group(tipo)}' na linha {linha}")
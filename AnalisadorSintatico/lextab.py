@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ASSIGN', 'BEGIN', 'COLON', 'COMMA', 'DIVIDE', 'DO', 'DOLLAR', 'DOT', 'ELSE', 'END', 'EQ', 'GT', 'GTE', 'IDENT', 'IF', 'INTEGER', 'LPAREN', 'LT', 'LTE', 'MINUS', 'NEQ', 'NUM_INT', 'NUM_REAL', 'PLUS', 'PROCEDURE', 'PROGRAM', 'READ', 'REAL', 'RPAREN', 'SEMICOLON', 'THEN', 'TIMES', 'VAR', 'WHILE', 'WRITE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_COMMENT>\\{[^}]*\\}|/\\*[\\s\\S]*?\\*/)|(?P<t_NUM_REAL>\\d+\\.\\d+)|(?P<t_NUM_INT>\\d+)|(?P<t_IDENT>[a-zA-Z][a-zA-Z0-9_]*)|(?P<t_newline>\\n+)|(?P<t_ASSIGN>:=)|(?P<t_DOLLAR>\\$)|(?P<t_DOT>\\.)|(?P<t_GTE>>=)|(?P<t_LPAREN>\\()|(?P<t_LTE><=)|(?P<t_NEQ><>)|(?P<t_PLUS>\\+)|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_EQ>=)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_SEMICOLON>;)', [None, ('t_COMMENT', 'COMMENT'), ('t_NUM_REAL', 'NUM_REAL'), ('t_NUM_INT', 'NUM_INT'), ('t_IDENT', 'IDENT'), ('t_newline', 'newline'), (None, 'ASSIGN'), (None, 'DOLLAR'), (None, 'DOT'), (None, 'GTE'), (None, 'LPAREN'), (None, 'LTE'), (None, 'NEQ'), (None, 'PLUS'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'EQ'), (None, 'GT'), (None, 'LT'), (None, 'MINUS'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
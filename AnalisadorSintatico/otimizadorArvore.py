@@ -0,0 +1,344 @@
+import math
+
+from arvoreSintatica import *
+from instrucoes import converter_argumento
+
+# ==============================================================================
+# OTIMIZADOR DA ÁRVORE SINTÁTICA
+# ==============================================================================
+# Passos que reescrevem a árvore (ver arvoreSintatica.py) entre o parser e a
+# geração de código. Rodam com -O1, antes do otimizador do código objeto (ver
+# CodigoObjeto/otimizador.py), e não podem mudar nada do que o programa
+# imprime.
+#
+# Dobra de constantes: uma operação com as duas parcelas constantes vira uma
+# constante só (2 * 3 -> 6), calculada com a mesma aritmética da máquina. Não
+# são dobradas:
+#   - divisões por zero, que continuam dando o erro na execução;
+#   - resultados reais com valor inteiro (8 / 2 = 4.0): a constante iria para
+#     o código objeto como "CRCT 4.0", que a máquina carrega como o inteiro 4,
+#     e o write passaria a imprimir 4 em vez de 4.0.
+#
+# Simplificações algébricas: x * 1, 1 * x e x - 0 viram x, que dá exatamente
+# o mesmo valor para inteiros e reais. Ficam de fora:
+#   - x * 0 -> 0: se x for real, o resultado é 0.0 (e x pode ter uma divisão
+#     por zero). O tipo declarado não garante o tipo do valor, pois a
+#     atribuição de um real numa variável integer não é recusada;
+#   - x + 0 -> x: para x = -0.0 a máquina dá 0.0;
+#   - x / 1 -> x: a divisão sempre dá um real.
+#
+# Movimento de código invariante: dentro de um 'while', uma subexpressão que
+# só lê variáveis que o laço não altera dá o mesmo valor em toda iteração. Ela
+# é calculada uma vez antes do laço, numa variável temporária, e o laço passa
+# a ler a temporária. O laço "altera" as variáveis que recebem atribuição ou
+# read no seu corpo (também nos if/while de dentro) e as globais que os
+# procedimentos chamados nele alteram. Só sobem:
+#   - subexpressões com pelo menos uma operação (uma variável sozinha já é um
+#     CRVL só);
+#   - sem divisão, ou com divisão por constante diferente de zero: a conta
+#     passa a rodar mesmo que o laço não dê nenhuma volta, e não pode dar um
+#     erro de execução que antes não acontecia.
+# As temporárias ('#inv1', '#inv2', ...) não colidem com nomes do fonte, que
+# começam com letra. Cada uma tem o tipo do valor (real se tem divisão,
+# variável real ou constante real), para a memória tipada guardar o valor sem
+# convertê-lo. Todas são globais, declaradas antes do primeiro procedimento
+# (com os ALME das outras globais). Uma global não tem uma cópia por ativação
+# como as locais (ver o quadro de ativação em geracaoCodigo.py): um laço que
+# chama o próprio procedimento (recursão) não sobe nada, porque a chamada de
+# dentro calcularia a mesma temporária com os valores dela.
+
+
+def valor_na_maquina(valor):
+    """ Valor que a máquina carrega para "CRCT valor" (2.0 vira o inteiro 2) """
+    return converter_argumento(str(valor))
+
+
+def calcular(operador, esquerda, direita):
+    """ Resultado de 'esquerda operador direita' na máquina, ou None se não der para dobrar """
+    a, b = valor_na_maquina(esquerda), valor_na_maquina(direita)
+    if operador == '+': resultado = a + b
+    elif operador == '-': resultado = a - b
+    elif operador == '*': resultado = a * b
+    else:
+        if b == 0: return None # Divisão por zero fica para a execução
+        resultado = a / b
+    if isinstance(resultado, float) and (resultado.is_integer() or not math.isfinite(resultado)):
+        return None
+    return resultado
+
+
+def simplificar(no, esquerda, direita, contagem):
+    """ Nó que substitui a operação 'no', com as parcelas já simplificadas """
+    operador = no.operador
+    if type(esquerda) is Constante and type(direita) is Constante:
+        resultado = calcular(operador, esquerda.valor, direita.valor)
+        if resultado is not None:
+            contagem['constantes'] = contagem.get('constantes', 0) + 1
+            # A constante fica com a linha da primeira parcela, como no peephole
+            return Constante(resultado, esquerda.linha)
+    if operador == '*':
+        if type(direita) is Constante and valor_na_maquina(direita.valor) == 1:
+            contagem['identidades'] = contagem.get('identidades', 0) + 1
+            return esquerda
+        if type(esquerda) is Constante and valor_na_maquina(esquerda.valor) == 1:
+            contagem['identidades'] = contagem.get('identidades', 0) + 1
+            return direita
+    elif operador == '-' and type(direita) is Constante and valor_na_maquina(direita.valor) == 0:
+        contagem['identidades'] = contagem.get('identidades', 0) + 1
+        return esquerda
+    no.esquerda = esquerda
+    no.direita = direita
+    return no
+
+
+def dobrar_expressao(expressao, contagem):
+    """
+    Expressão com as constantes dobradas. Percorre em pós-ordem com uma pilha
+    própria (como a geração de código), para não depender da recursão do Python.
+    """
+    resultados = []
+    pendentes = [(expressao, False)]
+    while pendentes:
+        no, filhos_prontos = pendentes.pop()
+        if type(no) is not Binaria:
+            resultados.append(no)
+        elif filhos_prontos:
+            direita = resultados.pop()
+            esquerda = resultados.pop()
+            resultados.append(simplificar(no, esquerda, direita, contagem))
+        else:
+            pendentes.append((no, True))
+            pendentes.append((no.direita, False))
+            pendentes.append((no.esquerda, False))
+    return resultados[0]
+
+
+def dobrar_constantes(programa, contagem):
+    """ Dobra as constantes de todas as expressões do programa (altera a árvore) """
+    listas = [programa.comandos]
+    listas += [declaracao.comandos for declaracao in programa.declaracoes
+               if isinstance(declaracao, Procedimento)]
+    while listas:
+        for comando in listas.pop():
+            tipo = type(comando)
+            if tipo is Atribuicao:
+                comando.expressao = dobrar_expressao(comando.expressao, contagem)
+            elif tipo is Se or tipo is Enquanto:
+                condicao = comando.condicao
+                condicao.esquerda = dobrar_expressao(condicao.esquerda, contagem)
+                condicao.direita = dobrar_expressao(condicao.direita, contagem)
+                if tipo is Se:
+                    listas.append(comando.entao)
+                    if comando.senao is not None:
+                        listas.append(comando.senao)
+                else:
+                    listas.append(comando.corpo)
+
+
+def comandos_aninhados(comandos):
+    """ Os comandos da lista e os de dentro dos seus if/while (em qualquer ordem) """
+    pendentes = [comandos]
+    while pendentes:
+        for comando in pendentes.pop():
+            yield comando
+            tipo = type(comando)
+            if tipo is Se:
+                pendentes.append(comando.entao)
+                if comando.senao is not None:
+                    pendentes.append(comando.senao)
+            elif tipo is Enquanto:
+                pendentes.append(comando.corpo)
+
+
+def variaveis_escritas(comandos, escritas_procedimentos):
+    """
+    (nomes que recebem atribuição ou read nos comandos, globais alteradas
+    pelos procedimentos chamados neles)
+    """
+    atribuidas = set()
+    chamadas = set()
+    for comando in comandos_aninhados(comandos):
+        tipo = type(comando)
+        if tipo is Atribuicao or tipo is Leitura:
+            atribuidas.add(comando.nome)
+        elif tipo is Chamada:
+            # Procedimento ainda não declarado não gera código (erro semântico)
+            chamadas |= escritas_procedimentos.get(comando.nome, set())
+    return atribuidas, chamadas
+
+
+def primeira_linha(expressao):
+    """ Linha da primeira parcela da expressão """
+    while type(expressao) is Binaria:
+        expressao = expressao.esquerda
+    return expressao.linha
+
+
+class Temporarias:
+    """ Nomes e declarações das variáveis temporárias do programa """
+
+    def __init__(self):
+        self.declaracoes = []
+        self.tipos = {} # Variáveis visíveis no escopo sendo otimizado (nome -> 'INTEGER'/'REAL')
+
+    def nova(self, tipo, linha):
+        nome = f"#inv{len(self.declaracoes) + 1}"
+        self.declaracoes.append(DeclaracaoVariaveis([nome], tipo, linha))
+        self.tipos[nome] = tipo.upper() # Laços de dentro podem usar a temporária do de fora
+        return nome
+
+
+def trocar_invariantes(expressao, escritas, subidas, temporarias, linha):
+    """
+    Troca as subexpressões invariantes maximais de 'expressao' por temporárias
+    e devolve a expressão nova. Uma variável é invariante se é visível no
+    escopo e não está em 'escritas'. 'subidas' (chave da subexpressão ->
+    atribuição à temporária) é do laço: a mesma conta invariante vira uma
+    temporária só.
+    """
+    def subir(no, chave, real):
+        atribuicao = subidas.get(chave)
+        if atribuicao is None:
+            nome = temporarias.nova('real' if real else 'integer', linha)
+            atribuicao = subidas[chave] = Atribuicao(nome, no, linha)
+        return Variavel(atribuicao.nome, primeira_linha(no))
+
+    tipos = temporarias.tipos
+    # Pós-ordem com pilha própria; cada resultado é (nó, invariante?, chave, real?)
+    resultados = []
+    pendentes = [(expressao, False)]
+    while pendentes:
+        no, filhos_prontos = pendentes.pop()
+        tipo = type(no)
+        if tipo is Variavel:
+            ok = no.nome in tipos and no.nome not in escritas
+            resultados.append((no, ok, ('v', no.nome), ok and tipos[no.nome] == 'REAL'))
+        elif tipo is Constante:
+            valor = valor_na_maquina(no.valor)
+            resultados.append((no, True, ('c', type(valor), valor), isinstance(valor, float)))
+        elif not filhos_prontos:
+            pendentes.append((no, True))
+            pendentes.append((no.direita, False))
+            pendentes.append((no.esquerda, False))
+        else:
+            direita = resultados.pop()
+            esquerda = resultados.pop()
+            ok = esquerda[1] and direita[1]
+            if ok and no.operador == '/':
+                ok = type(direita[0]) is Constante and direita[2][2] != 0
+            if ok:
+                chave = (no.operador, esquerda[2], direita[2])
+                resultados.append((no, True, chave, no.operador == '/' or esquerda[3] or direita[3]))
+                continue
+            # Este nó não sobe: as partes invariantes dele sobem sozinhas
+            for lado, (filho, filho_ok, chave, real) in (('esquerda', esquerda), ('direita', direita)):
+                if filho_ok and type(filho) is Binaria:
+                    setattr(no, lado, subir(filho, chave, real))
+            resultados.append((no, False, None, False))
+    no, ok, chave, real = resultados[0]
+    if ok and type(no) is Binaria:
+        return subir(no, chave, real)
+    return no
+
+
+def subir_invariantes_do_laco(laco, escritas, temporarias):
+    """ Troca as contas invariantes do laço (condição e corpo); devolve as atribuições que vão antes dele """
+    subidas = {}
+    condicoes = [laco.condicao]
+    for comando in comandos_aninhados(laco.corpo):
+        tipo = type(comando)
+        if tipo is Atribuicao:
+            comando.expressao = trocar_invariantes(comando.expressao, escritas,
+                                                   subidas, temporarias, laco.linha)
+        elif tipo is Se or tipo is Enquanto:
+            condicoes.append(comando.condicao)
+    for condicao in condicoes:
+        condicao.esquerda = trocar_invariantes(condicao.esquerda, escritas,
+                                               subidas, temporarias, laco.linha)
+        condicao.direita = trocar_invariantes(condicao.direita, escritas,
+                                              subidas, temporarias, laco.linha)
+    return list(subidas.values())
+
+
+def chama(comandos, nome):
+    """ Algum comando (inclusive os de dentro de if/while) chama o procedimento 'nome'? """
+    return any(type(comando) is Chamada and comando.nome == nome for comando in comandos_aninhados(comandos))
+
+
+def mover_invariantes_escopo(comandos, locais, escritas_procedimentos, temporarias, contagem, proprio=None):
+    """
+    Sobe as contas invariantes de todos os laços dos comandos de um escopo.
+    'locais' são os nomes que escondem uma global de mesmo nome (parâmetros
+    e variáveis locais do procedimento); 'proprio' é o nome do procedimento,
+    e os laços que chamam ele mesmo ficam como estão.
+    O laço de fora é tratado antes dos de dentro: o que é invariante nele
+    sobe para fora de todos, e os de dentro ficam com o resto.
+    """
+    pendentes = [comandos]
+    while pendentes:
+        lista = pendentes.pop()
+        novos = []
+        for comando in lista:
+            tipo = type(comando)
+            if tipo is Enquanto and proprio is not None and chama([comando], proprio):
+                pendentes.append(comando.corpo) # Os laços de dentro podem não ter a chamada
+            elif tipo is Enquanto:
+                atribuidas, chamadas = variaveis_escritas([comando], escritas_procedimentos)
+                escritas = atribuidas | (chamadas - locais)
+                subidas = subir_invariantes_do_laco(comando, escritas, temporarias)
+                if subidas:
+                    contagem['invariantes'] = contagem.get('invariantes', 0) + len(subidas)
+                    novos.extend(subidas)
+                pendentes.append(comando.corpo)
+            elif tipo is Se:
+                pendentes.append(comando.entao)
+                if comando.senao is not None:
+                    pendentes.append(comando.senao)
+            novos.append(comando)
+        lista[:] = novos
+
+
+def mover_invariantes(programa, contagem):
+    """ Movimento de código invariante nos laços do programa principal e dos procedimentos """
+    globais = {}
+    # Globais que cada procedimento (e os que ele chama) pode alterar
+    escritas_procedimentos = {}
+    temporarias = Temporarias()
+    for declaracao in programa.declaracoes:
+        if isinstance(declaracao, DeclaracaoVariaveis):
+            for nome in declaracao.nomes:
+                globais[nome] = declaracao.tipo.upper()
+            continue
+        locais = {nome: grupo.tipo.upper() for grupo in declaracao.parametros + declaracao.declaracoes
+                  for nome in grupo.nomes}
+        atribuidas, chamadas = variaveis_escritas(declaracao.comandos, escritas_procedimentos)
+        # Um procedimento só chama os anteriores a ele e ele mesmo (os laços
+        # com a chamada recursiva ficam de fora)
+        temporarias.tipos = {**globais, **locais}
+        mover_invariantes_escopo(declaracao.comandos, locais.keys(), escritas_procedimentos,
+                                 temporarias, contagem, declaracao.nome)
+        escritas_procedimentos[declaracao.nome] = (atribuidas - locais.keys()) | chamadas
+
+    temporarias.tipos = globais
+    mover_invariantes_escopo(programa.comandos, set(), escritas_procedimentos, temporarias, contagem)
+
+    if temporarias.declaracoes:
+        declaracoes = programa.declaracoes
+        posicao = next((i for i, declaracao in enumerate(declaracoes)
+                        if isinstance(declaracao, Procedimento)), len(declaracoes))
+        if posicao:
+            # Os ALME das temporárias ficam na linha da declaração de variáveis anterior
+            for temporaria in temporarias.declaracoes:
+                temporaria.linha = declaracoes[posicao - 1].linha
+        declaracoes[posicao:posicao] = temporarias.declaracoes
+
+
+def otimizar(programa):
+    """
+    Roda os passos sobre a árvore, que é alterada no lugar. Devolve a contagem
+    de cada transformação aplicada (ex: {'constantes': 3, 'invariantes': 1}).
+    """
+    contagem = {}
+    dobrar_constantes(programa, contagem)
+    mover_invariantes(programa, contagem)
+    return contagem
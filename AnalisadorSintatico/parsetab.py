@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'ASSIGN BEGIN COLON COMMA DIVIDE DO DOLLAR DOT ELSE END EQ GT GTE IDENT IF INTEGER LPAREN LT LTE MINUS NEQ NUM_INT NUM_REAL PLUS PROCEDURE PROGRAM READ REAL RPAREN SEMICOLON THEN TIMES VAR WHILE WRITEprograma : PROGRAM IDENT corpo DOTcorpo : dc BEGIN comandos ENDdc : dc_v mais_dc\n| dc_p mais_dc\n| emptymais_dc : SEMICOLON dc\n| emptydc_v : VAR variaveis COLON tipo_vartipo_var : REAL\n| INTEGERvariaveis : IDENT mais_varmais_var : COMMA variaveis\n| emptyinicio_escopo : emptyfim_escopo : emptydc_p : PROCEDURE IDENT inicio_escopo parameters corpo_p fim_escopoparameters : LPAREN lista_par RPAREN\n| emptylista_par : variaveis COLON tipo_var mais_parmais_par : SEMICOLON lista_par\n| emptycorpo_p : dc_loc BEGIN comandos ENDdc_loc : dc_v mais_dcloc\n| emptymais_dcloc : SEMICOLON dc_loc\n| emptycomandos : comando mais_comandosmais_comandos : comandos\n| emptypt_virgula_opc : SEMICOLON\n| emptycomando : READ LPAREN IDENT RPAREN pt_virgula_opccomando : WRITE LPAREN IDENT RPAREN pt_virgula_opccomando : IDENT ASSIGN expressao pt_virgula_opccomando : IF condicao THEN comandos pfalsa DOLLARcondicao : expressao relacao expressaopfalsa : marca_else ELSE comandos\n| emptymarca_else : emptycomando : WHILE condicao DO comandos DOLLARcomando : IDENT lista_arg pt_virgula_opclista_arg : LPAREN argumentos RPAREN\n| emptyargumentos : IDENT mais_identmais_ident : COMMA argumentos\n| emptyrelacao : EQ\n| NEQ\n| GTE\n| LTE\n| GT\n| LTexpressao : termo outros_termosoutros_termos : op_ad termo outros_termos\n| emptyop_ad : PLUS\n| MINUStermo : op_un fator mais_fatoresop_un : MINUS\n| emptymais_fatores : op_mul fator mais_fatores\n| emptyop_mul : TIMES\n| DIVIDEfator : IDENTfator : NUM_INT\n| NUM_REALfator : LPAREN expressao RPARENempty :'
+_lr_signature = 'ASSIGN BEGIN COLON COMMA DIVIDE DO DOLLAR DOT ELSE END EQ GT GTE IDENT IF INTEGER LPAREN LT LTE MINUS NEQ NUM_INT NUM_REAL PLUS PROCEDURE PROGRAM READ REAL RPAREN SEMICOLON THEN TIMES VAR WHILE WRITEprograma : PROGRAM IDENT corpo DOTcorpo : dc BEGIN comandos ENDdc : lista_dc\n          | lista_dc SEMICOLON\n          | emptylista_dc : lista_dc SEMICOLON declaracao\n                | declaracaodeclaracao : dc_v\n                  | dc_pdc_v : VAR variaveis COLON tipo_vartipo_var : REAL\n                | INTEGERvariaveis : variaveis COMMA IDENT\n                 | IDENTinicio_escopo : emptydc_p : PROCEDURE IDENT inicio_escopo parameters corpo_pparameters : LPAREN lista_par RPAREN\n                  | emptylista_par : lista_par SEMICOLON grupo_par\n                 | grupo_pargrupo_par : variaveis COLON tipo_varcorpo_p : dc_loc BEGIN comandos ENDdc_loc : lista_dc_loc\n              | lista_dc_loc SEMICOLON\n              | emptylista_dc_loc : lista_dc_loc SEMICOLON dc_v\n                    | dc_vcomandos : comandos comando\n                | comandopt_virgula_opc : SEMICOLON\n                      | emptycomando : READ LPAREN IDENT RPAREN pt_virgula_opccomando : WRITE LPAREN IDENT RPAREN pt_virgula_opccomando : IDENT ASSIGN expressao pt_virgula_opccomando : IF condicao THEN comandos pfalsa DOLLARcondicao : expressao relacao expressaopfalsa : ELSE comandos\n              | emptycomando : WHILE condicao DO comandos DOLLARcomando : IDENT lista_arg pt_virgula_opclista_arg : LPAREN argumentos RPAREN\n                 | emptyargumentos : argumentos COMMA IDENT\n                  | IDENTrelacao : EQ\n               | NEQ\n               | GTE\n               | LTE\n               | GT\n               | LTexpressao : termo outros_termosoutros_termos : op_ad termo outros_termos\n                     | emptyop_ad : PLUS\n             | MINUStermo : op_un fator mais_fatoresop_un : MINUS\n             | emptymais_fatores : op_mul fator mais_fatores\n                    | emptyop_mul : TIMES\n              | DIVIDEfator : IDENTfator : NUM_INT\n             | NUM_REALfator : LPAREN expressao RPARENempty :'
     
-_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,11,],[0,-1,]),'IDENT':([2,9,10,12,21,23,25,26,30,38,39,40,41,42,43,46,47,48,49,56,59,60,61,62,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,91,92,93,95,97,100,101,102,103,104,105,110,116,118,122,123,124,125,129,130,131,134,],[3,18,19,23,23,-69,-69,-69,18,58,-69,-69,64,-43,65,-69,80,-59,-60,18,-69,-41,-30,-31,23,-69,-47,-48,-49,-50,-51,-52,-53,-69,-55,-56,-57,-69,-65,-66,-67,-69,23,-69,-34,-42,64,-69,-69,-58,80,-62,-63,-64,23,-32,-33,-54,-69,-68,-40,-35,23,-61,18,]),'VAR':([3,14,19,32,33,55,57,112,114,],[9,9,-69,-69,-14,9,-18,9,-17,]),'PROCEDURE':([3,14,],[10,10,]),'BEGIN':([3,5,6,7,8,13,14,15,16,19,27,32,33,51,52,53,55,57,85,86,87,88,108,109,111,112,113,114,127,132,],[-69,12,-69,-69,-5,-3,-69,-7,-4,-69,-6,-69,-14,-8,-9,-10,-69,-18,-69,110,-69,-24,-16,-15,-23,-69,-26,-17,-25,-22,]),'DOT':([4,34,],[11,-2,]),'SEMICOLON':([6,7,23,40,42,46,51,52,53,59,74,76,79,80,81,82,85,87,91,93,97,100,101,103,108,109,122,123,124,128,131,132,],[14,14,-69,61,-43,-69,-8,-9,-10,61,-53,-55,-69,-65,-66,-67,-69,112,61,-42,61,-69,-58,-62,-16,-15,-54,-69,-68,134,-61,-22,]),'READ':([12,21,23,40,42,46,59,60,61,62,66,74,76,79,80,81,82,84,91,92,93,97,100,101,103,110,116,118,122,123,124,125,129,130,131,],[22,22,-69,-69,-43,-69,-69,-41,-30,-31,22,-53,-55,-69,-65,-66,-67,22,-69,-34,-42,-69,-69,-58,-62,22,-32,-33,-54,-69,-68,-40,-35,22,-61,]),'WRITE':([12,21,23,40,42,46,59,60,61,62,66,74,76,79,80,81,82,84,91,92,93,97,100,101,103,110,116,118,122,123,124,125,129,130,131,],[24,24,-69,-69,-43,-69,-69,-41,-30,-31,24,-53,-55,-69,-65,-66,-67,24,-69,-34,-42,-69,-69,-58,-62,24,-32,-33,-54,-69,-68,-40,-35,24,-61,]),'IF':([12,21,23,40,42,46,59,60,61,62,66,74,76,79,80,81,82,84,91,92,93,97,100,101,103,110,116,118,122,123,124,125,129,130,131,],[25,25,-69,-69,-43,-69,-69,-41,-30,-31,25,-53,-55,-69,-65,-66,-67,25,-69,-34,-42,-69,-69,-58,-62,25,-32,-33,-54,-69,-68,-40,-35,25,-61,]),'WHILE':([12,21,23,40,42,46,59,60,61,62,66,74,76,79,80,81,82,84,91,92,93,97,100,101,103,110,116,118,122,123,124,125,129,130,131,],[26,26,-69,-69,-43,-69,-69,-41,-30,-31,26,-53,-55,-69,-65,-66,-67,26,-69,-34,-42,-69,-69,-58,-62,26,-32,-33,-54,-69,-68,-40,-35,26,-61,]),'COLON':([17,18,29,31,54,90,],[28,-69,-11,-13,-12,115,]),'COMMA':([18,64,],[30,95,]),'LPAREN':([19,22,23,24,25,26,32,33,39,47,48,49,67,68,69,70,71,72,73,75,77,78,83,102,104,105,],[-69,38,41,43,-69,-69,56,-14,-69,83,-59,-60,-69,-47,-48,-49,-50,-51,-52,-69,-56,-57,-69,83,-63,-64,]),'END':([20,21,23,35,36,37,40,42,46,59,60,61,62,74,76,79,80,81,82,91,92,93,97,100,101,103,116,118,122,123,124,125,126,129,131,],[34,-69,-69,-27,-28,-29,-69,-43,-69,-69,-41,-30,-31,-53,-55,-69,-65,-66,-67,-69,-34,-42,-69,-69,-58,-62,-32,-33,-54,-69,-68,-40,132,-35,-61,]),'DOLLAR':([21,23,35,36,37,40,42,46,59,60,61,62,74,76,79,80,81,82,91,92,93,97,98,100,101,103,107,116,118,119,121,122,123,124,125,129,131,136,],[-69,-69,-27,-28,-29,-69,-43,-69,-69,-41,-30,-31,-53,-55,-69,-65,-66,-67,-69,-34,-42,-69,-69,-69,-58,-62,125,-32,-33,129,-38,-54,-69,-68,-40,-35,-61,-37,]),'ELSE':([21,23,35,36,37,40,42,46,59,60,61,62,74,76,79,80,81,82,91,92,93,97,98,100,101,103,116,118,120,121,122,123,124,125,129,131,],[-69,-69,-27,-28,-29,-69,-43,-69,-69,-41,-30,-31,-53,-55,-69,-65,-66,-67,-69,-34,-42,-69,-69,-69,-58,-62,-32,-33,130,-39,-54,-69,-68,-40,-35,-61,]),'ASSIGN':([23,],[39,]),'MINUS':([25,26,39,46,67,68,69,70,71,72,73,75,77,78,79,80,81,82,83,100,101,103,123,124,131,],[48,48,48,78,48,-47,-48,-49,-50,-51,-52,48,-56,-57,-69,-65,-66,-67,48,78,-58,-62,-69,-68,-61,]),'NUM_INT':([25,26,39,47,48,49,67,68,69,70,71,72,73,75,77,78,83,102,104,105,],[-69,-69,-69,81,-59,-60,-69,-47,-48,-49,-50,-51,-52,-69,-56,-57,-69,81,-63,-64,]),'NUM_REAL':([25,26,39,47,48,49,67,68,69,70,71,72,73,75,77,78,83,102,104,105,],[-69,-69,-69,82,-59,-60,-69,-47,-48,-49,-50,-51,-52,-69,-56,-57,-69,82,-63,-64,]),'REAL':([28,115,],[52,52,]),'INTEGER':([28,115,],[53,53,]),'THEN':([44,46,74,76,79,80,81,82,99,100,101,103,122,123,124,131,],[66,-69,-53,-55,-69,-65,-66,-67,-36,-69,-58,-62,-54,-69,-68,-61,]),'EQ':([45,46,74,76,79,80,81,82,100,101,103,122,123,124,131,],[68,-69,-53,-55,-69,-65,-66,-67,-69,-58,-62,-54,-69,-68,-61,]),'NEQ':([45,46,74,76,79,80,81,82,100,101,103,122,123,124,131,],[69,-69,-53,-55,-69,-65,-66,-67,-69,-58,-62,-54,-69,-68,-61,]),'GTE':([45,46,74,76,79,80,81,82,100,101,103,122,123,124,131,],[70,-69,-53,-55,-69,-65,-66,-67,-69,-58,-62,-54,-69,-68,-61,]),'LTE':([45,46,74,76,79,80,81,82,100,101,103,122,123,124,131,],[71,-69,-53,-55,-69,-65,-66,-67,-69,-58,-62,-54,-69,-68,-61,]),'GT':([45,46,74,76,79,80,81,82,100,101,103,122,123,124,131,],[72,-69,-53,-55,-69,-65,-66,-67,-69,-58,-62,-54,-69,-68,-61,]),'LT':([45,46,74,76,79,80,81,82,100,101,103,122,123,124,131,],[73,-69,-53,-55,-69,-65,-66,-67,-69,-58,-62,-54,-69,-68,-61,]),'PLUS':([46,79,80,81,82,100,101,103,123,124,131,],[77,-69,-65,-66,-67,77,-58,-62,-69,-68,-61,]),'DO':([46,50,74,76,79,80,81,82,99,100,101,103,122,123,124,131,],[-69,84,-53,-55,-69,-65,-66,-67,-36,-69,-58,-62,-54,-69,-68,-61,]),'RPAREN':([46,52,53,58,63,64,65,74,76,79,80,81,82,89,94,96,100,101,103,106,117,122,123,124,128,131,133,135,137,],[-69,-9,-10,91,93,-69,97,-53,-55,-69,-65,-66,-67,114,-44,-46,-69,-58,-62,124,-45,-54,-69,-68,-69,-61,-19,-21,-20,]),'TIMES':([79,80,81,82,123,124,],[104,-65,-66,-67,104,-68,]),'DIVIDE':([79,80,81,82,123,124,],[105,-65,-66,-67,105,-68,]),}
+_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,13,],[0,-1,]),'IDENT':([2,11,12,14,19,20,22,24,25,28,32,33,34,35,36,37,38,41,42,43,44,51,54,55,56,57,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,88,89,90,91,92,93,95,96,97,98,99,100,102,103,106,108,110,112,114,115,116,117,118,122,123,124,],[3,17,18,22,22,-29,-67,-67,-67,49,-28,53,-67,-67,59,-42,60,-67,75,-57,-58,17,-67,-40,-30,-31,22,-67,-45,-46,-47,-48,-49,-50,-51,-67,-53,-54,-55,-67,-63,-64,-65,-67,22,-67,-34,-41,109,-67,22,-67,-56,75,-60,-61,-62,22,22,17,-32,-33,22,-52,-67,-66,-39,22,-35,22,-59,]),'BEGIN':([3,5,6,7,8,9,10,15,18,26,29,30,46,47,48,50,52,80,81,82,83,84,104,105,119,125,],[-67,14,-3,-5,-7,-8,-9,-4,-67,-6,-67,-15,-10,-11,-12,-67,-18,-16,103,-23,-25,-27,-24,-17,-26,-22,]),'VAR':([3,15,18,29,30,50,52,104,105,],[11,11,-67,-67,-15,11,-18,11,-17,]),'PROCEDURE':([3,15,],[12,12,]),'DOT':([4,31,],[13,-2,]),'SEMICOLON':([6,8,9,10,22,26,35,37,41,46,47,48,54,69,71,74,75,76,77,80,82,84,85,86,88,90,92,95,96,98,114,115,116,119,120,121,124,125,],[15,-7,-8,-9,-67,-6,56,-42,-67,-10,-11,-12,56,-51,-53,-67,-63,-64,-65,-16,104,-27,106,-20,56,-41,56,-67,-56,-60,-52,-67,-66,-26,-19,-21,-59,-22,]),'READ':([14,19,20,22,32,35,37,41,54,55,56,57,61,69,71,74,75,76,77,79,88,89,90,92,93,95,96,98,102,103,108,110,112,114,115,116,117,118,122,123,124,],[21,21,-29,-67,-28,-67,-42,-67,-67,-40,-30,-31,21,-51,-53,-67,-63,-64,-65,21,-67,-34,-41,-67,21,-67,-56,-60,21,21,-32,-33,21,-52,-67,-66,-39,21,-35,21,-59,]),'WRITE':([14,19,20,22,32,35,37,41,54,55,56,57,61,69,71,74,75,76,77,79,88,89,90,92,93,95,96,98,102,103,108,110,112,114,115,116,117,118,122,123,124,],[23,23,-29,-67,-28,-67,-42,-67,-67,-40,-30,-31,23,-51,-53,-67,-63,-64,-65,23,-67,-34,-41,-67,23,-67,-56,-60,23,23,-32,-33,23,-52,-67,-66,-39,23,-35,23,-59,]),'IF':([14,19,20,22,32,35,37,41,54,55,56,57,61,69,71,74,75,76,77,79,88,89,90,92,93,95,96,98,102,103,108,110,112,114,115,116,117,118,122,123,124,],[24,24,-29,-67,-28,-67,-42,-67,-67,-40,-30,-31,24,-51,-53,-67,-63,-64,-65,24,-67,-34,-41,-67,24,-67,-56,-60,24,24,-32,-33,24,-52,-67,-66,-39,24,-35,24,-59,]),'WHILE':([14,19,20,22,32,35,37,41,54,55,56,57,61,69,71,74,75,76,77,79,88,89,90,92,93,95,96,98,102,103,108,110,112,114,115,116,117,118,122,123,124,],[25,25,-29,-67,-28,-67,-42,-67,-67,-40,-30,-31,25,-51,-53,-67,-63,-64,-65,25,-67,-34,-41,-67,25,-67,-56,-60,25,25,-32,-33,25,-52,-67,-66,-39,25,-35,25,-59,]),'COLON':([16,17,49,87,],[27,-14,-13,107,]),'COMMA':([16,17,49,58,59,87,109,],[28,-14,-13,91,-44,28,-43,]),'LPAREN':([18,21,22,23,24,25,29,30,34,42,43,44,62,63,64,65,66,67,68,70,72,73,78,97,99,100,],[-67,33,36,38,-67,-67,51,-15,-67,78,-57,-58,-67,-45,-46,-47,-48,-49,-50,-67,-54,-55,-67,78,-61,-62,]),'END':([19,20,22,32,35,37,41,54,55,56,57,69,71,74,75,76,77,88,89,90,92,95,96,98,108,110,114,115,116,117,118,122,124,],[31,-29,-67,-28,-67,-42,-67,-67,-40,-30,-31,-51,-53,-67,-63,-64,-65,-67,-34,-41,-67,-67,-56,-60,-32,-33,-52,-67,-66,-39,125,-35,-59,]),'ELSE':([20,22,32,35,37,41,54,55,56,57,69,71,74,75,76,77,88,89,90,92,93,95,96,98,108,110,114,115,116,117,122,124,],[-29,-67,-28,-67,-42,-67,-67,-40,-30,-31,-51,-53,-67,-63,-64,-65,-67,-34,-41,-67,112,-67,-56,-60,-32,-33,-52,-67,-66,-39,-35,-59,]),'DOLLAR':([20,22,32,35,37,41,54,55,56,57,69,71,74,75,76,77,88,89,90,92,93,95,96,98,102,108,110,111,113,114,115,116,117,122,123,124,],[-29,-67,-28,-67,-42,-67,-67,-40,-30,-31,-51,-53,-67,-63,-64,-65,-67,-34,-41,-67,-67,-67,-56,-60,117,-32,-33,122,-38,-52,-67,-66,-39,-35,-37,-59,]),'ASSIGN':([22,],[34,]),'MINUS':([24,25,34,41,62,63,64,65,66,67,68,70,72,73,74,75,76,77,78,95,96,98,115,116,124,],[43,43,43,73,43,-45,-46,-47,-48,-49,-50,43,-54,-55,-67,-63,-64,-65,43,73,-56,-60,-67,-66,-59,]),'NUM_INT':([24,25,34,42,43,44,62,63,64,65,66,67,68,70,72,73,78,97,99,100,],[-67,-67,-67,76,-57,-58,-67,-45,-46,-47,-48,-49,-50,-67,-54,-55,-67,76,-61,-62,]),'NUM_REAL':([24,25,34,42,43,44,62,63,64,65,66,67,68,70,72,73,78,97,99,100,],[-67,-67,-67,77,-57,-58,-67,-45,-46,-47,-48,-49,-50,-67,-54,-55,-67,77,-61,-62,]),'REAL':([27,107,],[47,47,]),'INTEGER':([27,107,],[48,48,]),'THEN':([39,41,69,71,74,75,76,77,94,95,96,98,114,115,116,124,],[61,-67,-51,-53,-67,-63,-64,-65,-36,-67,-56,-60,-52,-67,-66,-59,]),'EQ':([40,41,69,71,74,75,76,77,95,96,98,114,115,116,124,],[63,-67,-51,-53,-67,-63,-64,-65,-67,-56,-60,-52,-67,-66,-59,]),'NEQ':([40,41,69,71,74,75,76,77,95,96,98,114,115,116,124,],[64,-67,-51,-53,-67,-63,-64,-65,-67,-56,-60,-52,-67,-66,-59,]),'GTE':([40,41,69,71,74,75,76,77,95,96,98,114,115,116,124,],[65,-67,-51,-53,-67,-63,-64,-65,-67,-56,-60,-52,-67,-66,-59,]),'LTE':([40,41,69,71,74,75,76,77,95,96,98,114,115,116,124,],[66,-67,-51,-53,-67,-63,-64,-65,-67,-56,-60,-52,-67,-66,-59,]),'GT':([40,41,69,71,74,75,76,77,95,96,98,114,115,116,124,],[67,-67,-51,-53,-67,-63,-64,-65,-67,-56,-60,-52,-67,-66,-59,]),'LT':([40,41,69,71,74,75,76,77,95,96,98,114,115,116,124,],[68,-67,-51,-53,-67,-63,-64,-65,-67,-56,-60,-52,-67,-66,-59,]),'PLUS':([41,74,75,76,77,95,96,98,115,116,124,],[72,-67,-63,-64,-65,72,-56,-60,-67,-66,-59,]),'DO':([41,45,69,71,74,75,76,77,94,95,96,98,114,115,116,124,],[-67,79,-51,-53,-67,-63,-64,-65,-36,-67,-56,-60,-52,-67,-66,-59,]),'RPAREN':([41,47,48,53,58,59,60,69,71,74,75,76,77,85,86,95,96,98,101,109,114,115,116,120,121,124,],[-67,-11,-12,88,90,-44,92,-51,-53,-67,-63,-64,-65,105,-20,-67,-56,-60,116,-43,-52,-67,-66,-19,-21,-59,]),'TIMES':([74,75,76,77,115,116,],[99,-63,-64,-65,99,-66,]),'DIVIDE':([74,75,76,77,115,116,],[100,-63,-64,-65,100,-66,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'programa':([0,],[1,]),'corpo':([3,],[4,]),'dc':([3,14,],[5,27,]),'dc_v':([3,14,55,112,],[6,6,87,87,]),'dc_p':([3,14,],[7,7,]),'empty':([3,6,7,14,18,19,21,23,25,26,32,39,40,46,55,59,64,67,75,79,83,85,87,91,97,98,100,112,123,128,],[8,15,15,8,31,33,37,42,49,49,57,49,62,76,88,62,96,49,49,103,49,109,113,62,62,121,76,88,103,135,]),'mais_dc':([6,7,],[13,16,]),'variaveis':([9,30,56,134,],[17,54,90,90,]),'comandos':([12,21,66,84,110,130,],[20,36,98,107,126,136,]),'comando':([12,21,66,84,110,130,],[21,21,21,21,21,21,]),'mais_var':([18,],[29,]),'inicio_escopo':([19,],[32,]),'mais_comandos':([21,],[35,]),'lista_arg':([23,],[40,]),'condicao':([25,26,],[44,50,]),'expressao':([25,26,39,67,83,],[45,45,59,99,106,]),'termo':([25,26,39,67,75,83,],[46,46,46,46,100,46,]),'op_un':([25,26,39,67,75,83,],[47,47,47,47,47,47,]),'tipo_var':([28,115,],[51,128,]),'parameters':([32,],[55,]),'pt_virgula_opc':([40,59,91,97,],[60,92,116,118,]),'argumentos':([41,95,],[63,117,]),'relacao':([45,],[67,]),'outros_termos':([46,100,],[74,122,]),'op_ad':([46,100,],[75,75,]),'fator':([47,102,],[79,123,]),'corpo_p':([55,],[85,]),'dc_loc':([55,112,],[86,127,]),'lista_par':([56,134,],[89,137,]),'mais_ident':([64,],[94,]),'mais_fatores':([79,123,],[101,131,]),'op_mul':([79,123,],[102,102,]),'fim_escopo':([85,],[108,]),'mais_dcloc':([87,],[111,]),'pfalsa':([98,],[119,]),'marca_else':([98,],[120,]),'mais_par':([128,],[133,]),}
+_lr_goto_items = {'programa':([0,],[1,]),'corpo':([3,],[4,]),'dc':([3,],[5,]),'lista_dc':([3,],[6,]),'empty':([3,18,22,24,25,29,34,35,41,50,54,62,70,74,78,88,92,93,95,115,],[7,30,37,44,44,52,44,57,71,83,57,44,44,98,44,57,57,113,71,98,]),'declaracao':([3,15,],[8,26,]),'dc_v':([3,15,50,104,],[9,9,84,119,]),'dc_p':([3,15,],[10,10,]),'variaveis':([11,51,106,],[16,87,87,]),'comandos':([14,61,79,103,112,],[19,93,102,118,123,]),'comando':([14,19,61,79,93,102,103,112,118,123,],[20,32,20,20,32,32,20,20,32,32,]),'inicio_escopo':([18,],[29,]),'lista_arg':([22,],[35,]),'condicao':([24,25,],[39,45,]),'expressao':([24,25,34,62,78,],[40,40,54,94,101,]),'termo':([24,25,34,62,70,78,],[41,41,41,41,95,41,]),'op_un':([24,25,34,62,70,78,],[42,42,42,42,42,42,]),'tipo_var':([27,107,],[46,121,]),'parameters':([29,],[50,]),'pt_virgula_opc':([35,54,88,92,],[55,89,108,110,]),'argumentos':([36,],[58,]),'relacao':([40,],[62,]),'outros_termos':([41,95,],[69,114,]),'op_ad':([41,95,],[70,70,]),'fator':([42,97,],[74,115,]),'corpo_p':([50,],[80,]),'dc_loc':([50,],[81,]),'lista_dc_loc':([50,],[82,]),'lista_par':([51,],[85,]),'grupo_par':([51,106,],[86,120,]),'mais_fatores':([74,115,],[96,124,]),'op_mul':([74,115,],[97,97,]),'pfalsa':([93,],[111,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,73 +27,71 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> programa","S'",1,None,None,None),
-  ('programa -> PROGRAM IDENT corpo DOT','programa',4,'p_programa','analisadorSintatico.py',219),
-  ('corpo -> dc BEGIN comandos END','corpo',4,'p_corpo','analisadorSintatico.py',226),
-  ('dc -> dc_v mais_dc','dc',2,'p_dc','analisadorSintatico.py',233),
-  ('dc -> dc_p mais_dc','dc',2,'p_dc','analisadorSintatico.py',234),
-  ('dc -> empty','dc',1,'p_dc','analisadorSintatico.py',235),
-  ('mais_dc -> SEMICOLON dc','mais_dc',2,'p_mais_dc','analisadorSintatico.py',240),
-  ('mais_dc -> empty','mais_dc',1,'p_mais_dc','analisadorSintatico.py',241),
-  ('dc_v -> VAR variaveis COLON tipo_var','dc_v',4,'p_dc_v','analisadorSintatico.py',245),
-  ('tipo_var -> REAL','tipo_var',1,'p_tipo_var','analisadorSintatico.py',263),
-  ('tipo_var -> INTEGER','tipo_var',1,'p_tipo_var','analisadorSintatico.py',264),
-  ('variaveis -> IDENT mais_var','variaveis',2,'p_variaveis','analisadorSintatico.py',268),
-  ('mais_var -> COMMA variaveis','mais_var',2,'p_mais_var','analisadorSintatico.py',275),
-  ('mais_var -> empty','mais_var',1,'p_mais_var','analisadorSintatico.py',276),
-  ('inicio_escopo -> empty','inicio_escopo',1,'p_inicio_escopo','analisadorSintatico.py',283),
-  ('fim_escopo -> empty','fim_escopo',1,'p_fim_escopo','analisadorSintatico.py',292),
-  ('dc_p -> PROCEDURE IDENT inicio_escopo parameters corpo_p fim_escopo','dc_p',6,'p_dc_p','analisadorSintatico.py',298),
-  ('parameters -> LPAREN lista_par RPAREN','parameters',3,'p_parameters','analisadorSintatico.py',321),
-  ('parameters -> empty','parameters',1,'p_parameters','analisadorSintatico.py',322),
-  ('lista_par -> variaveis COLON tipo_var mais_par','lista_par',4,'p_lista_par','analisadorSintatico.py',330),
-  ('mais_par -> SEMICOLON lista_par','mais_par',2,'p_mais_par','analisadorSintatico.py',352),
-  ('mais_par -> empty','mais_par',1,'p_mais_par','analisadorSintatico.py',353),
-  ('corpo_p -> dc_loc BEGIN comandos END','corpo_p',4,'p_corpo_p','analisadorSintatico.py',360),
-  ('dc_loc -> dc_v mais_dcloc','dc_loc',2,'p_dc_loc','analisadorSintatico.py',369),
-  ('dc_loc -> empty','dc_loc',1,'p_dc_loc','analisadorSintatico.py',370),
-  ('mais_dcloc -> SEMICOLON dc_loc','mais_dcloc',2,'p_mais_dcloc','analisadorSintatico.py',374),
-  ('mais_dcloc -> empty','mais_dcloc',1,'p_mais_dcloc','analisadorSintatico.py',375),
-  ('comandos -> comando mais_comandos','comandos',2,'p_comandos','analisadorSintatico.py',384),
-  ('mais_comandos -> comandos','mais_comandos',1,'p_mais_comandos','analisadorSintatico.py',388),
-  ('mais_comandos -> empty','mais_comandos',1,'p_mais_comandos','analisadorSintatico.py',389),
-  ('pt_virgula_opc -> SEMICOLON','pt_virgula_opc',1,'p_pt_virgula_opc','analisadorSintatico.py',395),
-  ('pt_virgula_opc -> empty','pt_virgula_opc',1,'p_pt_virgula_opc','analisadorSintatico.py',396),
-  ('comando -> READ LPAREN IDENT RPAREN pt_virgula_opc','comando',5,'p_comando_read','analisadorSintatico.py',400),
-  ('comando -> WRITE LPAREN IDENT RPAREN pt_virgula_opc','comando',5,'p_comando_write','analisadorSintatico.py',414),
-  ('comando -> IDENT ASSIGN expressao pt_virgula_opc','comando',4,'p_comando_assign','analisadorSintatico.py',429),
-  ('comando -> IF condicao THEN comandos pfalsa DOLLAR','comando',6,'p_comando_if','analisadorSintatico.py',446),
-  ('condicao -> expressao relacao expressao','condicao',3,'p_condicao','analisadorSintatico.py',465),
-  ('pfalsa -> marca_else ELSE comandos','pfalsa',3,'p_pfalsa','analisadorSintatico.py',481),
-  ('pfalsa -> empty','pfalsa',1,'p_pfalsa','analisadorSintatico.py',482),
-  ('marca_else -> empty','marca_else',1,'p_marca_else','analisadorSintatico.py',492),
-  ('comando -> WHILE condicao DO comandos DOLLAR','comando',5,'p_comando_while','analisadorSintatico.py',498),
-  ('comando -> IDENT lista_arg pt_virgula_opc','comando',3,'p_comando_chamada','analisadorSintatico.py',520),
-  ('lista_arg -> LPAREN argumentos RPAREN','lista_arg',3,'p_lista_arg','analisadorSintatico.py',558),
-  ('lista_arg -> empty','lista_arg',1,'p_lista_arg','analisadorSintatico.py',559),
-  ('argumentos -> IDENT mais_ident','argumentos',2,'p_argumentos','analisadorSintatico.py',566),
-  ('mais_ident -> COMMA argumentos','mais_ident',2,'p_mais_ident','analisadorSintatico.py',574),
-  ('mais_ident -> empty','mais_ident',1,'p_mais_ident','analisadorSintatico.py',575),
-  ('relacao -> EQ','relacao',1,'p_relacao','analisadorSintatico.py',584),
-  ('relacao -> NEQ','relacao',1,'p_relacao','analisadorSintatico.py',585),
-  ('relacao -> GTE','relacao',1,'p_relacao','analisadorSintatico.py',586),
-  ('relacao -> LTE','relacao',1,'p_relacao','analisadorSintatico.py',587),
-  ('relacao -> GT','relacao',1,'p_relacao','analisadorSintatico.py',588),
-  ('relacao -> LT','relacao',1,'p_relacao','analisadorSintatico.py',589),
-  ('expressao -> termo outros_termos','expressao',2,'p_expressao','analisadorSintatico.py',595),
-  ('outros_termos -> op_ad termo outros_termos','outros_termos',3,'p_outros_termos','analisadorSintatico.py',599),
-  ('outros_termos -> empty','outros_termos',1,'p_outros_termos','analisadorSintatico.py',600),
-  ('op_ad -> PLUS','op_ad',1,'p_op_ad','analisadorSintatico.py',610),
-  ('op_ad -> MINUS','op_ad',1,'p_op_ad','analisadorSintatico.py',611),
-  ('termo -> op_un fator mais_fatores','termo',3,'p_termo','analisadorSintatico.py',616),
-  ('op_un -> MINUS','op_un',1,'p_op_un','analisadorSintatico.py',620),
-  ('op_un -> empty','op_un',1,'p_op_un','analisadorSintatico.py',621),
-  ('mais_fatores -> op_mul fator mais_fatores','mais_fatores',3,'p_mais_fatores','analisadorSintatico.py',625),
-  ('mais_fatores -> empty','mais_fatores',1,'p_mais_fatores','analisadorSintatico.py',626),
-  ('op_mul -> TIMES','op_mul',1,'p_op_mul','analisadorSintatico.py',635),
-  ('op_mul -> DIVIDE','op_mul',1,'p_op_mul','analisadorSintatico.py',636),
-  ('fator -> IDENT','fator',1,'p_fator_id','analisadorSintatico.py',641),
-  ('fator -> NUM_INT','fator',1,'p_fator_num','analisadorSintatico.py',653),
-  ('fator -> NUM_REAL','fator',1,'p_fator_num','analisadorSintatico.py',654),
-  ('fator -> LPAREN expressao RPAREN','fator',3,'p_fator_grupo','analisadorSintatico.py',660),
-  ('empty -> <empty>','empty',0,'p_empty','analisadorSintatico.py',665),
+  ('programa -> PROGRAM IDENT corpo DOT','programa',4,'p_programa','analisadorSintatico.py',373),
+  ('corpo -> dc BEGIN comandos END','corpo',4,'p_corpo','analisadorSintatico.py',380),
+  ('dc -> lista_dc','dc',1,'p_dc','analisadorSintatico.py',393),
+  ('dc -> lista_dc SEMICOLON','dc',2,'p_dc','analisadorSintatico.py',394),
+  ('dc -> empty','dc',1,'p_dc','analisadorSintatico.py',395),
+  ('lista_dc -> lista_dc SEMICOLON declaracao','lista_dc',3,'p_lista_dc','analisadorSintatico.py',401),
+  ('lista_dc -> declaracao','lista_dc',1,'p_lista_dc','analisadorSintatico.py',402),
+  ('declaracao -> dc_v','declaracao',1,'p_declaracao','analisadorSintatico.py',411),
+  ('declaracao -> dc_p','declaracao',1,'p_declaracao','analisadorSintatico.py',412),
+  ('dc_v -> VAR variaveis COLON tipo_var','dc_v',4,'p_dc_v','analisadorSintatico.py',417),
+  ('tipo_var -> REAL','tipo_var',1,'p_tipo_var','analisadorSintatico.py',423),
+  ('tipo_var -> INTEGER','tipo_var',1,'p_tipo_var','analisadorSintatico.py',424),
+  ('variaveis -> variaveis COMMA IDENT','variaveis',3,'p_variaveis','analisadorSintatico.py',428),
+  ('variaveis -> IDENT','variaveis',1,'p_variaveis','analisadorSintatico.py',429),
+  ('inicio_escopo -> empty','inicio_escopo',1,'p_inicio_escopo','analisadorSintatico.py',439),
+  ('dc_p -> PROCEDURE IDENT inicio_escopo parameters corpo_p','dc_p',5,'p_dc_p','analisadorSintatico.py',445),
+  ('parameters -> LPAREN lista_par RPAREN','parameters',3,'p_parameters','analisadorSintatico.py',453),
+  ('parameters -> empty','parameters',1,'p_parameters','analisadorSintatico.py',454),
+  ('lista_par -> lista_par SEMICOLON grupo_par','lista_par',3,'p_lista_par','analisadorSintatico.py',462),
+  ('lista_par -> grupo_par','lista_par',1,'p_lista_par','analisadorSintatico.py',463),
+  ('grupo_par -> variaveis COLON tipo_var','grupo_par',3,'p_grupo_par','analisadorSintatico.py',471),
+  ('corpo_p -> dc_loc BEGIN comandos END','corpo_p',4,'p_corpo_p','analisadorSintatico.py',476),
+  ('dc_loc -> lista_dc_loc','dc_loc',1,'p_dc_loc','analisadorSintatico.py',486),
+  ('dc_loc -> lista_dc_loc SEMICOLON','dc_loc',2,'p_dc_loc','analisadorSintatico.py',487),
+  ('dc_loc -> empty','dc_loc',1,'p_dc_loc','analisadorSintatico.py',488),
+  ('lista_dc_loc -> lista_dc_loc SEMICOLON dc_v','lista_dc_loc',3,'p_lista_dc_loc','analisadorSintatico.py',494),
+  ('lista_dc_loc -> dc_v','lista_dc_loc',1,'p_lista_dc_loc','analisadorSintatico.py',495),
+  ('comandos -> comandos comando','comandos',2,'p_comandos','analisadorSintatico.py',506),
+  ('comandos -> comando','comandos',1,'p_comandos','analisadorSintatico.py',507),
+  ('pt_virgula_opc -> SEMICOLON','pt_virgula_opc',1,'p_pt_virgula_opc','analisadorSintatico.py',519),
+  ('pt_virgula_opc -> empty','pt_virgula_opc',1,'p_pt_virgula_opc','analisadorSintatico.py',520),
+  ('comando -> READ LPAREN IDENT RPAREN pt_virgula_opc','comando',5,'p_comando_read','analisadorSintatico.py',524),
+  ('comando -> WRITE LPAREN IDENT RPAREN pt_virgula_opc','comando',5,'p_comando_write','analisadorSintatico.py',530),
+  ('comando -> IDENT ASSIGN expressao pt_virgula_opc','comando',4,'p_comando_assign','analisadorSintatico.py',536),
+  ('comando -> IF condicao THEN comandos pfalsa DOLLAR','comando',6,'p_comando_if','analisadorSintatico.py',542),
+  ('condicao -> expressao relacao expressao','condicao',3,'p_condicao','analisadorSintatico.py',547),
+  ('pfalsa -> ELSE comandos','pfalsa',2,'p_pfalsa','analisadorSintatico.py',552),
+  ('pfalsa -> empty','pfalsa',1,'p_pfalsa','analisadorSintatico.py',553),
+  ('comando -> WHILE condicao DO comandos DOLLAR','comando',5,'p_comando_while','analisadorSintatico.py',560),
+  ('comando -> IDENT lista_arg pt_virgula_opc','comando',3,'p_comando_chamada','analisadorSintatico.py',565),
+  ('lista_arg -> LPAREN argumentos RPAREN','lista_arg',3,'p_lista_arg','analisadorSintatico.py',570),
+  ('lista_arg -> empty','lista_arg',1,'p_lista_arg','analisadorSintatico.py',571),
+  ('argumentos -> argumentos COMMA IDENT','argumentos',3,'p_argumentos','analisadorSintatico.py',583),
+  ('argumentos -> IDENT','argumentos',1,'p_argumentos','analisadorSintatico.py',584),
+  ('relacao -> EQ','relacao',1,'p_relacao','analisadorSintatico.py',594),
+  ('relacao -> NEQ','relacao',1,'p_relacao','analisadorSintatico.py',595),
+  ('relacao -> GTE','relacao',1,'p_relacao','analisadorSintatico.py',596),
+  ('relacao -> LTE','relacao',1,'p_relacao','analisadorSintatico.py',597),
+  ('relacao -> GT','relacao',1,'p_relacao','analisadorSintatico.py',598),
+  ('relacao -> LT','relacao',1,'p_relacao','analisadorSintatico.py',599),
+  ('expressao -> termo outros_termos','expressao',2,'p_expressao','analisadorSintatico.py',613),
+  ('outros_termos -> op_ad termo outros_termos','outros_termos',3,'p_outros_termos','analisadorSintatico.py',617),
+  ('outros_termos -> empty','outros_termos',1,'p_outros_termos','analisadorSintatico.py',618),
+  ('op_ad -> PLUS','op_ad',1,'p_op_ad','analisadorSintatico.py',626),
+  ('op_ad -> MINUS','op_ad',1,'p_op_ad','analisadorSintatico.py',627),
+  ('termo -> op_un fator mais_fatores','termo',3,'p_termo','analisadorSintatico.py',632),
+  ('op_un -> MINUS','op_un',1,'p_op_un','analisadorSintatico.py',640),
+  ('op_un -> empty','op_un',1,'p_op_un','analisadorSintatico.py',641),
+  ('mais_fatores -> op_mul fator mais_fatores','mais_fatores',3,'p_mais_fatores','analisadorSintatico.py',648),
+  ('mais_fatores -> empty','mais_fatores',1,'p_mais_fatores','analisadorSintatico.py',649),
+  ('op_mul -> TIMES','op_mul',1,'p_op_mul','analisadorSintatico.py',657),
+  ('op_mul -> DIVIDE','op_mul',1,'p_op_mul','analisadorSintatico.py',658),
+  ('fator -> IDENT','fator',1,'p_fator_id','analisadorSintatico.py',665),
+  ('fator -> NUM_INT','fator',1,'p_fator_num','analisadorSintatico.py',670),
+  ('fator -> NUM_REAL','fator',1,'p_fator_num','analisadorSintatico.py',671),
+  ('fator -> LPAREN expressao RPAREN','fator',3,'p_fator_grupo','analisadorSintatico.py',676),
+  ('empty -> <empty>','empty',0,'p_empty','analisadorSintatico.py',681),
 ]
@@ -0,0 +1,102 @@
+# ==============================================================================
+# BENCHMARK: ÁRVORE SINTÁTICA ENTRE O PARSER E A GERAÇÃO DE CÓDIGO
+# ==============================================================================
+# O parser monta uma árvore sintática e a geração de código é uma passada
+# separada sobre ela (ver AnalisadorSintatico/arvoreSintatica.py e
+# geracaoCodigo.py). Este script mede, num programa grande, quanto tempo vai
+# em cada passada (Compilador.analisar e Compilador.gerar), quantos nós a
+# árvore tem e quanta memória ela ocupa.
+#
+# Também confere o 'while' com condição composta: antes, o salto de volta do
+# laço supunha 3 instruções antes do DSVF e caía no meio de condições como
+# 'i + 1 < n * 2'. Agora o laço volta para o início da condição.
+#
+# Uso: python Benchmarks/benchmarkArvore.py [comandos]
+
+import sys
+import io
+import gc
+import time
+import tracemalloc
+import contextlib
+
+from programas import nova_maquina, executar_silencioso
+from benchmarkTokens import programa_grande
+from AnalisadorSintatico import analisadorSintatico
+
+WHILE_COMPOSTO = """program composto
+var i, n, s: integer
+begin
+  n := 5;
+  i := 0;
+  s := 0;
+  while i + 1 < n * 2 do
+    s := s + i;
+    i := i + 1
+  $
+  write(s)
+end.
+"""
+
+
+def contar_nos(raiz):
+    """ Quantidade de nós da árvore (as listas de comandos não contam como nó) """
+    quantidade = 0
+    pendentes = [raiz]
+    while pendentes:
+        no = pendentes.pop()
+        if isinstance(no, list):
+            pendentes.extend(no)
+        # Os nós vêm do arvoreSintatica que o analisadorSintatico importou (e reexporta)
+        elif isinstance(no, analisadorSintatico.No):
+            quantidade += 1
+            pendentes.extend(getattr(no, campo) for campo in no.__slots__)
+    return quantidade
+
+
+def main():
+    comandos = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeticoes = 5
+    compilador = analisadorSintatico.Compilador()
+
+    # O laço com condição composta soma 0 + 1 + ... + 8
+    with contextlib.redirect_stdout(io.StringIO()):
+        programa = compilador.compilar(WHILE_COMPOSTO)
+    saida = executar_silencioso(nova_maquina(programa.linhas))
+    assert "SAÍDA: 36" in saida, "while com condição composta calculou errado"
+    print("While com condição composta: ok (SAÍDA: 36)")
+
+    fonte = programa_grande(comandos)
+    with contextlib.redirect_stdout(io.StringIO()):
+        arvore = compilador.analisar(fonte)
+        # As duas passadas separadas dão o mesmo código que compilar()
+        assert compilador.gerar(arvore).linhas == compilador.compilar(fonte).linhas
+
+        melhor_analise = melhor_geracao = float('inf')
+        for _ in range(repeticoes):
+            gc.collect()
+            inicio = time.perf_counter()
+            arvore = compilador.analisar(fonte)
+            meio = time.perf_counter()
+            programa = compilador.gerar(arvore)
+            fim = time.perf_counter()
+            melhor_analise = min(melhor_analise, meio - inicio)
+            melhor_geracao = min(melhor_geracao, fim - meio)
+
+        del arvore
+        gc.collect()
+        tracemalloc.start()
+        arvore = compilador.analisar(fonte)
+        memoria = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    nos = contar_nos(arvore)
+    total = melhor_analise + melhor_geracao
+    print(f"\nPrograma com {len(fonte.splitlines())} linhas, {len(programa.linhas)} instruções")
+    print(f"Árvore: {nos:,} nós, {memoria:,} B ({memoria / nos:.0f} B por nó)")
+    print(f"{'Análise (lexer + parser + árvore)':<36} {melhor_analise:8.4f} s  {100 * melhor_analise / total:5.1f}%")
+    print(f"{'Geração de código (semântica)':<36} {melhor_geracao:8.4f} s  {100 * melhor_geracao / total:5.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# ==============================================================================
+# BENCHMARK: INTERPRETADOR x TRADUÇÃO PARA PYTHON
+# ==============================================================================
+# Executa os mesmos programas nos dois backends da MaquinaHipotetica
+# (executar e executar_compilado) e compara o tempo. Também confere que a
+# saída, a memória e a pilha terminam iguais nos dois, e mede o custo de
+# traduzir/compilar um programa contra o de reaproveitá-lo do cache (.pyc).
+#
+# Uso: python Benchmarks/benchmarkBackend.py [iteracoes]
+
+import sys
+import os
+import io
+import time
+import tempfile
+import contextlib
+
+from programas import DIRETORIO_RAIZ, programa_laco, compilar, nova_maquina
+from benchmarkDespacho import CLASSES, programa_classe
+from CodigoObjeto import otimizador, tradutorPython
+
+# Entradas do exemplo Dados/codigo.txt (os mesmos valores do README)
+ENTRADA_EXEMPLO = "7.5\n2\n3\n4\n5\n1\n"
+
+
+def rodar(linhas, compilado, entrada="", pasta_cache=None):
+    """ Executa uma vez; devolve (tempo, saída, memória final, pilha final) """
+    vm = nova_maquina(linhas, entrada)
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(saida):
+        if compilado:
+            vm.executar_compilado(pasta_cache)
+        else:
+            vm.executar()
+    tempo = time.perf_counter() - inicio
+    return tempo, saida.getvalue(), vm.dados, vm.pilha
+
+
+def comparar(titulo, linhas, entrada="", repeticoes=3):
+    # A pasta de cache é usada para que a tradução não entre na medição
+    with tempfile.TemporaryDirectory() as pasta:
+        melhor_interpretador = melhor_compilado = float('inf')
+        for _ in range(repeticoes):
+            tempo, *resultado_interpretador = rodar(linhas, False, entrada)
+            melhor_interpretador = min(melhor_interpretador, tempo)
+            tempo, *resultado_compilado = rodar(linhas, True, entrada, pasta)
+            melhor_compilado = min(melhor_compilado, tempo)
+            # Os dois backends têm que produzir exatamente o mesmo resultado
+            assert resultado_interpretador == resultado_compilado, titulo
+    print(f"{titulo:<58} {melhor_interpretador:8.4f}s {melhor_compilado:8.4f}s "
+          f"{melhor_interpretador / melhor_compilado:6.2f}x")
+
+
+def medir_cache(linhas):
+    """ Tempo de traduzir + compilar contra o tempo de ler do cache """
+    vm = nova_maquina(linhas)
+    with tempfile.TemporaryDirectory() as pasta:
+        inicio = time.perf_counter()
+        tradutorPython.compilar(vm.opcodes, vm.argumentos, pasta)
+        tempo_frio = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        tradutorPython.compilar(vm.opcodes, vm.argumentos, pasta)
+        tempo_cache = time.perf_counter() - inicio
+    print(f"\nPrograma com {len(linhas)} instruções: tradução + compilação {tempo_frio * 1000:.2f} ms, "
+          f"cache {tempo_cache * 1000:.2f} ms")
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    with open(os.path.join(DIRETORIO_RAIZ, 'Dados', 'codigo.txt'), 'r', encoding='utf-8') as f:
+        exemplo = compilar(f.read())
+    laco = compilar(programa_laco(iteracoes))
+
+    print(f"{'Programa':<58} {'interp.':>9} {'python':>9} {'ganho':>7}")
+    comparar(f"Laço com {iteracoes} iterações", laco)
+    comparar(f"Laço com {iteracoes} iterações (-O1)", otimizador.otimizar(laco)[0])
+    comparar("Exemplo Dados/codigo.txt", exemplo, ENTRADA_EXEMPLO, repeticoes=50)
+    for nome, (corpo, rotinas) in CLASSES.items():
+        comparar(nome, programa_classe(corpo, iteracoes // 10, rotinas=rotinas))
+
+    medir_cache(programa_classe(*CLASSES['Aritmética (SOMA, SUBT, MULT, DIVI)'][:1], 10, repeticoes=200))
+
+
+if __name__ == '__main__':
+    main()
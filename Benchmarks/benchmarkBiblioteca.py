@@ -0,0 +1,85 @@
+# ==============================================================================
+# BENCHMARK: COMPILAR E EXECUTAR NA MEMÓRIA
+# ==============================================================================
+# Antes, o main.py gravava o tokens.txt e o codigo_objeto.txt e a máquina
+# lia o código objeto de volta do disco (MaquinaHipotetica.carregar). Agora o
+# ProgramaObjeto do compilador vai direto para a máquina
+# (MaquinaHipotetica.carregar_programa), e o lalg.py junta as duas coisas
+# sem gravar nada: os arquivos só são gravados quando pedidos.
+#
+# Este script compara, para programas pequenos (o caso de um serviço que
+# recebe um programa por requisição) e maiores:
+#   - ida e volta pelo disco: grava tokens e código objeto numa pasta
+#     temporária, carrega o arquivo e executa;
+#   - tudo na memória: lalg.executar.
+# Os valores escritos pelo programa precisam ser os mesmos nos dois casos.
+#
+# Uso: python Benchmarks/benchmarkBiblioteca.py [repeticoes]
+
+import sys
+import os
+import io
+import time
+import tempfile
+import contextlib
+
+from programas import programa_laco, analisadorSintatico
+import lalg # A raiz entra no sys.path com o programas.py
+
+
+def programa_pequeno(comandos):
+    """ Programa curto, só com contas e escritas (quase todo o tempo é compilar e carregar) """
+    corpo = ";\n  ".join(f"a := a + {k} * b;\n  write(a)" for k in range(comandos))
+    return f"program pequeno\nvar a, b: integer\nbegin\n  b := 2;\n  {corpo}\nend.\n"
+
+
+def pelo_disco(fonte, pasta):
+    """ Como o main.py fazia: arquivos em disco no meio do caminho """
+    caminho_tokens = os.path.join(pasta, 'tokens.txt')
+    caminho_objeto = os.path.join(pasta, 'codigo_objeto.txt')
+    with open(caminho_tokens, 'w') as tokens:
+        programa = analisadorSintatico.Compilador().compilar(fonte, tokens=tokens)
+    programa.salvar(caminho_objeto)
+    saida = lalg.entradaSaida.SaidaMemoria()
+    vm = lalg.executor.MaquinaHipotetica(entrada=lalg.entradaSaida.EntradaMemoria(()), saida=saida)
+    vm.carregar(caminho_objeto)
+    vm.executar()
+    return saida.valores
+
+
+def na_memoria(fonte, pasta):
+    return lalg.executar(fonte).saidas
+
+
+def medir(funcao, fonte, pasta, repeticoes):
+    """ Tempo médio por execução (compilação + carga + execução) """
+    with contextlib.redirect_stdout(io.StringIO()):
+        valores = funcao(fonte, pasta) # Aquece o lexer e o parser
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao(fonte, pasta)
+    return (time.perf_counter() - inicio) / repeticoes, valores
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    casos = {
+        "5 comandos": (programa_pequeno(5), repeticoes),
+        "50 comandos": (programa_pequeno(50), repeticoes),
+        "500 comandos": (programa_pequeno(500), max(repeticoes // 10, 1)),
+        "Laço de 2000": (programa_laco(2000), max(repeticoes // 10, 1)),
+    }
+    print(f"{'Programa':<14} {'Pelo disco':>12} {'Na memória':>12} {'Ganho':>7}")
+    with tempfile.TemporaryDirectory() as pasta:
+        for nome, (fonte, vezes) in casos.items():
+            tempo_disco, valores_disco = medir(pelo_disco, fonte, pasta, vezes)
+            tempo_memoria, valores_memoria = medir(na_memoria, fonte, pasta, vezes)
+            # O caminho pela memória não pode mudar o que o programa escreve
+            assert valores_disco == valores_memoria, "saída diferente entre os caminhos"
+            print(f"{nome:<14} {tempo_disco * 1000:9.3f} ms {tempo_memoria * 1000:9.3f} ms "
+                  f"{tempo_disco / tempo_memoria:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
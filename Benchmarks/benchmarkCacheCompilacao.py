@@ -0,0 +1,113 @@
+# ==============================================================================
+# BENCHMARK: CACHE DA COMPILAÇÃO
+# ==============================================================================
+# Antes, cada execução do main.py compilava o fonte do zero (léxico,
+# sintático, semântico e geração de código), mesmo que o programa fosse o
+# mesmo da execução anterior. Agora o Compilador pode consultar o cache da
+# compilação (ver AnalisadorSintatico/cacheCompilacao.py): o código objeto
+# fica guardado pelo hash do fonte, da versão do compilador e do nível de
+# otimização, e um acerto monta o ProgramaObjeto direto do arquivo.
+#
+# Este script:
+#   - mede, para programas de tamanhos diferentes e nos níveis -O0 e -O1, a
+#     compilação sem cache, a falha (compila e grava) e o acerto. O programa
+#     que sai do cache precisa ser igual ao compilado;
+#   - simula um uso com poucos programas repetidos muitas vezes e um cache
+#     pequeno, mostrando a taxa de acertos e quantas entradas a limpeza (LRU)
+#     manteve.
+#
+# Uso: python Benchmarks/benchmarkCacheCompilacao.py [repeticoes]
+
+import sys
+import os
+import io
+import time
+import random
+import tempfile
+import contextlib
+
+from programas import programa_laco, analisadorSintatico
+import cacheCompilacao # A pasta entra no sys.path com o analisador
+
+
+def programa_grande(comandos):
+    """ Muitos comandos com contas, if e while (o tempo de compilação cresce com eles) """
+    corpo = []
+    for k in range(comandos):
+        corpo.append(f"a := (a + {k}) * b - c;\n"
+                     f"  if a > {k} then b := b + 1 else c := c - 1 $\n"
+                     f"  while c < {k} do c := c + a * 2 $")
+    # Depois do '$' de um if/while não vai ';'
+    return "program grande\nvar a, b, c: integer\nbegin\n  " + "\n  ".join(corpo) + "\n  write(a)\nend.\n"
+
+
+def retrato(programa):
+    """ O que a máquina recebe do ProgramaObjeto, para comparar os caminhos """
+    return programa.linhas, programa.layout, programa.mapa.codificar(), programa.relatorio
+
+
+def medir(funcao, repeticoes):
+    """ Menor tempo de uma chamada (qualquer saída é descartada) """
+    melhor = float('inf')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            resultado = funcao()
+            melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    casos = {
+        "Laço (pequeno)": programa_laco(10),
+        "100 comandos": programa_grande(100),
+        "1000 comandos": programa_grande(1000),
+    }
+    print(f"{'Programa':<15} {'Nível':>5} {'Sem cache':>11} {'Falha':>11} {'Acerto':>11} {'Ganho':>8}")
+    for nome, fonte in casos.items():
+        for nivel in (0, 1):
+            vezes = repeticoes if len(fonte) < 10000 else max(repeticoes // 5, 1)
+            with tempfile.TemporaryDirectory() as pasta:
+                cache = cacheCompilacao.CacheCompilacao(pasta)
+                sem_cache = analisadorSintatico.Compilador(nivel)
+                com_cache = analisadorSintatico.Compilador(nivel, cache=cache)
+
+                tempo_compilar, compilado = medir(lambda: sem_cache.compilar(fonte), vezes)
+
+                entrada = cache.caminho(cacheCompilacao.chave_compilacao(fonte, nivel))
+
+                def falha():
+                    # Apaga a entrada antes, para toda chamada compilar e gravar
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(entrada)
+                    return com_cache.compilar(fonte)
+                tempo_falha, _ = medir(falha, vezes)
+
+                tempo_acerto, do_cache = medir(lambda: com_cache.compilar(fonte), vezes)
+                # O programa do cache tem que ser o mesmo que a compilação gera
+                assert retrato(do_cache) == retrato(compilado), "programa diferente vindo do cache"
+            print(f"{nome:<15} {'-O' + str(nivel):>5} {tempo_compilar * 1000:8.3f} ms {tempo_falha * 1000:8.3f} ms "
+                  f"{tempo_acerto * 1000:8.3f} ms {tempo_compilar / tempo_acerto:7.1f}x")
+
+    # Uso simulado: 40 programas diferentes, os primeiros bem mais usados que
+    # os outros, e um cache que só comporta parte deles
+    print("\n--- Uso simulado (40 programas, cache de 8 KB) ---")
+    random.seed(1)
+    fontes = [programa_laco(n) for n in range(40)]
+    pesos = [1 / (i + 1) for i in range(len(fontes))]
+    with tempfile.TemporaryDirectory() as pasta:
+        cache = cacheCompilacao.CacheCompilacao(pasta, tamanho_maximo=8 * 1024)
+        compilador = analisadorSintatico.Compilador(cache=cache)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for fonte in random.choices(fontes, weights=pesos, k=500):
+                compilador.compilar(fonte)
+        entradas, total = cache.tamanho()
+        assert total <= cache.tamanho_maximo, "a limpeza deixou o cache passar do limite"
+        print(f"Consultas: {cacheCompilacao.formatar_taxas(cache.acertos, cache.falhas)}")
+        print(f"Entradas mantidas: {entradas} ({total / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
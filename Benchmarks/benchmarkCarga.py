@@ -0,0 +1,68 @@
+# ==============================================================================
+# BENCHMARK: TEMPO DE CARGA (TEXTO x BINÁRIO)
+# ==============================================================================
+# Gera um código objeto grande e mede quanto tempo a MaquinaHipotetica leva
+# para carregá-lo a partir do codigo_objeto.txt (linha a linha) e a partir do
+# formato binário (mmap + memoryview).
+#
+# Uso: python Benchmarks/benchmarkCarga.py [instrucoes]
+
+import sys
+import os
+import io
+import time
+import tempfile
+import contextlib
+
+from programas import executor
+from CodigoObjeto import formatoBinario
+
+
+def codigo_sintetico(quantidade):
+    """ Código objeto com a mistura típica de instruções geradas pelo compilador """
+    linhas = ["INPP", "ALME 100"]
+    i = 0
+    while len(linhas) < quantidade - 1:
+        linhas += [f"CRVL {i % 100}", f"CRCT {i % 7}.5", "SOMA", f"ARMZ {(i + 1) % 100}"]
+        i += 1
+    linhas.append("PARA")
+    return linhas
+
+
+def medir_carga(caminho):
+    """ Melhor tempo de 3 cargas do arquivo """
+    melhor = float('inf')
+    for _ in range(3):
+        vm = executor.MaquinaHipotetica()
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            vm.carregar(caminho)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, vm
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    linhas = codigo_sintetico(quantidade)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho_txt = os.path.join(pasta, 'codigo_objeto.txt')
+        caminho_bin = os.path.join(pasta, 'codigo_objeto.bin')
+        with open(caminho_txt, 'w') as f:
+            for linha in linhas: f.write(linha + '\n')
+        formatoBinario.salvar(linhas, caminho_bin)
+
+        tempo_txt, vm_txt = medir_carga(caminho_txt)
+        tempo_bin, vm_bin = medir_carga(caminho_bin)
+
+        # As duas cargas precisam produzir exatamente o mesmo programa
+        assert vm_txt.opcodes == vm_bin.opcodes and vm_txt.argumentos == vm_bin.argumentos
+
+        print(f"Código objeto com {len(linhas)} instruções")
+        print(f"Texto   ({os.path.getsize(caminho_txt):>10,} bytes): {tempo_txt:7.3f} s")
+        print(f"Binário ({os.path.getsize(caminho_bin):>10,} bytes): {tempo_bin:7.3f} s")
+        print(f"Ganho: {tempo_txt / tempo_bin:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# ==============================================================================
+# BENCHMARK: COMPILADOR REENTRANTE
+# ==============================================================================
+# Compila um lote de programas LALG com um único Compilador, primeiro em
+# sequência e depois num ThreadPoolExecutor. Cada compilação tem o seu próprio
+# lexer, parser e gerador, e as tabelas LALR são montadas uma vez só (na
+# importação), então o código objeto precisa sair idêntico nos dois casos.
+#
+# Uso: python Benchmarks/benchmarkCompilador.py [programas] [threads]
+
+import sys
+import io
+import time
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from programas import programa_laco
+from AnalisadorSintatico import analisadorSintatico
+
+
+def compilar_lote(compilador, fontes, threads):
+    """ Compila todos os fontes; devolve (tempo, lista de linhas de cada programa) """
+    inicio = time.perf_counter()
+    if threads == 1:
+        programas = [compilador.compilar(fonte) for fonte in fontes]
+    else:
+        with ThreadPoolExecutor(threads) as executor_threads:
+            programas = list(executor_threads.map(compilador.compilar, fontes))
+    return time.perf_counter() - inicio, [programa.linhas for programa in programas]
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    fontes = [programa_laco(i) for i in range(1, quantidade + 1)]
+    compilador = analisadorSintatico.Compilador(nivel=1)
+
+    # O redirect_stdout vale para o processo inteiro, por isso fica fora das threads
+    with contextlib.redirect_stdout(io.StringIO()):
+        tempo_sequencial, referencia = compilar_lote(compilador, fontes, 1)
+        tempo_threads, resultado = compilar_lote(compilador, fontes, threads)
+
+    # Compilar em paralelo não pode misturar o estado de duas compilações
+    assert resultado == referencia, "código objeto diferente compilando em threads"
+
+    print(f"{quantidade} programas compilados com -O1")
+    print(f"{'Sequencial:':<14} {tempo_sequencial:8.4f} s  {quantidade / tempo_sequencial:8.1f} programas/s")
+    print(f"{f'{threads} threads:':<14} {tempo_threads:8.4f} s  {quantidade / tempo_threads:8.1f} programas/s")
+
+
+if __name__ == '__main__':
+    main()
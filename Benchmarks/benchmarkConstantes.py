@@ -0,0 +1,96 @@
+# ==============================================================================
+# BENCHMARK: DOBRA DE CONSTANTES NA ÁRVORE SINTÁTICA
+# ==============================================================================
+# Com -O1, as operações entre constantes são calculadas na compilação e x * 1,
+# 1 * x e x - 0 viram x (ver AnalisadorSintatico/otimizadorArvore.py). Este
+# script compila programas com e sem esse passo e conta, com o perfil da
+# máquina, quantas instruções cada versão executa:
+#   - -O0: sem otimização nenhuma;
+#   - só o código objeto: o otimizador do código objeto (fluxo e peephole),
+#     sem os passos da árvore;
+#   - -O1: dobra de constantes e depois o otimizador do código objeto.
+# A saída impressa pelo programa precisa ser a mesma nas três versões.
+#
+# Uso: python Benchmarks/benchmarkConstantes.py [iteracoes]
+
+import sys
+import os
+import time
+
+from programas import DIRETORIO_RAIZ, compilar_programa, nova_maquina, executar_silencioso
+from benchmarkOtimizador import ENTRADA_EXEMPLO
+from CodigoObjeto import otimizador
+
+
+def programa_constantes(iteracoes):
+    """ Laço cujas contas têm partes constantes (segundos por dia, fatores de conversão...) """
+    return f"""program constantes
+var i, n, s, t: integer;
+var x: real
+begin
+  n := {iteracoes};
+  i := 0;
+  s := 0;
+  x := 0.0;
+  while i < n * 1 do
+    t := i * (60 * 60 * 24) - (24 - 4) * 1;
+    s := s + t / (60 * 60 * 24) - 0;
+    x := x + i * 2.5 * 1.5 / 3;
+    i := i + 1
+  $
+  write(s);
+  write(x)
+end.
+"""
+
+
+def executar(linhas, entrada="", repeticoes=3):
+    """ Melhor tempo, instruções executadas (pelo perfil) e saída impressa """
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        vm = nova_maquina(linhas, entrada)
+        inicio = time.perf_counter()
+        saida = executar_silencioso(vm)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    vm = nova_maquina(linhas, entrada)
+    vm.perfilar = True
+    executar_silencioso(vm)
+    return melhor, vm.perfil.total_instrucoes(), saida
+
+
+def comparar(titulo, fonte, entrada="", repeticoes=3):
+    sem_otimizacao = compilar_programa(fonte)
+    so_codigo_objeto, _ = otimizador.otimizar(sem_otimizacao.linhas, nivel=1)
+    otimizado = compilar_programa(fonte, nivel=1)
+
+    versoes = {
+        "-O0": sem_otimizacao.linhas,
+        "Só o código objeto": so_codigo_objeto,
+        "-O1 (dobra + código obj.)": otimizado.linhas,
+    }
+    resultados = {nome: executar(linhas, entrada, repeticoes) for nome, linhas in versoes.items()}
+
+    # Dobrar constantes não pode mudar o que o programa imprime
+    saidas = {saida for _, _, saida in resultados.values()}
+    assert len(saidas) == 1, f"{titulo}: saída diferente entre as versões"
+
+    print(f"--- {titulo} ---")
+    print(f"Árvore: {otimizado.relatorio['arvore'] or 'nada a dobrar'}")
+    print(f"{'':<24} {'Executadas':>12} {'Tempo':>10}")
+    base = resultados["-O0"][1]
+    for nome, (tempo, executadas, _) in resultados.items():
+        print(f"{nome:<24} {executadas:>12,} {tempo:8.4f} s  ({100 * executadas / base:5.1f}%)")
+    print()
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    comparar(f"Laço com constantes, {iteracoes} iterações", programa_constantes(iteracoes))
+
+    with open(os.path.join(DIRETORIO_RAIZ, 'Dados', 'codigo.txt'), 'r', encoding='utf-8') as f:
+        comparar("Exemplo Dados/codigo.txt", f.read(), ENTRADA_EXEMPLO, repeticoes=50)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# ==============================================================================
+# BENCHMARK: DECODIFICAÇÃO PRÉVIA DAS INSTRUÇÕES
+# ==============================================================================
+# Compara instruções por segundo entre:
+#   - ANTES: o laço antigo, que re-interpretava o texto a cada passo
+#            ('#' in instrucao, split(), float() + is_integer());
+#   - DEPOIS: MaquinaHipotetica.executar, que roda das listas já decodificadas.
+#
+# Uso: python Benchmarks/benchmarkDecodificacao.py [iteracoes]
+
+import sys
+import time
+
+from programas import programa_laco, compilar, nova_maquina, executar_silencioso
+
+
+def executar_texto_legado(instrucoes):
+    """
+    Reprodução do laço antigo (só com as instruções usadas pelo programa de
+    laço). Devolve (quantidade de instruções executadas, valores impressos).
+    """
+    dados, pilha, saida = [], [], []
+    pc = 0
+    executadas = 0
+    while pc < len(instrucoes):
+        instrucao = instrucoes[pc]
+        if '#' in instrucao:
+            instrucao = instrucao.split('#')[0].strip()
+        partes = instrucao.split()
+        op = partes[0]
+        arg = None
+        if len(partes) > 1:
+            try:
+                arg = float(partes[1])
+                if arg.is_integer(): arg = int(arg)
+            except ValueError:
+                arg = partes[1]
+        executadas += 1
+
+        if op == 'INPP': pc += 1
+        elif op == 'PARA': break
+        elif op == 'ALME':
+            for _ in range(int(arg)): dados.append(0)
+            pc += 1
+        elif op == 'CRCT': pilha.append(arg); pc += 1
+        elif op == 'CRVL': pilha.append(dados[int(arg)]); pc += 1
+        elif op == 'ARMZ': dados[int(arg)] = pilha.pop(); pc += 1
+        elif op == 'SOMA': b = pilha.pop(); a = pilha.pop(); pilha.append(a + b); pc += 1
+        elif op == 'SUBT': b = pilha.pop(); a = pilha.pop(); pilha.append(a - b); pc += 1
+        elif op == 'MULT': b = pilha.pop(); a = pilha.pop(); pilha.append(a * b); pc += 1
+        elif op == 'IMPR': saida.append(pilha.pop()); pc += 1
+        elif op == 'DSVF':
+            if not pilha.pop(): pc = int(arg)
+            else: pc += 1
+        elif op == 'DSVI': pc = int(arg)
+        elif op == 'CMEN':
+            b = pilha.pop(); a = pilha.pop()
+            pilha.append(1 if a < b else 0); pc += 1
+        else:
+            raise ValueError(f"Instrução '{op}' fora do escopo do benchmark")
+    return executadas, saida
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    linhas = compilar(programa_laco(iteracoes))
+
+    inicio = time.perf_counter()
+    executadas, saida_legado = executar_texto_legado(linhas)
+    tempo_antes = time.perf_counter() - inicio
+
+    vm = nova_maquina(linhas)
+    inicio = time.perf_counter()
+    saida_nova = executar_silencioso(vm)
+    tempo_depois = time.perf_counter() - inicio
+
+    # As duas versões precisam imprimir o mesmo resultado
+    assert f"SAÍDA: {saida_legado[0]}" in saida_nova
+
+    print(f"Programa de laço: {iteracoes} iterações, {executadas} instruções executadas")
+    print(f"ANTES  (texto a cada passo): {tempo_antes:8.3f} s  {executadas / tempo_antes:12,.0f} instr/s")
+    print(f"DEPOIS (pré-decodificado):   {tempo_depois:8.3f} s  {executadas / tempo_depois:12,.0f} instr/s")
+    print(f"Ganho: {tempo_antes / tempo_depois:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
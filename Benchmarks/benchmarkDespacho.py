@@ -0,0 +1,166 @@
+# ==============================================================================
+# BENCHMARK: DESPACHO POR TABELA x CADEIA DE IF/ELIF
+# ==============================================================================
+# Mede, para cada classe de instruções, o tempo do laço antigo (cadeia de
+# if/elif sobre o opcode + pilha com append/pop) contra o laço atual
+# (tabela de tratadores indexada pelo opcode + pilha pré-alocada com índice).
+#
+# Cada programa de teste é um laço em código objeto cujo corpo repete várias
+# vezes as instruções da classe medida, para que elas dominem o tempo.
+#
+# Uso: python Benchmarks/benchmarkDespacho.py [voltas]
+
+import sys
+import time
+
+from programas import nova_maquina, executar_silencioso
+from CodigoObjeto.instrucoes import *
+
+
+def executar_cadeia_legado(opcodes, argumentos):
+    """ Reprodução do laço anterior: if/elif na mesma ordem, com append/pop """
+    dados, pilha, retorno = [], [], []
+    pc = 0
+    while pc < len(opcodes):
+        op = opcodes[pc]
+        arg = argumentos[pc]
+        if op == CRVL:
+            if arg >= len(dados): dados.extend([0] * (arg + 1 - len(dados)))
+            pilha.append(dados[arg]); pc += 1
+        elif op == CRCT:
+            pilha.append(arg); pc += 1
+        elif op == ARMZ:
+            if not pilha: sys.exit(1)
+            valor = pilha.pop()
+            if arg >= len(dados): dados.extend([0] * (arg + 1 - len(dados)))
+            dados[arg] = valor; pc += 1
+        elif op == SOMA:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(a + b); pc += 1
+        elif op == SUBT:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(a - b); pc += 1
+        elif op == MULT:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(a * b); pc += 1
+        elif op == DIVI:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop()
+            if b == 0: sys.exit(1)
+            pilha.append(a / b); pc += 1
+        elif op == DSVF:
+            if not pilha: sys.exit(1)
+            if not pilha.pop(): pc = arg
+            else: pc += 1
+        elif op == DSVI:
+            pc = arg
+        elif op == CPIG:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(1 if a == b else 0); pc += 1
+        elif op == CDIF:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(1 if a != b else 0); pc += 1
+        elif op == CMAI:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(1 if a > b else 0); pc += 1
+        elif op == CMEN:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(1 if a < b else 0); pc += 1
+        elif op == CPMI:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(1 if a <= b else 0); pc += 1
+        elif op == CPMA:
+            if len(pilha) < 2: sys.exit(1)
+            b = pilha.pop(); a = pilha.pop(); pilha.append(1 if a >= b else 0); pc += 1
+        elif op == IMPR:
+            if not pilha: sys.exit(1)
+            pilha.pop(); pc += 1
+        elif op == LEIT:
+            pc += 1
+        elif op == INPP:
+            pc += 1
+        elif op == PARA:
+            break
+        elif op == ALME:
+            for _ in range(arg): dados.append(0)
+            pc += 1
+        elif op == PUSHER:
+            retorno.append(arg); pc += 1
+        elif op == PARAM:
+            if arg >= len(dados): dados.extend([0] * (arg + 1 - len(dados)))
+            pilha.append(dados[arg]); pc += 1
+        elif op == CHPR:
+            pc = arg
+        elif op == RTPR:
+            pc = retorno.pop() if retorno else pc + 1
+        elif op == DESM:
+            for _ in range(arg):
+                if dados: dados.pop()
+            pc += 1
+        else:
+            pc += 1
+    return dados
+
+
+def programa_classe(corpo, voltas, repeticoes=20, rotinas=()):
+    """
+    Monta um laço em código objeto: o contador fica no endereço 0 e o corpo
+    (lista de linhas) é repetido 'repeticoes' vezes por volta. Endereços de
+    desvio dentro do corpo usam os marcadores {aqui} e {rotina}.
+    """
+    linhas = ["INPP", "ALME 4", f"CRCT {voltas}", "ARMZ 0"]
+    inicio = len(linhas)
+    linhas += ["CRVL 0", "CRCT 0", "CMAI", "DSVF {fim}"]
+    for _ in range(repeticoes):
+        base = len(linhas)
+        for linha in corpo:
+            linhas.append(linha.replace("{aqui}", str(base + len(corpo))))
+    linhas += ["CRVL 0", "CRCT 1", "SUBT", "ARMZ 0", f"DSVI {inicio}"]
+    fim = len(linhas)
+    linhas.append("PARA")
+    rotina = len(linhas)
+    linhas += list(rotinas)
+    return [l.replace("{fim}", str(fim)).replace("{rotina}", str(rotina)) for l in linhas]
+
+
+CLASSES = {
+    'Carga/armazenamento (CRCT, CRVL, ARMZ)':
+        (["CRCT 7", "ARMZ 1", "CRVL 1", "ARMZ 2"], ()),
+    'Aritmética (SOMA, SUBT, MULT, DIVI)':
+        (["CRVL 0", "CRCT 3", "SOMA", "CRCT 2", "MULT", "CRCT 1", "SUBT", "CRCT 2", "DIVI", "ARMZ 1"], ()),
+    'Comparação (CPIG, CDIF, CMAI, CMEN, CPMI, CPMA)':
+        (["CRVL 0", "CRCT 5", "CPIG", "CRCT 1", "CDIF", "CRCT 0", "CMAI", "CRCT 2", "CMEN",
+          "CRCT 1", "CPMI", "CRCT 0", "CPMA", "ARMZ 1"], ()),
+    'Desvios (DSVF, DSVI)':
+        (["CRCT 0", "DSVF {aqui}"], ()),
+    'Procedimentos (PUSHER, PARAM, CHPR, RTPR, ALME, DESM)':
+        (["PUSHER {aqui}", "PARAM 0", "CHPR {rotina}"],
+         ("ALME 1", "ARMZ 3", "DESM 1", "RTPR")),
+}
+
+
+def main():
+    voltas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{'Classe de instruções':<55} {'if/elif':>9} {'tabela':>9} {'ganho':>7}")
+    for nome, (corpo, rotinas) in CLASSES.items():
+        linhas = programa_classe(corpo, voltas, rotinas=rotinas)
+        tempo_antes = tempo_depois = float('inf')
+        # Fico com o melhor de 3 execuções para reduzir o ruído da medição
+        for _ in range(3):
+            vm = nova_maquina(linhas)
+
+            inicio = time.perf_counter()
+            dados_antes = executar_cadeia_legado(vm.opcodes, vm.argumentos)
+            tempo_antes = min(tempo_antes, time.perf_counter() - inicio)
+
+            inicio = time.perf_counter()
+            executar_silencioso(vm)
+            tempo_depois = min(tempo_depois, time.perf_counter() - inicio)
+
+            # Os dois laços têm que deixar a memória no mesmo estado
+            assert dados_antes == vm.dados, nome
+        print(f"{nome:<55} {tempo_antes:8.3f}s {tempo_depois:8.3f}s {tempo_antes / tempo_depois:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
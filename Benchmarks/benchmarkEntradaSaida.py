@@ -0,0 +1,96 @@
+# ==============================================================================
+# BENCHMARK: CANAIS DE ENTRADA E SAÍDA
+# ==============================================================================
+# Executa um programa que lê e escreve muitos valores com os canais padrão
+# (input() e um print por IMPR) e com os canais de lote: EntradaArquivo (lê
+# tudo de uma vez) e SaidaBuffer (escreve em blocos, no modo normal e no
+# bruto). Os valores impressos precisam ser os mesmos nos três casos.
+#
+# Uso: python Benchmarks/benchmarkEntradaSaida.py [valores]
+
+import sys
+import io
+import time
+import contextlib
+
+from programas import compilar
+from CodigoObjeto import executor, entradaSaida
+
+
+def programa_eco(quantidade):
+    """ Lê 'quantidade' valores e escreve cada um deles e a soma acumulada """
+    return f"""program eco
+var i, n, x, s: integer
+begin
+  n := {quantidade};
+  i := 0;
+  s := 0;
+  while i < n do
+    read(x);
+    s := s + x;
+    write(x);
+    write(s);
+    i := i + 1
+  $
+end.
+"""
+
+
+def rodar(linhas, entrada, criar_canais):
+    """ Executa uma vez; devolve (tempo, texto escrito no stdout) """
+    canal_entrada, canal_saida = criar_canais(entrada)
+    vm = executor.MaquinaHipotetica(entrada=canal_entrada, saida=canal_saida)
+    vm.decodificar(linhas)
+    terminal = io.StringIO()
+    sys.stdin = io.StringIO(entrada)
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(terminal):
+        vm.executar()
+    tempo = time.perf_counter() - inicio
+    sys.stdin = sys.__stdin__
+    return tempo, terminal.getvalue()
+
+
+def valores_escritos(texto):
+    """ Só os números escritos pelo programa, com ou sem o 'SAÍDA: ' """
+    valores = []
+    for linha in texto.splitlines():
+        linha = linha.replace("Digite um valor de entrada: ", "").replace("SAÍDA: ", "")
+        if linha and linha[0].isdigit():
+            valores.append(linha)
+    return valores
+
+
+CANAIS = {
+    "Terminal (input + print)": lambda entrada: (entradaSaida.EntradaInterativa(),
+                                                 entradaSaida.SaidaPadrao()),
+    "Lote (arquivo + blocos)": lambda entrada: (entradaSaida.EntradaArquivo(io.StringIO(entrada)),
+                                                entradaSaida.SaidaBuffer()),
+    "Lote, saída bruta": lambda entrada: (entradaSaida.EntradaArquivo(io.StringIO(entrada)),
+                                          entradaSaida.SaidaBuffer(bruta=True)),
+}
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    linhas = compilar(programa_eco(quantidade))
+    entrada = '\n'.join(str(i % 1000) for i in range(quantidade)) + '\n'
+
+    print(f"Programa que lê {quantidade} valores e escreve {2 * quantidade}")
+    referencia = None
+    tempo_referencia = None
+    for nome, criar_canais in CANAIS.items():
+        melhor = float('inf')
+        for _ in range(3):
+            tempo, texto = rodar(linhas, entrada, criar_canais)
+            melhor = min(melhor, tempo)
+        valores = valores_escritos(texto)
+        if referencia is None:
+            referencia, tempo_referencia = valores, melhor
+        # Trocar o canal não pode mudar o que o programa escreve
+        assert valores == referencia, f"{nome}: saída diferente"
+        print(f"{nome:<28} {melhor:8.4f} s  {tempo_referencia / melhor:6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
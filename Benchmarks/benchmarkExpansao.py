@@ -0,0 +1,112 @@
+# ==============================================================================
+# BENCHMARK: EXPANSÃO DE PROCEDIMENTOS PEQUENOS (INLINING)
+# ==============================================================================
+# Com -O1, a chamada de um procedimento pequeno vira uma cópia do corpo dele
+# (ver expandir_procedimentos em CodigoObjeto/otimizador.py): saem o PUSHER,
+# o CHPR e o RTPR e, quando dá, o PARAM e o ARMZ de cada parâmetro. Este
+# script compila um laço que chama procedimentos de tamanhos diferentes com
+# vários limites de tamanho (LIMITE_EXPANSAO) e mostra, para cada um, o
+# tamanho do código e quantas instruções a máquina executa. A saída impressa
+# precisa ser a mesma com todos os limites.
+#
+# Uso: python Benchmarks/benchmarkExpansao.py [iteracoes]
+
+import sys
+import time
+
+from programas import compilar_programa, nova_maquina, executar_silencioso
+import otimizador # Mesmo módulo que o Compilador usa (a pasta já está no sys.path)
+
+
+def programa_chamadas(iteracoes):
+    """ Laço que chama um procedimento minúsculo, um pequeno e um médio """
+    return f"""program chamadas
+var i, n, s, t: integer;
+
+procedure acumula (v: integer)
+begin
+  s := s + v
+end;
+
+procedure maximo (a, b: integer)
+begin
+  if a > b then
+    t := a
+  else
+    t := b
+  $
+end;
+
+procedure mistura (a, b: integer)
+  var x, y: integer
+begin
+  x := a * 3 + b;
+  y := x - a * 2;
+  if x > y then
+    s := s + x - y
+  else
+    s := s - 1
+  $
+  t := y - b
+end
+
+begin
+  n := {iteracoes};
+  i := 0;
+  s := 0;
+  t := 0;
+  while i < n do
+    acumula(i);
+    maximo(i, t);
+    mistura(i, t);
+    i := i + 1
+  $
+  write(s);
+  write(t)
+end.
+"""
+
+
+def executar(linhas, repeticoes=3):
+    """ Melhor tempo, instruções executadas (pelo perfil) e saída impressa """
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        vm = nova_maquina(linhas)
+        inicio = time.perf_counter()
+        saida = executar_silencioso(vm)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    vm = nova_maquina(linhas)
+    vm.perfilar = True
+    executar_silencioso(vm)
+    return melhor, vm.perfil.total_instrucoes(), saida
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    fonte = programa_chamadas(iteracoes)
+    padrao = otimizador.LIMITE_EXPANSAO
+
+    versoes = {"-O0": compilar_programa(fonte)}
+    for limite in (0, 12, padrao, 48):
+        otimizador.LIMITE_EXPANSAO = limite
+        versoes[f"-O1, limite {limite}"] = compilar_programa(fonte, nivel=1)
+    otimizador.LIMITE_EXPANSAO = padrao
+
+    resultados = {nome: executar(programa.linhas) for nome, programa in versoes.items()}
+
+    # Expandir as chamadas não pode mudar o que o programa imprime
+    saidas = {saida for _, _, saida in resultados.values()}
+    assert len(saidas) == 1, "saída diferente entre as versões"
+
+    print(f"--- Laço com 3 chamadas, {iteracoes} iterações (limite padrão: {padrao}) ---")
+    print(f"{'':<18} {'Instruções':>10} {'Executadas':>12} {'Tempo':>10}  Expansão")
+    base = resultados["-O0"][1]
+    for nome, (tempo, executadas, _) in resultados.items():
+        programa = versoes[nome]
+        expansao = (programa.relatorio or {}).get('expansao') or '-'
+        print(f"{nome:<18} {len(programa.linhas):>10,} {executadas:>12,} {tempo:8.4f} s  "
+              f"({100 * executadas / base:5.1f}%)  {expansao}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# ==============================================================================
+# BENCHMARK: ENCADEAMENTO DE DESVIOS E REMOÇÃO DE CÓDIGO INALCANÇÁVEL
+# ==============================================================================
+# Com -O1, antes do peephole, o otimizador do código objeto passa pelo fluxo
+# de controle (ver encadear_desvios e remover_inalcancaveis em
+# CodigoObjeto/otimizador.py):
+#   - um desvio que cai num DSVI vai direto para o destino final (o fim do
+#     THEN de um if dentro de outro, o DSVI que pula um procedimento e cai no
+#     DSVI do próximo);
+#   - instruções que a execução nunca alcança são removidas, inclusive os
+#     procedimentos que ninguém chama e os DSVI que só pulam para a próxima
+#     instrução que sobrou.
+# Este script compila uma "biblioteca" de procedimentos da qual o programa usa
+# só alguns, com if/else aninhados dentro de um laço, e compara o tamanho do
+# código e as instruções executadas com e sem esse passo. A saída impressa
+# precisa ser a mesma nas três versões.
+#
+# Uso: python Benchmarks/benchmarkFluxo.py [iteracoes] [procedimentos]
+
+import sys
+import os
+import time
+
+from programas import DIRETORIO_RAIZ, compilar_programa, nova_maquina, executar_silencioso
+from benchmarkOtimizador import ENTRADA_EXEMPLO
+from CodigoObjeto import otimizador
+
+
+def programa_biblioteca(iteracoes, procedimentos):
+    """ 'procedimentos' procedimentos declarados, dos quais o laço chama só dois """
+    declaracoes = []
+    for k in range(procedimentos):
+        declaracoes.append(f"""procedure p{k} (v: integer)
+  var w: integer
+begin
+  w := v * {k + 1};
+  if w > {k} then
+    s := s + w
+  else
+    s := s - 1
+  $
+end""")
+    return f"""program biblioteca
+var i, n, s: integer;
+{';'.join(declaracoes)}
+begin
+  n := {iteracoes};
+  i := 0;
+  s := 0;
+  while i < n do
+    if i > 5 then
+      if i > 10 then
+        p0(i)
+      else
+        s := s + 1
+      $
+    else
+      p1(i)
+    $
+    i := i + 1
+  $
+  write(s)
+end.
+"""
+
+
+def so_peephole(linhas):
+    """ O código objeto só com o peephole, sem o passo do fluxo de controle """
+    programa, _ = otimizador.peephole(otimizador.decodificar_programa(linhas))
+    return [instrucao.formatar() for instrucao in programa]
+
+
+def executar(linhas, entrada="", repeticoes=3):
+    """ Melhor tempo, instruções executadas (pelo perfil) e saída impressa """
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        vm = nova_maquina(linhas, entrada)
+        inicio = time.perf_counter()
+        saida = executar_silencioso(vm)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    vm = nova_maquina(linhas, entrada)
+    vm.perfilar = True
+    executar_silencioso(vm)
+    return melhor, vm.perfil.total_instrucoes(), saida
+
+
+def comparar(titulo, fonte, entrada="", repeticoes=3):
+    sem_otimizacao = compilar_programa(fonte)
+    otimizado = compilar_programa(fonte, nivel=1)
+
+    versoes = {
+        "-O0": sem_otimizacao.linhas,
+        "Só o peephole": so_peephole(sem_otimizacao.linhas),
+        "-O1 (fluxo + peephole)": otimizado.linhas,
+    }
+    resultados = {nome: executar(linhas, entrada, repeticoes) for nome, linhas in versoes.items()}
+
+    # Os desvios realocados (DSVF, DSVI, CHPR e os retornos do PUSHER)
+    # precisam levar aos mesmos lugares: a saída não pode mudar
+    saidas = {saida for _, _, saida in resultados.values()}
+    assert len(saidas) == 1, f"{titulo}: saída diferente entre as versões"
+
+    print(f"--- {titulo} ---")
+    print(f"Fluxo: {otimizado.relatorio['fluxo'] or 'nada a remover'}")
+    print(f"{'':<24} {'Instruções':>10} {'Executadas':>12} {'Tempo':>10}")
+    base = resultados["-O0"][1]
+    for nome, (tempo, executadas, _) in resultados.items():
+        print(f"{nome:<24} {len(versoes[nome]):>10,} {executadas:>12,} {tempo:8.4f} s  "
+              f"({100 * executadas / base:5.1f}%)")
+    print()
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    procedimentos = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    comparar(f"Biblioteca com {procedimentos} procedimentos, {iteracoes} iterações",
+             programa_biblioteca(iteracoes, procedimentos))
+
+    with open(os.path.join(DIRETORIO_RAIZ, 'Dados', 'codigo.txt'), 'r', encoding='utf-8') as f:
+        comparar("Exemplo Dados/codigo.txt", f.read(), ENTRADA_EXEMPLO, repeticoes=50)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# ==============================================================================
+# BENCHMARK: PROFUNDIDADE DA PILHA DO PARSER EM LISTAS LONGAS
+# ==============================================================================
+# Compila programas com muitos comandos seguidos e listas longas de variáveis
+# e mede, para cada tamanho: o tempo de compilação, o pico de memória alocada
+# e a maior profundidade da pilha de estados do parser LALR. Com listas
+# recursivas à esquerda a pilha fica do mesmo tamanho qualquer que seja o
+# número de comandos; com recursão à direita ela cresce com eles.
+#
+# Uso: python Benchmarks/benchmarkGramatica.py [comandos...]
+
+import sys
+import io
+import gc
+import time
+import hashlib
+import tracemalloc
+import contextlib
+
+from programas import compilar_programa
+from AnalisadorSintatico import analisadorSintatico
+
+
+def programa_longo(comandos, variaveis=1000):
+    """ 'variaveis' variáveis numa só declaração e 'comandos' comandos seguidos """
+    nomes = ', '.join(f"v{i}" for i in range(variaveis))
+    corpo = []
+    for i in range(comandos // 2):
+        corpo.append(f"  v{i % variaveis} := v{(i + 1) % variaveis} + {i};")
+        corpo.append(f"  write(v{i % variaveis})")
+    return (f"program longo\nvar {nomes}: integer;\nvar x, y: real\n"
+            f"begin\n" + "\n".join(corpo) + "\nend.\n")
+
+
+def tokens_medindo_pilha(lexer, medida):
+    """
+    Função de tokens que, a cada token pedido pelo parser, anota o tamanho da
+    pilha de estados dele (a variável local 'statestack' do laço do PLY).
+    """
+    proximo = lexer.token
+    def token():
+        pilha = sys._getframe(1).f_locals['statestack']
+        medida[0] = max(medida[0], len(pilha))
+        return proximo()
+    return token
+
+
+def profundidade_maxima(fonte):
+    """ Maior pilha de estados do parser durante a compilação do fonte """
+    medida = [0]
+    lexer = analisadorSintatico.obter_lexer().clone()
+    lexer.lineno = 1
+    lexer.input(fonte)
+    parser = analisadorSintatico.copy.copy(analisadorSintatico.obter_parser())
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse(lexer=lexer, tokenfunc=tokens_medindo_pilha(lexer, medida))
+    return medida[0]
+
+
+def main():
+    tamanhos = [int(n) for n in sys.argv[1:]] or [10000, 50000, 100000]
+
+    pilhas = set()
+    print(f"{'Comandos':>9} {'Tempo':>10} {'µs/comando':>11} {'Pico de memória':>16} {'Pilha':>7}  Código objeto")
+    for comandos in tamanhos:
+        fonte = programa_longo(comandos)
+
+        gc.collect()
+        inicio = time.perf_counter()
+        programa = compilar_programa(fonte)
+        tempo = time.perf_counter() - inicio
+        # Resumo do código objeto, para comparar versões da gramática
+        resumo = hashlib.sha1('\n'.join(programa.linhas).encode()).hexdigest()[:12]
+        del programa
+
+        tracemalloc.start()
+        compilar_programa(fonte)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        pilha = profundidade_maxima(fonte)
+        pilhas.add(pilha)
+        print(f"{comandos:>9} {tempo:8.3f} s {1e6 * tempo / comandos:9.2f} {pico:>14,} B {pilha:>7}  {resumo}")
+
+    # Com as listas recursivas à esquerda, a pilha não depende do tamanho do programa
+    assert len(pilhas) == 1, "a pilha do parser cresce com o número de comandos"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# ==============================================================================
+# BENCHMARK: TEMPO DE INICIALIZAÇÃO DO COMPILADOR
+# ==============================================================================
+# Mede, em processos Python novos (partida a frio), o tempo desde o import do
+# analisadorSintatico até o fim da primeira compilação do Dados/codigo.txt:
+#   - com as tabelas do PLY já geradas (lextab.py e parsetab.py), que é o caso
+#     normal de uso;
+#   - sem as tabelas, numa cópia temporária do projeto, como na primeira
+#     execução: o PLY valida as regras, monta as tabelas e grava os arquivos.
+# O código objeto gerado precisa ser o mesmo nos dois casos.
+#
+# Uso: python Benchmarks/benchmarkInicializacao.py [repeticoes]
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import subprocess
+import time
+
+from programas import DIRETORIO_RAIZ
+
+PASTAS_COMPILADOR = ('AnalisadorSintatico', 'AnalisadorSemantico', 'CodigoObjeto', 'Dados')
+TABELAS = ('lextab.py', 'parsetab.py')
+
+# Roda dentro do processo novo: importa, compila e devolve os tempos em JSON
+SCRIPT = """
+import sys, io, time, json, contextlib
+inicio = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from AnalisadorSintatico import analisadorSintatico
+importado = time.perf_counter()
+with open(analisadorSintatico.os.path.join(sys.argv[1], 'Dados', 'codigo.txt')) as f:
+    fonte = f.read()
+with contextlib.redirect_stdout(io.StringIO()):
+    programa = analisadorSintatico.Compilador().compilar(fonte)
+compilado = time.perf_counter()
+print(json.dumps({'import': importado - inicio, 'compilacao': compilado - importado,
+                  'linhas': programa.linhas}))
+"""
+
+
+def partida_a_frio(raiz):
+    """ Executa o SCRIPT num processo novo; devolve (tempos, tempo total do processo) """
+    # Como numa instalação normal, o Python pode gravar o .pyc das tabelas
+    ambiente = {nome: valor for nome, valor in os.environ.items() if nome != 'PYTHONDONTWRITEBYTECODE'}
+    inicio = time.perf_counter()
+    resultado = subprocess.run([sys.executable, '-c', SCRIPT, raiz], env=ambiente,
+                               capture_output=True, text=True, check=True)
+    total = time.perf_counter() - inicio
+    return json.loads(resultado.stdout), total
+
+
+def apagar_tabelas(raiz):
+    """ Apaga lextab.py e parsetab.py (e os .pyc deles); o resto do projeto continua igual """
+    pasta = os.path.join(raiz, 'AnalisadorSintatico')
+    cache = os.path.join(pasta, '__pycache__')
+    arquivos = [os.path.join(pasta, nome) for nome in TABELAS]
+    if os.path.isdir(cache):
+        arquivos += [os.path.join(cache, nome) for nome in os.listdir(cache)
+                     if nome.split('.')[0] + '.py' in TABELAS]
+    for arquivo in arquivos:
+        if os.path.exists(arquivo):
+            os.remove(arquivo)
+
+
+def medir(raiz, repeticoes, antes=None):
+    """ Melhor de 'repeticoes' partidas; devolve (import, compilação, processo, linhas) """
+    melhor = None
+    for _ in range(repeticoes):
+        if antes:
+            antes()
+        tempos, total = partida_a_frio(raiz)
+        atual = (tempos['import'], tempos['compilacao'], total, tempos['linhas'])
+        if melhor is None or atual[0] + atual[1] < melhor[0] + melhor[1]:
+            melhor = atual
+    return melhor
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    # A mesma conta na árvore do projeto e numa cópia sem as tabelas
+    with tempfile.TemporaryDirectory() as copia:
+        for pasta in PASTAS_COMPILADOR:
+            shutil.copytree(os.path.join(DIRETORIO_RAIZ, pasta), os.path.join(copia, pasta),
+                            ignore=shutil.ignore_patterns('__pycache__', 'cache'))
+        sem_tabelas = medir(copia, repeticoes, antes=lambda: apagar_tabelas(copia))
+        com_tabelas = medir(DIRETORIO_RAIZ, repeticoes)
+
+        # Com ou sem as tabelas prontas, o compilador tem que gerar o mesmo código
+        assert sem_tabelas[3] == com_tabelas[3], "código objeto diferente com as tabelas em cache"
+        # Nenhum arquivo de depuração do PLY pode ter sido gravado
+        assert not os.path.exists(os.path.join(copia, 'AnalisadorSintatico', 'parser.out'))
+
+    print(f"Melhor de {repeticoes} partidas a frio (import + primeira compilação do Dados/codigo.txt)")
+    print(f"{'':<22} {'Import':>10} {'Compilação':>12} {'Processo':>10}")
+    for nome, (importar, compilar, total, _) in (("Sem tabelas", sem_tabelas),
+                                                  ("Tabelas em cache", com_tabelas)):
+        print(f"{nome:<22} {importar * 1000:8.2f} ms {compilar * 1000:10.2f} ms {total * 1000:7.1f} ms")
+    print(f"Ganho até a primeira compilação: "
+          f"{(sem_tabelas[0] + sem_tabelas[1]) / (com_tabelas[0] + com_tabelas[1]):.2f}x")
+
+
+if __name__ == '__main__':
+    main()
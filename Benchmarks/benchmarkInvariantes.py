@@ -0,0 +1,131 @@
+# ==============================================================================
+# BENCHMARK: MOVIMENTO DE CÓDIGO INVARIANTE NOS LAÇOS
+# ==============================================================================
+# Com -O1, as contas de um 'while' que só leem variáveis que o laço não altera
+# são feitas uma vez antes dele, numa temporária (ver mover_invariantes em
+# AnalisadorSintatico/otimizadorArvore.py). Este script compila laços com e
+# sem esse passo e conta, com o perfil da máquina, quantas instruções cada
+# versão executa:
+#   - -O0: sem otimização nenhuma;
+#   - -O1 sem o movimento: dobra de constantes e otimizador do código objeto;
+#   - -O1: tudo, com o movimento de código invariante.
+# O programa tem um laço dentro de outro e um procedimento que altera uma
+# global usada no laço (essa conta não pode sair do laço). A saída impressa
+# precisa ser a mesma nas três versões, com a memória em lista e na tipada.
+#
+# Uso: python Benchmarks/benchmarkInvariantes.py [iteracoes]
+
+import sys
+import io
+import time
+import contextlib
+
+from programas import compilar_programa, executar_silencioso, analisadorSintatico, executor, entradaSaida
+from CodigoObjeto import otimizador
+import otimizadorArvore # Mesmo módulo que o Compilador usa (a pasta já está no sys.path)
+
+
+def programa_invariantes(iteracoes):
+    """ Laços com contas que não mudam entre as voltas """
+    return f"""program invariantes
+var i, j, n, m, s, a, b: integer;
+var x, escala: real;
+
+procedure ajusta (passo: integer)
+begin
+  b := b + passo
+end
+
+begin
+  n := {iteracoes // 10};
+  m := 10;
+  a := 3;
+  b := 4;
+  escala := 2.5;
+  s := 0;
+  x := 0.0;
+  i := 0;
+  while i < n * 2 - n do
+    j := 0;
+    while j < m do
+      s := s + j * (a * a + 7) + i * 2;
+      x := x + j * (escala * escala / 4);
+      j := j + 1
+    $
+    ajusta(a);
+    s := s - b * a;
+    i := i + 1
+  $
+  write(s);
+  write(x)
+end.
+"""
+
+
+def sem_movimento(fonte):
+    """ -O1 sem o movimento de código invariante (só os outros passos) """
+    compilador = analisadorSintatico.Compilador()
+    with contextlib.redirect_stdout(io.StringIO()):
+        arvore = compilador.analisar(fonte)
+        otimizadorArvore.dobrar_constantes(arvore, {})
+        programa = compilador.gerar(arvore)
+    linhas, _ = otimizador.otimizar(programa.linhas, nivel=1)
+    return programa.layout, linhas
+
+
+def executar(linhas, layout, tipada, repeticoes=3):
+    """ Melhor tempo, instruções executadas (pelo perfil) e saída impressa """
+    def nova():
+        vm = executor.MaquinaHipotetica(memoria_tipada=tipada,
+                                        entrada=entradaSaida.EntradaArquivo(io.StringIO("")))
+        vm.decodificar(linhas)
+        vm.layout = layout
+        return vm
+
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        vm = nova()
+        inicio = time.perf_counter()
+        saida = executar_silencioso(vm)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    vm = nova()
+    vm.perfilar = True
+    executar_silencioso(vm)
+    return melhor, vm.perfil.total_instrucoes(), saida
+
+
+def comparar(titulo, fonte, repeticoes=3):
+    sem_otimizacao = compilar_programa(fonte)
+    otimizado = compilar_programa(fonte, nivel=1)
+
+    versoes = {
+        "-O0": (sem_otimizacao.layout, sem_otimizacao.linhas),
+        "-O1 sem o movimento": sem_movimento(fonte),
+        "-O1": (otimizado.layout, otimizado.linhas),
+    }
+
+    print(f"--- {titulo} ---")
+    print(f"Árvore: {otimizado.relatorio['arvore']}")
+    for tipada in (False, True):
+        resultados = {nome: executar(linhas, layout, tipada, repeticoes)
+                      for nome, (layout, linhas) in versoes.items()}
+
+        # Tirar as contas do laço não pode mudar o que o programa imprime
+        saidas = {saida for _, _, saida in resultados.values()}
+        assert len(saidas) == 1, f"{titulo}: saída diferente entre as versões"
+
+        print(f"Memória {'tipada' if tipada else 'em lista'}:")
+        print(f"{'':<22} {'Executadas':>12} {'Tempo':>10}")
+        base = resultados["-O0"][1]
+        for nome, (tempo, executadas, _) in resultados.items():
+            print(f"{nome:<22} {executadas:>12,} {tempo:8.4f} s  ({100 * executadas / base:5.1f}%)")
+    print()
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    comparar(f"Laços aninhados, {iteracoes} voltas no laço de dentro", programa_invariantes(iteracoes))
+
+
+if __name__ == '__main__':
+    main()
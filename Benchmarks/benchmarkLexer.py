@@ -0,0 +1,129 @@
+# ==============================================================================
+# BENCHMARK: LEXER DO PLY x LEXER RÁPIDO
+# ==============================================================================
+# Primeiro confere que o lexer rápido (AnalisadorSintatico/lexerRapido.py)
+# gera exatamente os mesmos tokens (tipo, valor, linha e posição) e as mesmas
+# mensagens de erro léxico que o lexer do PLY, num conjunto de fontes com os
+# casos difíceis (comentários nos dois formatos, comentário sem fim, números
+# colados em pontos, palavras reservadas em maiúsculas, caracteres ilegais,
+# espaços no fim do fonte...).
+# Depois mede tokens/s dos dois lexers num fonte grande e o tempo de compilação
+# completo com cada um.
+#
+# Uso: python Benchmarks/benchmarkLexer.py [comandos]
+
+import sys
+import os
+import io
+import gc
+import time
+import contextlib
+
+from programas import DIRETORIO_RAIZ, programa_laco
+from benchmarkTokens import programa_grande
+from AnalisadorSintatico import analisadorSintatico
+
+CASOS_DIFICEIS = [
+    "",
+    "\n\n\t  \n",
+    "program x {comentário\ncom quebra} var a1_: integer; /* outro\n*comentário */ a := 1.5 + 2. - 3 / (4*5) $",
+    "BEGIN End WhIlE x<>y<=z>=w<v>u=t:=:, .5 1.. 007 3.14159 a/b/*c*/d",
+    "/* comentário sem fim a := 1",
+    "{ chave sem fim\n a := 1",
+    "a := 1 @ b # c ? d\r\n e := 2 ! 'f'",
+    "x:=y;z:=x*(y+1)-2/3\n\n\nwrite(z)\n",
+    "٣ 12٣.5 ident_com_ç",
+    "program x begin write(1) end. ",
+    "a := 1\t \t",
+    " \t",
+]
+
+
+def listar_tokens(lexer, fonte):
+    """ Lista de (tipo, valor, linha, posição) e as mensagens de erro léxico guardadas pelo lexer """
+    lexer = lexer.clone()
+    lexer.lineno = 1
+    lexer.erros_lexicos = [] # Como no Compilador.analisar
+    lexer.input(fonte)
+    tokens = []
+    while True:
+        tok = lexer.token()
+        if tok is None: break
+        tokens.append((tok.type, tok.value, tok.lineno, tok.lexpos))
+    return tokens, lexer.erros_lexicos
+
+
+def conferir(fontes):
+    """ Os dois lexers têm que concordar em todos os fontes """
+    ply = analisadorSintatico.obter_lexer()
+    rapido = analisadorSintatico.obter_lexer_rapido()
+    for i, fonte in enumerate(fontes):
+        esperado = listar_tokens(ply, fonte)
+        obtido = listar_tokens(rapido, fonte)
+        assert obtido == esperado, f"fonte {i}: tokens diferentes entre o PLY e o lexer rápido"
+
+
+def tokens_por_segundo(lexer, fonte, repeticoes=5):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        meu_lexer = lexer.clone()
+        gc.collect()
+        inicio = time.perf_counter()
+        meu_lexer.input(fonte)
+        token = meu_lexer.token
+        quantidade = 0
+        while token():
+            quantidade += 1
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return quantidade / melhor
+
+
+def compilar(fonte, lexer_rapido):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return analisadorSintatico.Compilador(lexer_rapido=lexer_rapido).compilar(fonte)
+
+
+def tempos_compilacao(fonte, repeticoes=5):
+    """
+    Melhor tempo de compilação com cada lexer; devolve {lexer_rapido: tempo}.
+    Os dois se revezam a cada rodada, para a variação da máquina pesar igual.
+    """
+    melhor = {False: float('inf'), True: float('inf')}
+    for _ in range(repeticoes):
+        for lexer_rapido in melhor:
+            gc.collect()
+            inicio = time.perf_counter()
+            compilar(fonte, lexer_rapido)
+            melhor[lexer_rapido] = min(melhor[lexer_rapido], time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    comandos = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    with open(os.path.join(DIRETORIO_RAIZ, 'Dados', 'codigo.txt'), 'r', encoding='utf-8') as f:
+        exemplo = f.read()
+    fonte = programa_grande(comandos)
+    conferir(CASOS_DIFICEIS + [exemplo, programa_laco(10), fonte])
+    print(f"Tokens idênticos ao PLY em {len(CASOS_DIFICEIS) + 3} fontes")
+
+    print(f"\nFonte com {len(fonte) / 1e6:.1f} MB ({len(fonte.splitlines())} linhas)")
+    ply = tokens_por_segundo(analisadorSintatico.obter_lexer(), fonte)
+    rapido = tokens_por_segundo(analisadorSintatico.obter_lexer_rapido(), fonte)
+    print(f"{'Lexer do PLY':<16} {ply:>12,.0f} tokens/s")
+    print(f"{'Lexer rápido':<16} {rapido:>12,.0f} tokens/s  {rapido / ply:.2f}x")
+
+    # Trocar o lexer não pode mudar o código objeto nem o mapa do fonte
+    programa_ply, programa_rapido = compilar(fonte, False), compilar(fonte, True)
+    assert programa_rapido.linhas == programa_ply.linhas, "código objeto diferente com o lexer rápido"
+    assert programa_rapido.mapa.codificar() == programa_ply.mapa.codificar(), "mapa do fonte diferente"
+    del programa_ply, programa_rapido
+
+    tempos = tempos_compilacao(fonte)
+    tempo_ply, tempo_rapido = tempos[False], tempos[True]
+    print(f"\nCompilação completa com o lexer do PLY: {tempo_ply:8.4f} s")
+    print(f"Compilação completa com o lexer rápido: {tempo_rapido:8.4f} s  {tempo_ply / tempo_rapido:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# ==============================================================================
+# BENCHMARK: MEMÓRIA EM LISTA x MEMÓRIA TIPADA
+# ==============================================================================
+# Compila um programa com muitas variáveis INTEGER e REAL e executa com a
+# memória padrão da MaquinaHipotetica (lista que cresce com ALME) e com a
+# memória tipada (array('q')/array('d') reservados na carga a partir do
+# layout de dados). Compara o tempo, os bytes ocupados pelos valores e
+# confere que a saída é a mesma.
+#
+# Uso: python Benchmarks/benchmarkMemoria.py [variaveis] [iteracoes]
+
+import sys
+import time
+
+from programas import compilar_programa, executar_silencioso
+from CodigoObjeto import executor, memoriaTipada
+
+
+def programa_muitas_variaveis(variaveis, iteracoes):
+    """ Laço que lê e escreve 'variaveis' inteiros e reais a cada volta """
+    inteiros = [f"v{i}" for i in range(variaveis)]
+    reais = [f"r{i}" for i in range(variaveis)]
+    corpo = []
+    for i in range(variaveis):
+        corpo.append(f"    v{i} := v{i} + i;")
+        corpo.append(f"    r{i} := r{i} + 0.5;")
+    return f"""program memoria
+var i, n: integer;
+var {', '.join(inteiros)}: integer;
+var {', '.join(reais)}: real
+begin
+  n := {iteracoes};
+  i := 0;
+  while i < n do
+{chr(10).join(corpo)}
+    i := i + 1
+  $
+  write(v{variaveis - 1});
+  write(r{variaveis - 1})
+end.
+"""
+
+
+def bytes_lista(dados):
+    """ Bytes da lista e dos objetos int/float guardados nela """
+    return sys.getsizeof(dados) + sum(sys.getsizeof(valor) for valor in dados)
+
+
+def medir(linhas, tipada, repeticoes=3):
+    """ Melhor tempo de execução; devolve (tempo, saída, máquina) """
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        vm = executor.MaquinaHipotetica(memoria_tipada=tipada)
+        vm.layout = memoriaTipada.extrair_layout(linhas)
+        vm.decodificar(linhas)
+        inicio = time.perf_counter()
+        saida = executar_silencioso(vm)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, saida, vm
+
+
+def main():
+    variaveis = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    iteracoes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    linhas = compilar_programa(programa_muitas_variaveis(variaveis, iteracoes)).linhas_anotadas()
+    layout = memoriaTipada.extrair_layout(linhas)
+
+    tempo_lista, saida_lista, vm_lista = medir(linhas, False)
+    tempo_tipada, saida_tipada, _ = medir(linhas, True)
+
+    # A memória tipada não pode mudar o que o programa imprime
+    assert saida_lista == saida_tipada, "saída diferente com a memória tipada"
+
+    print(f"Programa com {len(layout)} variáveis ({layout.count('I')} INTEGER, "
+          f"{layout.count('R')} REAL), {iteracoes} iterações")
+    print(f"Lista:   {tempo_lista:8.4f} s  {bytes_lista(vm_lista.dados):>10,} bytes")
+    print(f"Tipada:  {tempo_tipada:8.4f} s  "
+          f"{memoriaTipada.MemoriaTipada(layout).tamanho_bytes():>10,} bytes")
+    print(f"Ganho: {tempo_lista / tempo_tipada:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
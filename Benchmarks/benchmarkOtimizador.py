@@ -0,0 +1,59 @@
+# ==============================================================================
+# BENCHMARK: OTIMIZADOR PEEPHOLE E SUPERINSTRUÇÕES
+# ==============================================================================
+# Compila o programa de laço e o exemplo do projeto (Dados/codigo.txt), roda o
+# otimizador e compara o tamanho do código objeto e o tempo de execução na
+# MaquinaHipotetica, antes e depois. A saída dos dois programas precisa ser
+# idêntica.
+#
+# Uso: python Benchmarks/benchmarkOtimizador.py [iteracoes]
+
+import sys
+import os
+import time
+
+from programas import DIRETORIO_RAIZ, programa_laco, compilar, nova_maquina, executar_silencioso
+from CodigoObjeto import otimizador
+
+# Entradas do exemplo Dados/codigo.txt (os mesmos valores do README)
+ENTRADA_EXEMPLO = "7.5\n2\n3\n4\n5\n1\n"
+
+
+def medir(linhas, entrada="", repeticoes=3):
+    """ Melhor tempo de execução; devolve (tempo, saída impressa) """
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        vm = nova_maquina(linhas, entrada)
+        inicio = time.perf_counter()
+        saida = executar_silencioso(vm)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, saida
+
+
+def comparar(titulo, codigo, entrada="", repeticoes=3):
+    otimizado, relatorio = otimizador.otimizar(codigo, nivel=1)
+    tempo_antes, saida_antes = medir(codigo, entrada, repeticoes)
+    tempo_depois, saida_depois = medir(otimizado, entrada, repeticoes)
+
+    # Otimizar não pode mudar o que o programa faz
+    assert saida_antes == saida_depois, f"{titulo}: saída diferente depois da otimização"
+
+    print(f"--- {titulo} ---")
+    print(f"Instruções: {otimizador.formatar_relatorio(relatorio)}")
+    print(f"Sem otimização: {tempo_antes:8.4f} s")
+    print(f"Com -O1:        {tempo_depois:8.4f} s")
+    print(f"Ganho: {tempo_antes / tempo_depois:.2f}x\n")
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    comparar(f"Laço com {iteracoes} iterações", compilar(programa_laco(iteracoes)))
+
+    with open(os.path.join(DIRETORIO_RAIZ, 'Dados', 'codigo.txt'), 'r', encoding='utf-8') as f:
+        exemplo = compilar(f.read())
+    comparar("Exemplo Dados/codigo.txt", exemplo, ENTRADA_EXEMPLO, repeticoes=200)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# ==============================================================================
+# BENCHMARK: CUSTO DO PERFIL DE EXECUÇÃO
+# ==============================================================================
+# Executa o programa de laço sem perfil e com perfil (laço instrumentado) e
+# mostra o custo da contagem por PC. Sem perfil o tempo deve ser o mesmo de
+# antes do perfilador existir, pois o laço normal não mudou.
+#
+# Uso: python Benchmarks/benchmarkPerfil.py [iteracoes]
+
+import sys
+import time
+
+from programas import programa_laco, compilar, nova_maquina, executar_silencioso
+
+
+def medir(linhas, perfilar, repeticoes=3):
+    """ Melhor tempo de execução; devolve (tempo, máquina) """
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        vm = nova_maquina(linhas)
+        vm.perfilar = perfilar
+        inicio = time.perf_counter()
+        executar_silencioso(vm)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, vm
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    linhas = compilar(programa_laco(iteracoes))
+
+    tempo_normal, _ = medir(linhas, False)
+    tempo_perfil, vm = medir(linhas, True)
+
+    print(f"Laço com {iteracoes} iterações")
+    print(f"Sem perfil: {tempo_normal:8.4f} s")
+    print(f"Com perfil: {tempo_perfil:8.4f} s  (custo {tempo_perfil / tempo_normal:.2f}x)\n")
+    print(vm.perfil.formatar_tabela(limite=5))
+
+
+if __name__ == '__main__':
+    main()
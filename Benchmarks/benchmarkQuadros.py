@@ -0,0 +1,196 @@
+# ==============================================================================
+# BENCHMARK: QUADROS DE ATIVAÇÃO DOS PROCEDIMENTOS
+# ==============================================================================
+# Antes, cada parâmetro e cada local de um procedimento era alocado com um
+# "ALME 1" na entrada e todos eram liberados com um "DESM n" na saída (com
+# -O1, o peephole juntava os ALME num "ALME n"). Agora os parâmetros e as
+# locais formam o quadro de ativação do procedimento: o ENPR guarda e zera o
+# quadro inteiro com uma fatia, e o SAPR devolve os valores guardados (ver o
+# tratador enpr em CodigoObjeto/executor.py). Cada ativação tem os seus
+# valores, e procedimentos recursivos funcionam.
+#
+# Este script:
+#   - mede chamadas de procedimentos com cada vez mais locais, com o código
+#     de antes (um ALME por variável, ou um ALME só) e com o quadro. A saída
+#     impressa precisa ser a mesma, com a memória em lista e na tipada;
+#   - roda procedimentos recursivos (fatorial e Fibonacci), que antes nem
+#     compilavam, em todos os modos da máquina.
+#
+# Uso: python Benchmarks/benchmarkQuadros.py [chamadas]
+
+import sys
+import io
+import time
+import contextlib
+
+from programas import compilar_programa, executar_silencioso, executor, entradaSaida
+from CodigoObjeto import otimizador
+from CodigoObjeto.instrucoes import ENPR, SAPR, ALME, DESM
+
+
+def programa_chamadas(chamadas, locais):
+    """ Laço que chama um procedimento com 'locais' variáveis locais """
+    nomes = ', '.join(f"l{k}" for k in range(locais))
+    return f"""program quadros
+var i, n, s: integer;
+
+procedure acumula (v: integer)
+  var {nomes}: integer
+begin
+  l0 := v + 1;
+  l{locais - 1} := l0 * 2;
+  s := s + l{locais - 1} - v
+end
+
+begin
+  n := {chamadas};
+  i := 0;
+  s := 0;
+  while i < n do
+    acumula(i);
+    i := i + 1
+  $
+  write(s)
+end.
+"""
+
+
+def programa_recursivo(n):
+    """ Fatorial e Fibonacci recursivos """
+    return f"""program recursivo
+var n, r, f: integer;
+
+procedure fatorial (k: integer)
+  var anterior: integer
+begin
+  if k <= 1 then
+    r := 1
+  else
+    anterior := k - 1;
+    fatorial(anterior);
+    r := r * k
+  $
+end;
+
+procedure fibonacci (k: integer)
+  var a, b, km1, km2: integer
+begin
+  if k < 2 then
+    f := k
+  else
+    km1 := k - 1;
+    km2 := k - 2;
+    fibonacci(km1);
+    a := f;
+    fibonacci(km2);
+    b := f;
+    f := a + b
+  $
+end
+
+begin
+  n := {n};
+  fatorial(n);
+  write(r);
+  fibonacci(n);
+  write(f)
+end.
+"""
+
+
+def codigo_legado(linhas, um_por_variavel):
+    """
+    O código de antes: cada "ENPR a n" vira n "ALME 1" (ou um "ALME n", como
+    o peephole deixava) e cada "SAPR a n" vira "DESM n", com os desvios
+    realocados
+    """
+    novo = []
+    novo_endereco = []
+    for instrucao in otimizador.decodificar_programa(linhas):
+        novo_endereco.append(len(novo))
+        if instrucao.op == ENPR:
+            _, n = instrucao.arg
+            novo.extend([otimizador.Instrucao(ALME, 1) for _ in range(n)] if um_por_variavel
+                        else [otimizador.Instrucao(ALME, n)])
+        elif instrucao.op == SAPR:
+            novo.append(otimizador.Instrucao(DESM, instrucao.arg[1]))
+        else:
+            novo.append(instrucao)
+    novo_endereco.append(len(novo))
+    otimizador.realocar_desvios(novo, novo_endereco)
+    return [instrucao.formatar() for instrucao in novo]
+
+
+def executar(versoes, layout, tipada, repeticoes):
+    """
+    Melhor tempo e saída impressa de cada versão, rodando as versões
+    intercaladas (uma volta de cada por repetição)
+    """
+    resultados = {nome: (float('inf'), None) for nome in versoes}
+    for _ in range(repeticoes):
+        for nome, linhas in versoes.items():
+            vm = executor.MaquinaHipotetica(memoria_tipada=tipada,
+                                            entrada=entradaSaida.EntradaArquivo(io.StringIO("")))
+            vm.decodificar(linhas)
+            vm.layout = layout
+            inicio = time.perf_counter()
+            saida = executar_silencioso(vm)
+            tempo = time.perf_counter() - inicio
+            resultados[nome] = (min(resultados[nome][0], tempo), saida)
+    return resultados
+
+
+def executar_compilado(linhas):
+    """ Tempo e saída impressa no backend Python """
+    vm = executor.MaquinaHipotetica(entrada=entradaSaida.EntradaArquivo(io.StringIO("")))
+    vm.decodificar(linhas)
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(saida):
+        vm.executar_compilado()
+    return time.perf_counter() - inicio, saida.getvalue()
+
+
+def main():
+    chamadas = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+
+    print(f"--- {chamadas} chamadas de um procedimento com L locais (-O0) ---")
+    print(f"{'L':>4} {'Memória':<8} {'ALME 1 cada':>12} {'ALME n':>10} {'Quadro':>10} {'Ganho':>7}")
+    for locais in (1, 4, 16, 64):
+        programa = compilar_programa(programa_chamadas(chamadas, locais))
+        versoes = {
+            "ALME 1 cada": codigo_legado(programa.linhas, um_por_variavel=True),
+            "ALME n": codigo_legado(programa.linhas, um_por_variavel=False),
+            "Quadro": programa.linhas,
+        }
+        for tipada in (False, True):
+            resultados = executar(versoes, programa.layout, tipada, repeticoes=5)
+
+            # Trocar a alocação das locais não pode mudar o que o programa imprime
+            saidas = {saida for _, saida in resultados.values()}
+            assert len(saidas) == 1, "saída diferente entre as versões"
+
+            tempos = [resultados[nome][0] for nome in versoes]
+            print(f"{locais:>4} {'tipada' if tipada else 'lista':<8} "
+                  + ' '.join(f"{tempo:8.4f} s" for tempo in tempos)
+                  + f" {tempos[0] / tempos[-1]:6.2f}x")
+
+    n = 20
+    print(f"\n--- Recursão: fatorial e Fibonacci de {n} ---")
+    saidas = set()
+    for nivel in (0, 1):
+        programa = compilar_programa(programa_recursivo(n), nivel=nivel)
+        for tipada in (False, True):
+            (tempo, saida), = executar({"": programa.linhas}, programa.layout, tipada, repeticoes=3).values()
+            saidas.add(saida)
+            print(f"-O{nivel}, {'memória tipada' if tipada else 'memória em lista':<17} {tempo:8.4f} s")
+        tempo, saida = executar_compilado(programa.linhas)
+        saidas.add(saida)
+        print(f"-O{nivel}, {'backend Python':<17} {tempo:8.4f} s")
+    # Todos os modos precisam dar o mesmo resultado
+    assert len(saidas) == 1, "saída diferente entre os modos"
+    print(' '.join(linha for linha in saidas.pop().splitlines() if linha.startswith("SAÍDA")))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+# ==============================================================================
+# BENCHMARK: TABELA DE SÍMBOLOS
+# ==============================================================================
+# Antes, cada escopo era um dicionário nome -> {'tipo', 'endereco',
+# 'categoria'} e a busca percorria os escopos do mais interno para o mais
+# externo, uma vez para o endereço e outra para o tipo. Agora um dicionário
+# só leva cada nome à pilha dos seus símbolos (objetos com __slots__), e a
+# busca combinada (AnalisadorSemantico.resolver) devolve o endereço e o tipo
+# de uma vez, sem depender de quantos escopos estão abertos.
+#
+# Este script compara as duas tabelas:
+#   - com milhares de globais, buscadas de dentro de escopos cada vez mais
+#     fundos (o LALG só tem dois níveis, mas a tabela não sabe disso);
+#   - compilando um programa com milhares de variáveis e procedimentos.
+# As duas tabelas precisam dar o mesmo endereço e o mesmo tipo para todo nome.
+#
+# Uso: python Benchmarks/benchmarkSimbolos.py [variaveis]
+
+import sys
+import time
+
+from programas import compilar_programa
+from analisadorSemantico import AnalisadorSemantico # A pasta entra no sys.path com o Compilador
+
+
+class SemanticoLegado:
+    """ Reprodução da tabela antiga (só o que o benchmark usa) """
+
+    def __init__(self):
+        self.tabela_escopos = [{}]
+        self.contador_memoria = 0
+
+    def entrar_escopo(self):
+        self.tabela_escopos.append({})
+
+    def sair_escopo(self):
+        self.tabela_escopos.pop()
+
+    def adicionar_variavel(self, nome, tipo, categoria='var'):
+        escopo_atual = self.tabela_escopos[-1]
+        if nome in escopo_atual:
+            raise Exception(f"Erro Semântico: A variável '{nome}' já foi declarada neste escopo.")
+        escopo_atual[nome] = {'tipo': tipo.upper(), 'endereco': self.contador_memoria, 'categoria': categoria}
+        self.contador_memoria += 1
+        return self.contador_memoria - 1
+
+    def verificar_declaracao(self, nome):
+        for escopo in reversed(self.tabela_escopos):
+            if nome in escopo:
+                return escopo[nome]['endereco']
+        raise Exception(f"Erro Semântico: A variável '{nome}' não foi declarada.")
+
+    def obter_tipo(self, nome):
+        for escopo in reversed(self.tabela_escopos):
+            if nome in escopo:
+                return escopo[nome]['tipo']
+        raise Exception(f"Erro Semântico: A variável '{nome}' não foi declarada.")
+
+
+def montar_tabela(classe, variaveis, profundidade):
+    """ 'variaveis' globais e 'profundidade' escopos abertos, cada um com 2 locais """
+    tabela = classe()
+    for i in range(variaveis):
+        tabela.adicionar_variavel(f"g{i}", 'real' if i % 3 == 0 else 'integer')
+    for nivel in range(profundidade):
+        tabela.entrar_escopo()
+        tabela.adicionar_variavel(f"l{nivel}", 'integer')
+        tabela.adicionar_variavel(f"g{nivel}", 'real') # Esconde uma global
+    return tabela
+
+
+def buscas_legado(tabela, nomes):
+    # O gerador buscava o endereço e o tipo separados
+    return [(tabela.verificar_declaracao(nome), tabela.obter_tipo(nome)) for nome in nomes]
+
+
+def buscas_novas(tabela, nomes):
+    resultado = []
+    for nome in nomes:
+        simbolo = tabela.resolver(nome)
+        resultado.append((simbolo.endereco, simbolo.tipo))
+    return resultado
+
+
+def medir(funcao, *args, repeticoes=5):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(*args)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def programa_muitas_variaveis(variaveis, procedimentos):
+    """ Muitas globais, e procedimentos com locais que usam as globais """
+    globais = ', '.join(f"g{i}" for i in range(variaveis))
+    declaracoes = []
+    for k in range(procedimentos):
+        usos = '; '.join(f"l{k} := l{k} + g{(k * 7 + j) % variaveis}" for j in range(20))
+        declaracoes.append(f"procedure p{k} (v{k}: integer)\n  var l{k}, g{k}: integer\n"
+                           f"begin\n  {usos};\n  g{k} := l{k} + v{k}\nend")
+    chamadas = '; '.join(f"p{k}(g{k})" for k in range(procedimentos))
+    usos = '; '.join(f"g{i} := g{(i + 1) % variaveis} + {i}" for i in range(variaveis))
+    return (f"program simbolos\nvar {globais}: integer;\n" + ';\n'.join(declaracoes) +
+            f"\nbegin\n  {usos};\n  {chamadas}\nend.\n")
+
+
+def main():
+    variaveis = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    print(f"--- Buscas de {variaveis} globais (endereço e tipo) ---")
+    print(f"{'Escopos abertos':<16} {'Antes':>10} {'Agora':>10} {'Ganho':>8}")
+    for profundidade in (1, 10, 100, 1000):
+        legado = montar_tabela(SemanticoLegado, variaveis, profundidade)
+        nova = montar_tabela(AnalisadorSemantico, variaveis, profundidade)
+        nomes = [f"g{i}" for i in range(variaveis)] * 4
+        tempo_antes, esperado = medir(buscas_legado, legado, nomes)
+        tempo_agora, obtido = medir(buscas_novas, nova, nomes)
+        # As duas tabelas precisam achar o mesmo símbolo (inclusive os escondidos)
+        assert obtido == esperado, "tabela nova diferente da antiga"
+        print(f"{profundidade + 1:<16} {tempo_antes:8.4f} s {tempo_agora:8.4f} s {tempo_antes / tempo_agora:7.2f}x")
+
+    procedimentos = max(variaveis // 10, 1)
+    fonte = programa_muitas_variaveis(variaveis, procedimentos)
+    tempo, programa = medir(compilar_programa, fonte, repeticoes=3)
+    print(f"\n--- Compilação: {variaveis} globais, {procedimentos} procedimentos ---")
+    print(f"{len(programa.linhas):,} instruções em {tempo:.4f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# ==============================================================================
+# BENCHMARK: ANÁLISE LÉXICA EM UMA PASSADA
+# ==============================================================================
+# Compila um programa LALG grande de três jeitos:
+#   - duas passadas (como era o main.py): um lexer só para montar a lista de
+#     tokens formatados e gravar o tokens.txt, e depois o parser lexando tudo
+#     de novo;
+#   - uma passada, com o tokens.txt escrito enquanto o parser lê os tokens;
+#   - uma passada, sem tokens.txt (--sem-tokens).
+# Mede o tempo e o pico de memória alocada. O tokens.txt e o código objeto
+# precisam sair iguais.
+#
+# Uso: python Benchmarks/benchmarkTokens.py [comandos]
+
+import sys
+import io
+import os
+import gc
+import tempfile
+import time
+import tracemalloc
+import contextlib
+
+from programas import compilar_programa
+from AnalisadorSintatico import analisadorSintatico
+
+
+def programa_grande(comandos):
+    """ Programa com 'comandos' grupos de atribuição, if e write seguidos """
+    corpo = []
+    for i in range(comandos):
+        corpo.append(f"  a := (a + {i}) * 2 - a / 3;")
+        corpo.append(f"  if a > {i} then b := b + 1.5 else b := b - 0.5 $")
+        corpo.append("  write(a);")
+    return "program grande\nvar a: integer;\nvar b: real\nbegin\n  a := 0;\n  b := 0.0;\n" + \
+           "\n".join(corpo) + "\n  write(b)\nend.\n"
+
+
+# Os jeitos que geram o tokens.txt gravam num arquivo de verdade, como o main.py
+ARQUIVO_TOKENS = os.path.join(tempfile.gettempdir(), 'benchmark_tokens.txt')
+
+
+def ler_tokens():
+    with open(ARQUIVO_TOKENS) as f:
+        return f.read()
+
+
+def duas_passadas(fonte):
+    """ O fluxo antigo: lista com todos os tokens, tokens.txt, e o parser lexando de novo """
+    lexer = analisadorSintatico.obter_lexer().clone()
+    lexer.lineno = 1
+    lexer.input(fonte)
+    lista_saida = []
+    while True:
+        tok = lexer.token()
+        if not tok: break
+        lista_saida.append(analisadorSintatico.formatar_token(tok))
+    with open(ARQUIVO_TOKENS, 'w') as f:
+        for linha in lista_saida: f.write(linha + '\n')
+    return compilar_programa(fonte)
+
+
+def uma_passada(fonte):
+    with open(ARQUIVO_TOKENS, 'w') as f, contextlib.redirect_stdout(io.StringIO()):
+        return analisadorSintatico.Compilador().compilar(fonte, tokens=f)
+
+
+def sem_tokens(fonte):
+    return compilar_programa(fonte)
+
+
+VARIANTES = {
+    "Duas passadas": duas_passadas,
+    "Uma passada, com tokens.txt": uma_passada,
+    "Uma passada, --sem-tokens": sem_tokens,
+}
+
+
+def pico_memoria(funcao, fonte):
+    """ Pico de memória alocada (bytes) durante uma compilação """
+    tracemalloc.start()
+    funcao(fonte)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico
+
+
+def main():
+    comandos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeticoes = 5
+    fonte = programa_grande(comandos)
+
+    referencia = duas_passadas(fonte)
+    tokens_referencia = ler_tokens()
+    os.remove(ARQUIVO_TOKENS)
+    programa = uma_passada(fonte)
+    # Uma passada só não pode mudar o código objeto nem o tokens.txt
+    assert programa.linhas == referencia.linhas, "código objeto diferente em uma passada"
+    assert ler_tokens() == tokens_referencia, "tokens.txt diferente em uma passada"
+    assert sem_tokens(fonte).linhas == referencia.linhas, "código objeto diferente sem tokens.txt"
+
+    # As variantes se revezam a cada rodada, para a variação da máquina pesar igual em todas
+    melhor = dict.fromkeys(VARIANTES, float('inf'))
+    for _ in range(repeticoes):
+        for nome, funcao in VARIANTES.items():
+            gc.collect()
+            inicio = time.perf_counter()
+            funcao(fonte)
+            melhor[nome] = min(melhor[nome], time.perf_counter() - inicio)
+
+    print(f"Programa com {len(fonte.splitlines())} linhas, {tokens_referencia.count(chr(10))} tokens")
+    print(f"{'':<28} {'Tempo':>10} {'Pico de memória':>16}")
+    for nome, funcao in VARIANTES.items():
+        ganho = melhor["Duas passadas"] / melhor[nome]
+        print(f"{nome:<28} {melhor[nome]:8.4f} s {pico_memoria(funcao, fonte):>14,} B  {ganho:5.2f}x")
+    os.remove(ARQUIVO_TOKENS)
+
+
+if __name__ == '__main__':
+    main()
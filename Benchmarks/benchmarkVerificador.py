@@ -0,0 +1,254 @@
+# ==============================================================================
+# BENCHMARK: VERIFICADOR DO CÓDIGO OBJETO
+# ==============================================================================
+# Antes, cada tratador conferia a pilha antes de tirar valores dela ("if
+# sp < 1" nas contas e comparações, "if sp < 0" no ARMZ, IMPR e DSVF), e o
+# laço principal aumentava a pilha quando ela enchia (IndexError). Agora a
+# máquina confere o programa inteiro uma vez, antes da primeira instrução
+# (ver CodigoObjeto/verificador.py): a profundidade da pilha em cada PC, os
+# destinos dos desvios e os endereços de dados. A pilha é reservada com a
+# profundidade máxima calculada, e os tratadores não conferem mais nada.
+#
+# Este script:
+#   - roda o mesmo laço com uma tabela de tratadores com as checagens de
+#     antes e com os tratadores sem checagem (só as instruções que o
+#     programa usa). A saída precisa ser a mesma;
+#   - mede o tempo do verificador em programas cada vez maiores;
+#   - mostra programas que o verificador recusa antes de executar.
+#
+# Uso: python Benchmarks/benchmarkVerificador.py [iteracoes]
+
+import sys
+import time
+
+from programas import compilar_programa, programa_laco, nova_maquina
+from verificador import ErroVerificacao # A pasta entra no sys.path com a máquina
+from CodigoObjeto.instrucoes import *
+
+
+def tratadores_com_checagem(pilha, dados, saida):
+    """ Como eram os tratadores: conferem a pilha antes de tirar valores """
+    sp = -1
+
+    def crct(arg, pc):
+        nonlocal sp
+        pilha[sp + 1] = arg
+        sp += 1
+        return pc + 1
+
+    def crvl(arg, pc):
+        nonlocal sp
+        pilha[sp + 1] = dados[arg]
+        sp += 1
+        return pc + 1
+
+    def armz(arg, pc):
+        nonlocal sp
+        if sp < 0: sys.exit(1)
+        dados[arg] = pilha[sp]
+        sp -= 1
+        return pc + 1
+
+    def soma(arg, pc):
+        nonlocal sp
+        if sp < 1: sys.exit(1)
+        sp -= 1
+        pilha[sp] = pilha[sp] + pilha[sp + 1]
+        return pc + 1
+
+    def subt(arg, pc):
+        nonlocal sp
+        if sp < 1: sys.exit(1)
+        sp -= 1
+        pilha[sp] = pilha[sp] - pilha[sp + 1]
+        return pc + 1
+
+    def mult(arg, pc):
+        nonlocal sp
+        if sp < 1: sys.exit(1)
+        sp -= 1
+        pilha[sp] = pilha[sp] * pilha[sp + 1]
+        return pc + 1
+
+    def cmen(arg, pc):
+        nonlocal sp
+        if sp < 1: sys.exit(1)
+        sp -= 1
+        pilha[sp] = 1 if pilha[sp] < pilha[sp + 1] else 0
+        return pc + 1
+
+    def dsvf(arg, pc):
+        nonlocal sp
+        if sp < 0: sys.exit(1)
+        sp -= 1
+        return pc + 1 if pilha[sp + 1] else arg
+
+    def impr(arg, pc):
+        nonlocal sp
+        if sp < 0: sys.exit(1)
+        saida.append(pilha[sp])
+        sp -= 1
+        return pc + 1
+
+    return {CRCT: crct, CRVL: crvl, ARMZ: armz, SOMA: soma, SUBT: subt, MULT: mult,
+            CMEN: cmen, DSVF: dsvf, IMPR: impr}
+
+
+def tratadores_sem_checagem(pilha, dados, saida):
+    """ Como são agora: o verificador já provou que a pilha tem os valores """
+    sp = -1
+
+    def crct(arg, pc):
+        nonlocal sp
+        pilha[sp + 1] = arg
+        sp += 1
+        return pc + 1
+
+    def crvl(arg, pc):
+        nonlocal sp
+        pilha[sp + 1] = dados[arg]
+        sp += 1
+        return pc + 1
+
+    def armz(arg, pc):
+        nonlocal sp
+        dados[arg] = pilha[sp]
+        sp -= 1
+        return pc + 1
+
+    def soma(arg, pc):
+        nonlocal sp
+        sp -= 1
+        pilha[sp] = pilha[sp] + pilha[sp + 1]
+        return pc + 1
+
+    def subt(arg, pc):
+        nonlocal sp
+        sp -= 1
+        pilha[sp] = pilha[sp] - pilha[sp + 1]
+        return pc + 1
+
+    def mult(arg, pc):
+        nonlocal sp
+        sp -= 1
+        pilha[sp] = pilha[sp] * pilha[sp + 1]
+        return pc + 1
+
+    def cmen(arg, pc):
+        nonlocal sp
+        sp -= 1
+        pilha[sp] = 1 if pilha[sp] < pilha[sp + 1] else 0
+        return pc + 1
+
+    def dsvf(arg, pc):
+        nonlocal sp
+        sp -= 1
+        return pc + 1 if pilha[sp + 1] else arg
+
+    def impr(arg, pc):
+        nonlocal sp
+        saida.append(pilha[sp])
+        sp -= 1
+        return pc + 1
+
+    return {CRCT: crct, CRVL: crvl, ARMZ: armz, SOMA: soma, SUBT: subt, MULT: mult,
+            CMEN: cmen, DSVF: dsvf, IMPR: impr}
+
+
+def executar_tratadores(fabrica, opcodes, argumentos, profundidade, checar):
+    """
+    Laço de tratadores com o código objeto genérico do programa_laco.
+    'checar' = como antes: pilha pequena que cresce no IndexError do laço.
+    """
+    pilha = [0] * (1 if checar else profundidade)
+    dados = [0] * 4
+    saida = []
+    tabela = fabrica(pilha, dados, saida)
+    seguir = lambda arg, pc: pc + 1
+    tabela.update({INPP: seguir, ALME: seguir, DSVI: lambda arg, pc: arg,
+                   PARA: lambda arg, pc: len(opcodes)})
+    codigo = [tabela[op] for op in opcodes]
+    total = len(codigo)
+    pc = 0
+    while True:
+        try:
+            while pc < total:
+                pc = codigo[pc](argumentos[pc], pc)
+            break
+        except IndexError:
+            pilha.extend([0] * len(pilha)) # Só acontece no modo com checagem
+    return saida
+
+
+def medir(funcao, *args, repeticoes=5):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(*args)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def programa_grande(comandos):
+    """ Muitos comandos (contas, if e while aninhados) para medir o verificador """
+    corpo = []
+    for k in range(comandos // 4):
+        corpo.append(f"a := (a + {k}) * b - c;\n"
+                     f"  if a > {k} then b := b + 1 else c := c - 1 $\n"
+                     f"  while c < {k} do c := c + a * 2 $")
+    # Depois do '$' de um if/while não vai ';'
+    return "program grande\nvar a, b, c: integer\nbegin\n  " + "\n  ".join(corpo) + "\n  write(a)\nend.\n"
+
+
+# Programas recusados (o que o verificador diz de cada um)
+PROGRAMAS_INVALIDOS = {
+    "SOMA com um valor na pilha": ['INPP', 'CRCT 1', 'SOMA', 'IMPR', 'PARA'],
+    "Pilhas diferentes na junção": ['INPP', 'CRCT 1', 'DSVF 4', 'CRCT 2', 'IMPR', 'PARA'],
+    "Laço que empilha sem parar": ['INPP', 'CRCT 1', 'DSVI 1'],
+    "Desvio para fora do programa": ['INPP', 'DSVI 99', 'PARA'],
+    "Endereço de dados negativo": ['INPP', 'CRVL -1', 'IMPR', 'PARA'],
+}
+
+
+def main():
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+
+    programa = compilar_programa(programa_laco(iteracoes))
+    vm = nova_maquina(programa.linhas)
+    profundidade = vm.verificar().profundidade_maxima
+    print(f"--- Laço de {iteracoes} iterações (-O0), pilha máxima {profundidade} ---")
+    # As duas versões rodam intercaladas, para uma variação da máquina no
+    # meio da medida não pesar só para uma delas
+    tempo_antes = tempo_agora = float('inf')
+    for _ in range(25):
+        tempo, saida_antes = medir(executar_tratadores, tratadores_com_checagem,
+                                   vm.opcodes, vm.argumentos, profundidade, True, repeticoes=1)
+        tempo_antes = min(tempo_antes, tempo)
+        tempo, saida_agora = medir(executar_tratadores, tratadores_sem_checagem,
+                                   vm.opcodes, vm.argumentos, profundidade, False, repeticoes=1)
+        tempo_agora = min(tempo_agora, tempo)
+        # Tirar as checagens não pode mudar o que o programa imprime
+        assert saida_antes == saida_agora, "saída diferente entre os tratadores"
+    print(f"Tratadores com checagem {tempo_antes:8.4f} s")
+    print(f"Tratadores sem checagem {tempo_agora:8.4f} s  ({tempo_antes / tempo_agora:.2f}x)")
+
+    print("\n--- Tempo do verificador ---")
+    print(f"{'Comandos':>9} {'Instruções':>11} {'Verificar':>11} {'Por instrução':>14}")
+    for comandos in (400, 4000, 40000):
+        vm = nova_maquina(compilar_programa(programa_grande(comandos)).linhas)
+        tempo, verificacao = medir(vm.verificar)
+        assert verificacao.alcancaveis() > 0
+        print(f"{comandos:>9} {len(vm.opcodes):>11,} {tempo:9.4f} s {tempo / len(vm.opcodes) * 1e6:11.2f} µs")
+
+    print("\n--- Programas recusados antes de executar ---")
+    for nome, linhas in PROGRAMAS_INVALIDOS.items():
+        try:
+            nova_maquina(linhas).verificar()
+        except ErroVerificacao as erro:
+            print(f"{nome:<30} {erro}")
+        else:
+            raise AssertionError(f"o verificador aceitou: {nome}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# ==============================================================================
+# PROGRAMAS LALG PARA OS BENCHMARKS
+# ==============================================================================
+# Funções auxiliares compartilhadas pelos scripts de benchmark: geram programas
+# LALG sintéticos, compilam com o nosso compilador e preparam a máquina.
+
+import sys
+import os
+import io
+import contextlib
+
+# Adiciona a raiz do projeto ao PATH (mesma ideia do main.py)
+DIRETORIO_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(DIRETORIO_RAIZ)
+
+from AnalisadorSintatico import analisadorSintatico
+from CodigoObjeto import executor, entradaSaida
+
+
+def programa_laco(iteracoes):
+    """ Programa dominado por um 'while': soma os números de 0 até iteracoes-1 """
+    return f"""program laco
+var i, n, s, t: integer
+begin
+  n := {iteracoes};
+  i := 0;
+  s := 0;
+  while i < n do
+    t := i * 2;
+    s := s + t - i;
+    i := i + 1
+  $
+  write(s)
+end.
+"""
+
+
+def compilar_programa(codigo_fonte, nivel=0):
+    """ Compila o código LALG e devolve o ProgramaObjeto (linhas e metadados) """
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            return analisadorSintatico.Compilador(nivel).compilar(codigo_fonte)
+        except analisadorSintatico.ErroCompilacao:
+            raise RuntimeError("Falha ao compilar o programa do benchmark")
+
+
+def compilar(codigo_fonte):
+    """ Compila o código LALG e devolve a lista de linhas do código objeto """
+    return compilar_programa(codigo_fonte).linhas
+
+
+def nova_maquina(linhas, entrada=""):
+    """
+    Cria uma máquina com o programa já decodificado. Os valores do 'read'
+    vêm do texto 'entrada', sempre os mesmos (execução determinística).
+    """
+    vm = executor.MaquinaHipotetica(entrada=entradaSaida.EntradaArquivo(io.StringIO(entrada)))
+    vm.decodificar(linhas)
+    return vm
+
+
+def executar_silencioso(vm):
+    """ Executa a máquina descartando a saída; devolve o texto impresso """
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        vm.executar()
+    return saida.getvalue()
@@ -0,0 +1,162 @@
+import sys
+
+# ==============================================================================
+# CANAIS DE ENTRADA E SAÍDA DA MÁQUINA
+# ==============================================================================
+# O LEIT e o IMPR não falam mais direto com input()/print(): a máquina recebe
+# um canal de entrada (qualquer objeto com ler()) e um canal de saída
+# (qualquer objeto com escrever(valor) e descarregar()).
+#
+#   - EntradaInterativa: o comportamento de sempre (pergunta no terminal).
+#     Pode gravar os valores digitados num arquivo para repetir a execução.
+#   - EntradaArquivo: lê TODOS os valores de um arquivo/stream de uma vez, na
+#     criação, e entrega um por LEIT. Serve para execuções em lote e para
+#     repetir uma entrada gravada (execuções determinísticas).
+#   - SaidaPadrao: o comportamento de sempre (um print "SAÍDA: x" por IMPR).
+#   - SaidaBuffer: junta as saídas e escreve em blocos grandes; no modo
+#     "bruto" escreve só o número, sem o "SAÍDA: ".
+#   - EntradaMemoria / SaidaMemoria: os valores vêm de uma lista e vão para
+#     uma lista, sem terminal nem arquivo (para usar a máquina como biblioteca).
+#
+# Erros de execução (aqui e nos tratadores da máquina) levantam ErroExecucao
+# em vez de encerrar o processo: quem chama decide o que fazer (o main.py
+# imprime a mensagem e sai com código 1).
+
+# Quantas saídas a SaidaBuffer junta antes de escrever um bloco
+TAMANHO_BLOCO = 4096
+
+
+def converter_valor(texto):
+    """ Converte o texto lido para int ou float (None se não for numérico) """
+    try:
+        valor = float(texto)
+    except ValueError:
+        return None
+    if valor.is_integer(): valor = int(valor)
+    return valor
+
+
+class ErroExecucao(Exception):
+    """ A execução da máquina parou com erro (a mensagem diz onde e por quê) """
+
+
+def erro_entrada_nao_numerica():
+    raise ErroExecucao("Erro: A entrada deve ser numérica.")
+
+
+def erro_fim_da_entrada():
+    raise ErroExecucao("Entrada encerrada inesperadamente.")
+
+
+class EntradaInterativa:
+    """ Lê cada valor do terminal; com 'gravar_em', grava os valores digitados """
+
+    def __init__(self, gravar_em=None):
+        self.gravacao = open(gravar_em, 'w') if gravar_em else None
+
+    def ler(self):
+        try:
+            valor_lido = input("Digite um valor de entrada: ")
+        except EOFError:
+            erro_fim_da_entrada()
+        valor_num = converter_valor(valor_lido)
+        if valor_num is None:
+            erro_entrada_nao_numerica()
+        if self.gravacao is not None:
+            # Grava na hora: se a execução parar no meio, o que foi lido fica salvo
+            self.gravacao.write(valor_lido.strip() + '\n')
+            self.gravacao.flush()
+        return valor_num
+
+    def fechar(self):
+        if self.gravacao is not None:
+            self.gravacao.close()
+            self.gravacao = None
+
+
+class EntradaArquivo:
+    """
+    Entrada lida de uma só vez: 'origem' é um caminho ou um stream aberto.
+    Os valores são separados por espaços ou quebras de linha e já ficam
+    convertidos, então cada LEIT só pega o próximo da lista.
+    """
+
+    def __init__(self, origem):
+        if isinstance(origem, str):
+            with open(origem, 'r') as f:
+                textos = f.read().split()
+        else:
+            textos = origem.read().split()
+        self.valores = [converter_valor(texto) for texto in textos]
+        self.posicao = 0
+
+    def ler(self):
+        try:
+            valor = self.valores[self.posicao]
+        except IndexError:
+            erro_fim_da_entrada()
+        self.posicao += 1
+        if valor is None:
+            erro_entrada_nao_numerica()
+        return valor
+
+    def fechar(self):
+        pass
+
+
+class EntradaMemoria(EntradaArquivo):
+    """ Entrada com os valores já em memória: uma lista de números (ou textos numéricos) """
+
+    def __init__(self, valores):
+        self.valores = [valor if isinstance(valor, (int, float)) else converter_valor(str(valor))
+                        for valor in valores]
+        self.posicao = 0
+
+
+class SaidaPadrao:
+    """ Um print por IMPR, como a máquina sempre fez """
+
+    def escrever(self, valor):
+        print(f"SAÍDA: {valor}")
+
+    def descarregar(self):
+        pass
+
+
+class SaidaBuffer:
+    """
+    Junta as saídas e escreve em blocos de 'tamanho_bloco' linhas no
+    'destino' (stream com write; padrão: sys.stdout na hora de escrever).
+    Com bruta=True, cada linha é só o valor, sem o "SAÍDA: ".
+    """
+
+    def __init__(self, destino=None, bruta=False, tamanho_bloco=TAMANHO_BLOCO):
+        self.destino = destino
+        self.prefixo = '' if bruta else 'SAÍDA: '
+        self.tamanho_bloco = tamanho_bloco
+        self.linhas = []
+
+    def escrever(self, valor):
+        self.linhas.append(f"{self.prefixo}{valor}\n")
+        if len(self.linhas) >= self.tamanho_bloco:
+            self.descarregar()
+
+    def descarregar(self):
+        if self.linhas:
+            destino = self.destino if self.destino is not None else sys.stdout
+            destino.write(''.join(self.linhas))
+            destino.flush()
+            self.linhas = []
+
+
+class SaidaMemoria:
+    """ Guarda o valor de cada IMPR na lista 'valores', sem escrever nada """
+
+    def __init__(self):
+        self.valores = []
+
+    def escrever(self, valor):
+        self.valores.append(valor)
+
+    def descarregar(self):
+        pass
@@ -1,5 +1,27 @@
 import sys
 import os
+import time
+
+# Adiciona a pasta atual ao path para importar a tabela de instruções
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from instrucoes import *
+import formatoBinario
+import tradutorPython
+import memoriaTipada
+import entradaSaida
+import perfilador
+import mapaFonte
+import verificador
+
+# Erro que interrompe a execução (divisão por zero, entrada inválida, ...):
+# a máquina levanta e quem chama decide o que fazer (ver entradaSaida.py)
+ErroExecucao = entradaSaida.ErroExecucao
+
+
+def mensagem_fim():
+    print("\n--------------------------")
+    print("=== FIM DA EXECUÇÃO ===")
 
 # ==============================================================================
 # MÁQUINA HIPOTÉTICA
@@ -7,260 +29,687 @@ import os
 # Esta classe simula a máquina hipotética que roda as instruções geradas.
 
 class MaquinaHipotetica:
-    def __init__(self):
+    def __init__(self, memoria_tipada=False, entrada=None, saida=None, perfilar=False, verboso=False):
         self.dados = []       # Memória de dados (Variáveis - área D)
+        self.layout = None    # Tipo de cada endereço ('IIRR...'), quando o código objeto traz
+        self.mapa = None      # Mapa PC -> linha do fonte (ver mapaFonte.py), quando o código objeto traz
+        self.memoria_tipada = memoria_tipada # Usa a MemoriaTipada no executar (precisa do layout)
         self.instrucoes = []  # Memória de instruções (Código - área C)
+        self.opcodes = []     # Instruções decodificadas: número do opcode por linha
+        self.argumentos = []  # Instruções decodificadas: argumento já convertido por linha
         self.pilha = []       # Pilha de operandos (Stack - área S)
         self.pc = 0           # Program Counter (Aponta para a linha atual sendo executada)
         self.pilha_retorno = []  # Pilha de endereços de retorno para chamadas de procedimento
+        self.pilha_quadros = []  # Quadros de ativação guardados pelo ENPR (ver tratador enpr)
+        # Canais do LEIT e do IMPR (ver entradaSaida.py); o padrão é o terminal
+        self.entrada = entrada if entrada is not None else entradaSaida.EntradaInterativa()
+        self.saida = saida if saida is not None else entradaSaida.SaidaPadrao()
+        self.perfilar = perfilar # Executa com o laço instrumentado (ver perfilador.py)
+        self.perfil = None       # Resultado do último executar com perfilar=True
+        self.verboso = verboso   # Imprime a carga e o início/fim da execução (o main.py liga)
 
     def carregar(self, caminho):
-        """ Lê o arquivo de texto e carrega as instruções na memória """
-        print(f"--- Carregando programa: {caminho} ---")
+        """ Lê o arquivo (texto ou binário) e carrega as instruções na memória """
+        if self.verboso:
+            print(f"--- Carregando programa: {caminho} ---")
         if not os.path.exists(caminho):
-            print(f"Erro: Arquivo '{caminho}' não encontrado.")
-            sys.exit(1)
+            raise FileNotFoundError(f"Arquivo '{caminho}' não encontrado.")
+
+        if formatoBinario.eh_binario(caminho):
+            self.carregar_binario(caminho)
+        else:
+            linhas = []
+            with open(caminho, 'r') as f:
+                for linha in f:
+                    linha = linha.strip()
+                    if linha:
+                        linhas.append(linha)
+            self.layout = memoriaTipada.extrair_layout(linhas)
+            self.mapa = mapaFonte.extrair_mapa(linhas)
+            self.decodificar(linhas)
+        if self.verboso:
+            print(f"Programa carregado com {len(self.opcodes)} instruções.")
 
-        self.instrucoes = [] # Limpa instruções anteriores
-        with open(caminho, 'r') as f:
-            for linha in f:
-                linha = linha.strip()
-                if linha:
-                    self.instrucoes.append(linha)
-        print(f"Programa carregado com {len(self.instrucoes)} instruções.")
+    def carregar_binario(self, caminho):
+        """
+        Carrega o código objeto no formato binário (ver formatoBinario.py).
+        O arquivo é mapeado na memória e as instruções já chegam como opcodes
+        e argumentos prontos, sem nenhum processamento de texto.
+        """
+        self.instrucoes = [] # Não há texto: use formatoBinario.desmontar para depurar
+        self.opcodes, self.argumentos, secoes = formatoBinario.ler(caminho)
+        layout = secoes.get(memoriaTipada.SECAO_LAYOUT)
+        self.layout = layout.decode('ascii') if layout is not None else None
+        mapa = secoes.get(mapaFonte.SECAO_FONTE)
+        self.mapa = mapaFonte.MapaFonte.decodificar(mapa.decode('ascii')) if mapa is not None else None
+
+    def carregar_programa(self, programa):
+        """
+        Carrega direto da memória o resultado de uma compilação (o
+        ProgramaObjeto do Compilador), sem passar por arquivo: as linhas, o
+        layout de dados e o mapa do fonte vêm do próprio objeto.
+        """
+        self.layout = programa.layout
+        self.mapa = programa.mapa
+        self.decodificar(programa.linhas)
+
+    def onde(self, pc):
+        """ Posição da instrução para as mensagens: o PC e, se houver mapa, a linha do fonte """
+        origem = self.mapa.descrever(pc) if self.mapa is not None else ''
+        return f"Linha {pc}, {origem}" if origem else f"Linha {pc}"
+
+    def decodificar(self, linhas):
+        """
+        Decodifica o programa UMA única vez, antes da execução.
+        Cada linha vira um opcode inteiro (self.opcodes) e um argumento já
+        convertido (self.argumentos), em listas paralelas indexadas pelo PC.
+        Assim o laço de execução não precisa mais mexer com strings.
+        """
+        self.instrucoes = list(linhas) # Mantém o texto original (área C) para depuração
+        self.opcodes = []
+        self.argumentos = []
+        for numero, linha in enumerate(self.instrucoes):
+            op, arg, nome = decodificar_linha(linha)
+            if op == DESCONHECIDA:
+                arg = nome # Guardo o nome para o aviso em tempo de execução
+            elif op in OPS_COM_ENDERECO and arg is not None:
+                if not isinstance(arg, int):
+                    raise ValueError(f"Argumento inválido '{arg}' para {nome} na linha {numero}.")
+            elif op in OPS_COM_DOIS_ARGUMENTOS:
+                posicao_constante = OPS_COM_DOIS_ARGUMENTOS[op]
+                if (not isinstance(arg, tuple) or len(arg) != 2 or
+                        not all(isinstance(parte, int) for i, parte in enumerate(arg) if i != posicao_constante)):
+                    raise ValueError(f"Argumentos inválidos '{arg}' para {nome} na linha {numero}.")
+            self.opcodes.append(op)
+            self.argumentos.append(arg)
+
+    def verificar(self, layout=None, inicio=None):
+        """
+        Confere o programa carregado a partir do ponto em que a execução vai
+        começar ('inicio' ou self.pc, com a pilha e a pilha de retorno atuais) e devolve
+        a Verificacao (ver verificador.py). Levanta ErroVerificacao (um
+        ValueError) se o programa não passar; com o 'layout', os endereços de
+        dados também precisam estar na memória tipada.
+        """
+        return verificador.verificar(self.opcodes, self.argumentos, layout,
+                                     self.pc if inicio is None else inicio,
+                                     len(self.pilha), self.pilha_retorno)
 
     def executar(self):
-        print("\n=== INICIANDO EXECUÇÃO ===")
-        print("--------------------------")
-        
-        # Loop principal: executa instruções enquanto o PC não ultrapassar o código
-        while self.pc < len(self.instrucoes):
-            # Busca a instrução atual apontada pelo Program Counter
-            instrucao = self.instrucoes[self.pc]
-            
-            # Remove comentários inline (tudo após '#')
-            if '#' in instrucao:
-                instrucao = instrucao.split('#')[0].strip()
-            
-            # Pula linhas vazias (após remoção de comentários)
-            if not instrucao: 
-                self.pc += 1  # Avança para próxima linha
-                continue  # Volta ao início do loop sem processar
-
-            # Separa a instrução em partes (ex: "CRCT 10" vira ["CRCT", "10"])
-            partes = instrucao.split()
-            # O operador é sempre a primeira parte (ex: "CRCT", "SOMA", "DSVF")
-            op = partes[0]
-            # Inicializa argumento como None (nem toda instrução tem argumento)
-            arg = None
-            
-            if len(partes) > 1:
-                # Tenta converter argumento para número (int ou float)
+        verboso = self.verboso
+        if verboso:
+            print("\n=== INICIANDO EXECUÇÃO ===")
+            print("--------------------------")
+
+        # O programa é conferido inteiro antes da primeira instrução (ver
+        # verificador.py): nenhuma instrução tira valores de uma pilha vazia
+        # e a pilha nunca passa da profundidade máxima calculada. Por isso os
+        # tratadores não conferem o tamanho da pilha.
+        usar_layout = self.memoria_tipada and self.layout is not None
+        verificacao = self.verificar(self.layout if usar_layout else None)
+
+        # A pilha de operandos é pré-alocada com a profundidade máxima e
+        # controlada por um índice (sp), que aponta para o topo (-1 = pilha
+        # vazia). Assim as instruções não precisam chamar append/pop a cada
+        # operação aritmética.
+        pilha = list(self.pilha) + [0] * (verificacao.profundidade_maxima - len(self.pilha))
+        sp = len(self.pilha) - 1
+        dados = self.dados
+        pilha_retorno = self.pilha_retorno
+        quadros = self.pilha_quadros
+        argumentos = self.argumentos
+        onde = self.onde
+        ler_valor = self.entrada.ler
+        escrever = self.saida.escrever
+
+        # Memória tipada (ver memoriaTipada.py): os endereços dos argumentos
+        # viram células (vetor, índice) aqui, antes do laço
+        memoria = None
+        if usar_layout:
+            memoria = memoriaTipada.MemoriaTipada(self.layout)
+            argumentos = memoria.resolver(self.opcodes, argumentos)
+
+        def crescer_dados(endereco):
+            # Memória não alocada é preenchida com 0 (modo permissivo)
+            dados.extend([0] * (endereco + 1 - len(dados)))
+
+        # --- Tratadores das Instruções ---
+        # Cada tratador recebe (argumento, pc) e devolve o próximo pc.
+        # Eles ficam numa tabela indexada pelo número do opcode, então qualquer
+        # instrução é alcançada em tempo constante (sem cadeia de if/elif).
+
+        def inpp(arg, pc): # Iniciar Programa Principal
+            return pc + 1
+
+        def para(arg, pc): # Parar Programa
+            self.saida.descarregar() # A saída guardada sai antes da mensagem de fim
+            if verboso:
+                mensagem_fim()
+            return total # Faz o laço principal terminar
+
+        def alme(arg, pc): # Alocar Memória
+            dados.extend([0] * arg) # Inicializa variáveis com 0
+            return pc + 1
+
+        # Empilhar = escrever em pilha[sp + 1] e só então incrementar sp.
+        # A pilha já tem o tamanho máximo que o programa usa (ver verificador.py).
+
+        def crct(arg, pc): # Carregar Constante
+            nonlocal sp
+            pilha[sp + 1] = arg
+            sp += 1
+            return pc + 1
+
+        def crvl(arg, pc): # Carregar Valor (de variável)
+            nonlocal sp
+            try:
+                pilha[sp + 1] = dados[arg]
+            except IndexError:
+                # Se tentar acessar memória não alocada, preenche com 0 (modo permissivo)
+                crescer_dados(arg)
+                pilha[sp + 1] = 0
+            sp += 1
+            return pc + 1
+
+        def armz(arg, pc): # Armazenar (em variável)
+            nonlocal sp
+            try:
+                dados[arg] = pilha[sp]
+            except IndexError:
+                dados.extend([0] * (arg + 1 - len(dados)))
+                dados[arg] = pilha[sp]
+            sp -= 1
+            return pc + 1
+
+        def soma(arg, pc): # Soma
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = pilha[sp] + pilha[sp + 1]
+            return pc + 1
+
+        def subt(arg, pc): # Subtração
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = pilha[sp] - pilha[sp + 1]
+            return pc + 1
+
+        def mult(arg, pc): # Multiplicação
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = pilha[sp] * pilha[sp + 1]
+            return pc + 1
+
+        def divi(arg, pc): # Divisão
+            nonlocal sp
+            sp -= 1
+            if pilha[sp + 1] == 0:
+                raise ErroExecucao(f"Erro ({onde(pc)}): Divisão por Zero!")
+            pilha[sp] = pilha[sp] / pilha[sp + 1]
+            return pc + 1
+
+        def impr(arg, pc): # Imprimir
+            nonlocal sp
+            escrever(pilha[sp])
+            sp -= 1
+            return pc + 1
+
+        def leit(arg, pc): # Leitura
+            nonlocal sp
+            valor_num = ler_valor()
+            sp += 1
+            pilha[sp] = valor_num
+            return pc + 1
+
+        def dsvf(arg, pc): # Desvio Se Falso
+            nonlocal sp
+            sp -= 1
+            if pilha[sp + 1]: # Verdadeiro: segue em frente
+                return pc + 1
+            return arg # 0 ou False: desvia
+
+        def dsvi(arg, pc): # Desvio Incondicional
+            return arg
+
+        # Operadores Relacionais (empilham 1 se True, 0 se False)
+        def cpig(arg, pc): # Igual
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = 1 if pilha[sp] == pilha[sp + 1] else 0
+            return pc + 1
+
+        def cdif(arg, pc): # Diferente
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = 1 if pilha[sp] != pilha[sp + 1] else 0
+            return pc + 1
+
+        def cmai(arg, pc): # Maior
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = 1 if pilha[sp] > pilha[sp + 1] else 0
+            return pc + 1
+
+        def cmen(arg, pc): # Menor
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = 1 if pilha[sp] < pilha[sp + 1] else 0
+            return pc + 1
+
+        def cpmi(arg, pc): # Menor Igual
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = 1 if pilha[sp] <= pilha[sp + 1] else 0
+            return pc + 1
+
+        def cpma(arg, pc): # Maior Igual
+            nonlocal sp
+            sp -= 1
+            pilha[sp] = 1 if pilha[sp] >= pilha[sp + 1] else 0
+            return pc + 1
+
+        # --- Comandos Extras (Opcional/Simplificado) ---
+        def pusher(arg, pc): # Empilha endereço de retorno
+            pilha_retorno.append(arg)
+            return pc + 1
+
+        param = crvl # Empilha parâmetro (valor de memória): mesmo efeito do CRVL
+
+        def chpr(arg, pc): # Chamar Procedimento
+            # O procedimento vai desempilhar parâmetros e processar
+            return arg
+
+        def rtpr(arg, pc): # Return Procedure
+            # Retorna para o endereço salvo na pilha de retorno
+            if pilha_retorno:
+                return pilha_retorno.pop()
+            # Se não houver endereço de retorno, é o fim do programa
+            return total
+
+        def desm(arg, pc): # Desalocar memória
+            # Desaloca da área de dados (remove últimas n variáveis; sem argumento = 1)
+            del dados[max(len(dados) - int(arg or 1), 0):]
+            return pc + 1
+
+        # Quadro de ativação: os parâmetros e locais de um procedimento ocupam
+        # sempre as mesmas n posições a partir do endereço a. Na entrada, o
+        # ENPR guarda numa fatia só os valores da ativação anterior (uma
+        # chamada recursiva ainda em andamento) e zera as posições; na saída,
+        # o SAPR devolve os valores guardados. O argumento já chega como
+        # (a, a + n, zeros), montado uma vez antes do laço.
+
+        def enpr(arg, pc): # Entrar no Procedimento
+            a, fim, zeros = arg
+            if fim > len(dados): crescer_dados(fim - 1)
+            quadros.append(dados[a:fim])
+            dados[a:fim] = zeros
+            return pc + 1
+
+        def sapr(arg, pc): # Sair do Procedimento
+            if not quadros:
+                raise ErroExecucao(f"Erro de Execução ({onde(pc)}): SAPR sem quadro de ativação.")
+            dados[arg[0]:arg[1]] = quadros.pop()
+            return pc + 1
+
+        def nada(arg, pc): # Linha vazia (após remoção de comentários)
+            return pc + 1
+
+        def desconhecida(arg, pc):
+            print(f"Aviso ({onde(pc)}): Instrução '{arg}' não implementada ou desconhecida.")
+            return pc + 1
+
+        # --- Superinstruções (geradas pelo otimizador peephole) ---
+        # Fazem o trabalho de duas instruções com um único despacho. Quando a
+        # memória ainda não foi alocada, caem no caminho lento, que reaproveita
+        # os tratadores simples.
+
+        def crv2(arg, pc): # CRVL a; CRVL b
+            nonlocal sp
+            a, b = arg
+            try:
+                valor_a = dados[a]
+                valor_b = dados[b]
+                pilha[sp + 2] = valor_b
+            except IndexError:
+                crvl(a, pc); crvl(b, pc)
+                return pc + 1
+            pilha[sp + 1] = valor_a
+            sp += 2
+            return pc + 1
+
+        def cvct(arg, pc): # CRVL a; CRCT k
+            nonlocal sp
+            a, k = arg
+            try:
+                valor_a = dados[a]
+                pilha[sp + 2] = k
+            except IndexError:
+                crvl(a, pc); crct(k, pc)
+                return pc + 1
+            pilha[sp + 1] = valor_a
+            sp += 2
+            return pc + 1
+
+        def arct(arg, pc): # CRCT k; ARMZ a
+            k, a = arg
+            try:
+                dados[a] = k
+            except IndexError:
+                crescer_dados(a)
+                dados[a] = k
+            return pc + 1
+
+        def copi(arg, pc): # CRVL a; ARMZ b
+            a, b = arg
+            try:
+                dados[b] = dados[a]
+            except IndexError:
+                if a >= len(dados): crescer_dados(a)
+                if b >= len(dados): crescer_dados(b)
+                dados[b] = dados[a]
+            return pc + 1
+
+        def armazenar(arg, valor):
+            try:
+                dados[arg] = valor
+            except IndexError:
+                crescer_dados(arg)
+                dados[arg] = valor
+
+        def soar(arg, pc): # SOMA; ARMZ a
+            nonlocal sp
+            sp -= 2
+            armazenar(arg, pilha[sp + 1] + pilha[sp + 2])
+            return pc + 1
+
+        def suar(arg, pc): # SUBT; ARMZ a
+            nonlocal sp
+            sp -= 2
+            armazenar(arg, pilha[sp + 1] - pilha[sp + 2])
+            return pc + 1
+
+        def muar(arg, pc): # MULT; ARMZ a
+            nonlocal sp
+            sp -= 2
+            armazenar(arg, pilha[sp + 1] * pilha[sp + 2])
+            return pc + 1
+
+        def diar(arg, pc): # DIVI; ARMZ a
+            nonlocal sp
+            if pilha[sp] == 0:
+                raise ErroExecucao(f"Erro ({onde(pc)}): Divisão por Zero!")
+            sp -= 2
+            armazenar(arg, pilha[sp + 1] / pilha[sp + 2])
+            return pc + 1
+
+        # Comparação seguida de DSVF: desvia quando a comparação é falsa
+        def dfig(arg, pc): # CPIG; DSVF L
+            nonlocal sp
+            sp -= 2
+            return pc + 1 if pilha[sp + 1] == pilha[sp + 2] else arg
+
+        def dfdf(arg, pc): # CDIF; DSVF L
+            nonlocal sp
+            sp -= 2
+            return pc + 1 if pilha[sp + 1] != pilha[sp + 2] else arg
+
+        def dfma(arg, pc): # CMAI; DSVF L
+            nonlocal sp
+            sp -= 2
+            return pc + 1 if pilha[sp + 1] > pilha[sp + 2] else arg
+
+        def dfme(arg, pc): # CMEN; DSVF L
+            nonlocal sp
+            sp -= 2
+            return pc + 1 if pilha[sp + 1] < pilha[sp + 2] else arg
+
+        def dfmi(arg, pc): # CPMI; DSVF L
+            nonlocal sp
+            sp -= 2
+            return pc + 1 if pilha[sp + 1] <= pilha[sp + 2] else arg
+
+        def dfpa(arg, pc): # CPMA; DSVF L
+            nonlocal sp
+            sp -= 2
+            return pc + 1 if pilha[sp + 1] >= pilha[sp + 2] else arg
+
+        def lear(arg, pc): # LEIT; ARMZ a
+            armazenar(arg, ler_valor())
+            return pc + 1
+
+        def cvim(arg, pc): # CRVL a; IMPR
+            try:
+                valor = dados[arg]
+            except IndexError:
+                crescer_dados(arg)
+                valor = 0
+            escrever(valor)
+            return pc + 1
+
+        # --- Tratadores da Memória Tipada ---
+        # Substituem os tratadores que mexem em 'dados'. O argumento já é a
+        # célula (vetor, índice), então não existe checagem de tamanho.
+
+        if memoria is not None:
+            def armazenar(celula, valor): # Também usado por SOAR, SUAR, MUAR, DIAR e LEAR
+                vetor, indice = celula
                 try:
-                    arg = float(partes[1])
-                    if arg.is_integer(): arg = int(arg)
-                except ValueError:
-                    arg = partes[1] # Mantém como string se não for número
-
-            # DEBUG: Descomente a linha abaixo para ver passo-a-passo
-            # print(f"PC: {self.pc} | INSTR: {op} {arg if arg is not None else ''} | PILHA: {self.pilha}")
-
-            # --- Decodificação das Instruções ---
-            
-            if op == 'INPP': # Iniciar Programa Principal
-                self.pc += 1
-                
-            elif op == 'PARA': # Parar Programa
-                print("\n--------------------------")
-                print("=== FIM DA EXECUÇÃO ===")
-                break
-                
-            elif op == 'ALME': # Alocar Memória
-                qtd = int(arg)
-                for _ in range(qtd):
-                    self.dados.append(0) # Inicializa variáveis com 0
-                self.pc += 1
-                
-            elif op == 'CRCT': # Carregar Constante
-                self.pilha.append(arg)
-                self.pc += 1
-                
-            elif op == 'CRVL': # Carregar Valor (de variável)
-                endereco = int(arg)
-                if endereco < len(self.dados):
-                    self.pilha.append(self.dados[endereco])
-                else:
-                    # Se tentar acessar memória não alocada, preenche com 0 e avisa (modo permissivo)
-                    while len(self.dados) <= endereco:
-                        self.dados.append(0)
-                    self.pilha.append(self.dados[endereco])
-                self.pc += 1
-                
-            elif op == 'ARMZ': # Armazenar (em variável)
-                endereco = int(arg)
-                if not self.pilha:
-                    print(f"Erro de Execução (Linha {self.pc}): Pilha vazia ao tentar ARMAZENAR.")
-                    sys.exit(1)
-                valor = self.pilha.pop()
-                if endereco < len(self.dados):
-                    self.dados[endereco] = valor
-                else:
-                    while len(self.dados) <= endereco:
-                        self.dados.append(0)
-                    self.dados[endereco] = valor
-                self.pc += 1
-                
-            elif op == 'SOMA': # Soma
-                if len(self.pilha) < 2: 
-                    print(f"Erro (Linha {self.pc}): Pilha vazia para SOMA. Pilha atual: {self.pilha}")
-                    sys.exit(1)
-                b = self.pilha.pop()
-                a = self.pilha.pop()
-                self.pilha.append(a + b)
-                self.pc += 1
-                
-            elif op == 'SUBT': # Subtração
-                if len(self.pilha) < 2:
-                    print(f"Erro (Linha {self.pc}): Pilha vazia para SUBT. Pilha atual: {self.pilha}")
-                    sys.exit(1)
-                b = self.pilha.pop()
-                a = self.pilha.pop()
-                self.pilha.append(a - b)
-                self.pc += 1
-                
-            elif op == 'MULT': # Multiplicação
-                if len(self.pilha) < 2:
-                    print(f"Erro (Linha {self.pc}): Pilha vazia para MULT. Pilha atual: {self.pilha}")
-                    sys.exit(1)
-                b = self.pilha.pop()
-                a = self.pilha.pop()
-                self.pilha.append(a * b)
-                self.pc += 1
-                
-            elif op == 'DIVI': # Divisão
-                if len(self.pilha) < 2:
-                    print(f"Erro (Linha {self.pc}): Pilha vazia para DIVI. Pilha atual: {self.pilha}")
-                    sys.exit(1)
-                b = self.pilha.pop()
-                a = self.pilha.pop()
-                if b == 0:
-                    print("Erro: Divisão por Zero!")
-                    sys.exit(1)
-                self.pilha.append(a / b)
-                self.pc += 1
-                
-            elif op == 'IMPR': # Imprimir
-                if not self.pilha:
-                    print(f"Erro (Linha {self.pc}): Pilha vazia para IMPR.")
-                    sys.exit(1)
-                valor = self.pilha.pop()
-                print(f"SAÍDA: {valor}")
-                self.pc += 1
-                
-            elif op == 'LEIT': # Leitura
+                    vetor[indice] = valor
+                except TypeError:
+                    # Valor real numa variável INTEGER: só aceito se não tiver parte fracionária
+                    if not valor.is_integer():
+                        raise ErroExecucao(f"Erro de Execução: valor real {valor} em variável INTEGER.")
+                    vetor[indice] = int(valor)
+                except OverflowError:
+                    raise ErroExecucao(f"Erro de Execução: valor {valor} fora da faixa de 64 bits.")
+
+            def alme(arg, pc): # A memória já foi toda reservada na carga
+                return pc + 1
+
+            desm = alme
+
+            # Quadro de ativação: as posições INTEGER do quadro são uma fatia
+            # contínua do vetor de inteiros, e as REAL uma fatia do de reais
+            # (ver MemoriaTipada.quadro)
+            def enpr(arg, pc):
+                i0, i1, zeros_inteiros, r0, r1, zeros_reais = arg
+                quadros.append((inteiros[i0:i1], reais[r0:r1]))
+                inteiros[i0:i1] = zeros_inteiros
+                reais[r0:r1] = zeros_reais
+                return pc + 1
+
+            def sapr(arg, pc):
+                if not quadros:
+                    raise ErroExecucao(f"Erro de Execução ({onde(pc)}): SAPR sem quadro de ativação.")
+                inteiros[arg[0]:arg[1]], reais[arg[3]:arg[4]] = quadros.pop()
+                return pc + 1
+
+            # Quadro só com variáveis INTEGER (o caso mais comum): uma fatia só
+            def enpr_inteiros(arg, pc):
+                i0, i1, zeros_inteiros = arg[0], arg[1], arg[2]
+                quadros.append(inteiros[i0:i1])
+                inteiros[i0:i1] = zeros_inteiros
+                return pc + 1
+
+            def sapr_inteiros(arg, pc):
+                if not quadros:
+                    raise ErroExecucao(f"Erro de Execução ({onde(pc)}): SAPR sem quadro de ativação.")
+                inteiros[arg[0]:arg[1]] = quadros.pop()
+                return pc + 1
+
+            # CRVL, PARAM e ARMZ (as mais frequentes) têm uma versão para cada
+            # vetor, escolhida por linha logo abaixo da tabela: o argumento
+            # vira só o índice dentro do vetor
+            inteiros = memoria.inteiros
+            reais = memoria.reais
+
+            def crvl_inteiro(arg, pc):
+                nonlocal sp
+                pilha[sp + 1] = inteiros[arg]
+                sp += 1
+                return pc + 1
+
+            def crvl_real(arg, pc):
+                nonlocal sp
+                pilha[sp + 1] = reais[arg]
+                sp += 1
+                return pc + 1
+
+            def armz_inteiro(arg, pc):
+                nonlocal sp
+                try:
+                    inteiros[arg] = pilha[sp]
+                except (TypeError, OverflowError):
+                    armazenar((inteiros, arg), pilha[sp]) # Converte ou acusa o erro
+                sp -= 1
+                return pc + 1
+
+            def armz_real(arg, pc):
+                nonlocal sp
                 try:
-                    valor_lido = input("Digite um valor de entrada: ")
-                    # Tenta converter entrada para número
-                    valor_num = float(valor_lido)
-                    if valor_num.is_integer(): valor_num = int(valor_num)
-                    self.pilha.append(valor_num)
-                except ValueError:
-                    print("Erro: A entrada deve ser numérica.")
-                    sys.exit(1)
-                except EOFError:
-                    print("\nEntrada encerrada inesperadamente.")
-                    sys.exit(1)
-                self.pc += 1
-                
-            elif op == 'DSVF': # Desvio Se Falso
-                if not self.pilha:
-                    print(f"Erro (Linha {self.pc}): Pilha vazia para DSVF.")
-                    sys.exit(1)
-                condicao = self.pilha.pop()
-                if not condicao: # 0 ou False
-                    self.pc = int(arg)
-                else:
-                    self.pc += 1
-                    
-            elif op == 'DSVI': # Desvio Incondicional
-                self.pc = int(arg)
-                
-            # Operadores Relacionais (empilham 1 se True, 0 se False)
-            elif op == 'CPIG': # Igual
-                if len(self.pilha) < 2: print("Erro: Pilha < 2 para CPIG"); sys.exit(1)
-                b = self.pilha.pop(); a = self.pilha.pop()
-                self.pilha.append(1 if a == b else 0)
-                self.pc += 1
-            elif op == 'CDIF': # Diferente
-                if len(self.pilha) < 2: print("Erro: Pilha < 2 para CDIF"); sys.exit(1)
-                b = self.pilha.pop(); a = self.pilha.pop()
-                self.pilha.append(1 if a != b else 0)
-                self.pc += 1
-            elif op == 'CMAI': # Maior
-                if len(self.pilha) < 2: print("Erro: Pilha < 2 para CMAI"); sys.exit(1)
-                b = self.pilha.pop(); a = self.pilha.pop()
-                self.pilha.append(1 if a > b else 0)
-                self.pc += 1
-            elif op == 'CMEN': # Menor
-                if len(self.pilha) < 2: print("Erro: Pilha < 2 para CMEN"); sys.exit(1)
-                b = self.pilha.pop(); a = self.pilha.pop()
-                self.pilha.append(1 if a < b else 0)
-                self.pc += 1
-            elif op == 'CPMI': # Menor Igual
-                if len(self.pilha) < 2: print("Erro: Pilha < 2 para CPMI"); sys.exit(1)
-                b = self.pilha.pop(); a = self.pilha.pop()
-                self.pilha.append(1 if a <= b else 0)
-                self.pc += 1
-            elif op == 'CPMA': # Maior Igual
-                if len(self.pilha) < 2: print("Erro: Pilha < 2 para CPMA"); sys.exit(1)
-                b = self.pilha.pop(); a = self.pilha.pop()
-                self.pilha.append(1 if a >= b else 0)
-                self.pc += 1
-            
-            # --- Comandos Extras (Opcional/Simplificado) ---
-            elif op == 'PUSHER': # Empilha endereço de retorno
-                endereco_retorno = int(arg)
-                self.pilha_retorno.append(endereco_retorno)
-                self.pc += 1
-                
-            elif op == 'PARAM': # Empilha parâmetro (valor de memória)
-                endereco = int(arg)
-                if endereco < len(self.dados):
-                    self.pilha.append(self.dados[endereco])
-                else:
-                    while len(self.dados) <= endereco:
-                        self.dados.append(0)
-                    self.pilha.append(self.dados[endereco])
-                self.pc += 1
-            
-            elif op == 'CHPR': # Chamar Procedimento
-                endereco_proc = int(arg)
-                # O procedimento vai desempilhar parâmetros e processar
-                self.pc = endereco_proc
-                
-            elif op == 'RTPR': # Return Procedure
-                # Retorna para o endereço salvo na pilha de retorno
-                if self.pilha_retorno:
-                    self.pc = self.pilha_retorno.pop()
-                else:
-                    # Se não houver endereço de retorno, é o fim do programa
-                    self.pc += 1
-                    
-            elif op == 'DESM': # Desalocar memória
-                qtd = int(arg) if arg else 1
-                # Desaloca da área de dados (remove últimas n variáveis)
-                for _ in range(qtd):
-                    if self.dados:
-                        self.dados.pop()
-                self.pc += 1
-            
+                    reais[arg] = pilha[sp]
+                except OverflowError:
+                    armazenar((reais, arg), pilha[sp])
+                sp -= 1
+                return pc + 1
+
+            versoes_tipadas = {
+                CRVL: (crvl_inteiro, crvl_real),
+                PARAM: (crvl_inteiro, crvl_real),
+                ARMZ: (armz_inteiro, armz_real),
+            }
+
+            def crv2(arg, pc):
+                nonlocal sp
+                (vetor_a, a), (vetor_b, b) = arg
+                pilha[sp + 2] = vetor_b[b]
+                pilha[sp + 1] = vetor_a[a]
+                sp += 2
+                return pc + 1
+
+            def cvct(arg, pc):
+                nonlocal sp
+                (vetor, indice), k = arg
+                pilha[sp + 2] = k
+                pilha[sp + 1] = vetor[indice]
+                sp += 2
+                return pc + 1
+
+            def arct(arg, pc):
+                armazenar(arg[1], arg[0])
+                return pc + 1
+
+            def copi(arg, pc):
+                (vetor, indice), destino = arg
+                armazenar(destino, vetor[indice])
+                return pc + 1
+
+            def cvim(arg, pc):
+                vetor, indice = arg
+                escrever(vetor[indice])
+                return pc + 1
+
+        # Tabela de despacho: a posição de cada tratador é o número do opcode
+        tratadores = (
+            inpp, para, alme, crct, crvl, armz,
+            soma, subt, mult, divi, impr, leit,
+            dsvf, dsvi, cpig, cdif, cmai, cmen,
+            cpmi, cpma, pusher, param, chpr, rtpr,
+            desm,
+            nada,
+            desconhecida,
+            crv2, cvct, arct, copi,
+            soar, suar, muar, diar,
+            dfig, dfdf, dfma, dfme, dfmi, dfpa,
+            lear, cvim,
+            enpr, sapr,
+        )
+
+        # Resolvo o tratador de cada linha uma única vez (código "encadeado"):
+        # no laço, o despacho vira um único acesso à lista seguido da chamada.
+        codigo = [tratadores[op] for op in self.opcodes]
+        if memoria is None and (ENPR in self.opcodes or SAPR in self.opcodes):
+            argumentos = list(argumentos)
+            for numero, op in enumerate(self.opcodes):
+                if op == ENPR or op == SAPR:
+                    a, n = argumentos[numero]
+                    argumentos[numero] = (a, a + n, [0] * n)
+        if memoria is not None:
+            for numero, op in enumerate(self.opcodes):
+                if op in versoes_tipadas:
+                    vetor, indice = argumentos[numero]
+                    codigo[numero] = versoes_tipadas[op][vetor is reais]
+                    argumentos[numero] = indice
+                elif (op == ENPR or op == SAPR) and argumentos[numero][3] == argumentos[numero][4]:
+                    codigo[numero] = enpr_inteiros if op == ENPR else sapr_inteiros
+        total = len(codigo)
+        pc = self.pc
+
+        # Perfil: um laço separado, que também conta as execuções de cada PC.
+        # O laço normal fica igual, sem nenhum custo quando o perfil está desligado.
+        contagem_pc = [0] * total if self.perfilar else None
+        inicio = time.perf_counter()
+
+        # Loop principal: chama o tratador da instrução apontada pelo PC
+        try:
+            if contagem_pc is None:
+                while pc < total:
+                    pc = codigo[pc](argumentos[pc], pc)
             else:
-                print(f"Aviso: Instrução '{op}' não implementada ou desconhecida na linha {self.pc}.")
-                self.pc += 1
+                while pc < total:
+                    contagem_pc[pc] += 1
+                    pc = codigo[pc](argumentos[pc], pc)
+        finally:
+            # Mesmo se a execução parar com erro, a saída guardada não se perde
+            self.saida.descarregar()
+            if contagem_pc is not None:
+                self.perfil = perfilador.Perfil(self.opcodes, self.argumentos, contagem_pc,
+                                                time.perf_counter() - inicio, self.mapa)
+
+        self.pc = pc
+        self.pilha = pilha[:sp + 1]
+        if memoria is not None:
+            self.dados = memoria.valores()
+
+    def executar_compilado(self, pasta_cache=None):
+        """
+        Backend alternativo: traduz o programa inteiro para uma função Python
+        (ver tradutorPython.py) e executa essa função. A saída é a mesma do
+        executar(). Com 'pasta_cache', o código compilado é reaproveitado entre
+        execuções do mesmo programa. A execução sempre começa no endereço 0.
+        Este backend sempre usa a memória em lista (ignora memoria_tipada) e
+        não gera perfil (ignora perfilar).
+        """
+        self.verificar(inicio=0)
+        funcao, constantes = tradutorPython.compilar(self.opcodes, self.argumentos, pasta_cache)
+
+        def divisao_por_zero(pc):
+            raise ErroExecucao(f"Erro ({self.onde(pc)}): Divisão por Zero!")
+
+        def crescer(dados, endereco):
+            # Memória não alocada é preenchida com 0 (modo permissivo)
+            dados.extend([0] * (endereco + 1 - len(dados)))
+
+        def fim():
+            self.saida.descarregar()
+            if self.verboso:
+                mensagem_fim()
+
+        if self.verboso:
+            print("\n=== INICIANDO EXECUÇÃO ===")
+            print("--------------------------")
+
+        pilha = list(self.pilha)
+        try:
+            self.pc = funcao(self.dados, pilha, self.pilha_retorno, self.pilha_quadros, constantes,
+                             self.entrada.ler, self.saida.escrever,
+                             divisao_por_zero, crescer, fim)
+        finally:
+            self.saida.descarregar()
+        self.pilha = pilha
 
 if __name__ == "__main__":
     # Teste isolado: Executa o código objeto diretamente sem passar pela compilação
-    vm = MaquinaHipotetica()
+    vm = MaquinaHipotetica(verboso=True)
     # Tenta achar o arquivo padrão subindo um nível
     path_padrao = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Dados', 'codigo_objeto.txt')
     
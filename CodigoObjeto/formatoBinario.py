@@ -0,0 +1,239 @@
+import sys
+import os
+import mmap
+import struct
+from array import array
+
+# Adiciona a pasta atual ao path para importar a tabela de instruções
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from instrucoes import *
+
+# ==============================================================================
+# FORMATO BINÁRIO DO CÓDIGO OBJETO
+# ==============================================================================
+# Alternativa ao codigo_objeto.txt para programas grandes. Em vez de ler e
+# quebrar cada linha de texto, a máquina mapeia o arquivo na memória (mmap) e
+# enxerga as instruções direto como um vetor de inteiros (memoryview).
+#
+# Layout do arquivo (tudo little-endian):
+#
+#   CABEÇALHO (24 bytes)
+#     4s  assinatura 'LALG'
+#     H   versão do formato
+#     H   reservado (0)
+#     I   quantidade de instruções
+#     I   quantidade de constantes inteiras
+#     I   quantidade de constantes reais
+#     I   quantidade de seções extras
+#
+#   TABELA DE CONSTANTES (usada pelo CRCT)
+#     q * n_inteiros   constantes inteiras (int64)
+#     d * n_reais      constantes reais (float64)
+#
+#   INSTRUÇÕES (largura fixa de 8 bytes cada)
+#     i  opcode (número definido em instrucoes.py)
+#     i  argumento: endereço/quantidade, índice da constante (no CRCT)
+#        ou SEM_ARGUMENTO quando a instrução não tem argumento
+#
+#   SEÇÕES EXTRAS (opcionais, para metadados)
+#     4s nome, I tamanho em bytes, conteúdo
+#
+# Os índices do CRCT enxergam as duas tabelas como uma só: primeiro vêm os
+# inteiros e, logo depois, os reais.
+#
+# Superinstruções de dois operandos (ex: "CRV2 3 4") guardam no argumento a
+# posição do primeiro operando na seção 'OPER' (um vetor de int32). Operandos
+# que são constantes (o k de "CVCT a k") também viram índices da tabela.
+
+ASSINATURA = b'LALG'
+VERSAO = 2 # 2: sem as versões tipadas das operações (ENPR e SAPR mudaram de número)
+CABECALHO = struct.Struct('<4sHHIIII')
+CABECALHO_SECAO = struct.Struct('<4sI')
+SEM_ARGUMENTO = -2 ** 31
+SECAO_OPERANDOS = b'OPER'
+
+LIMITE_ARGUMENTO = 2 ** 31
+
+
+def eh_binario(caminho):
+    """ Verifica pela assinatura se o arquivo está no formato binário """
+    with open(caminho, 'rb') as f:
+        return f.read(len(ASSINATURA)) == ASSINATURA
+
+
+def montar(linhas, secoes=None):
+    """
+    Converte as linhas de código objeto (texto) para o formato binário.
+    'secoes' é um dicionário opcional {nome de 4 letras: bytes} com metadados.
+    Devolve o conteúdo do arquivo em bytes.
+    """
+    # As tabelas são gravadas/lidas com array e memoryview, que usam a ordem
+    # de bytes da própria máquina
+    if sys.byteorder != 'little':
+        raise RuntimeError("O formato binário só é suportado em máquinas little-endian.")
+
+    inteiros = []
+    reais = []
+    indice_inteiros = {}
+    indice_reais = {}
+    instrucoes = array('i')
+    operandos = array('i')
+    constantes = [] # (vetor, posição, valor): índices preenchidos no final
+
+    def registrar_constante(valor, numero):
+        # Deduplico as constantes: cada valor aparece uma vez na tabela
+        if isinstance(valor, int):
+            if not -2 ** 63 <= valor < 2 ** 63:
+                raise ValueError(f"Constante inteira {valor} fora da faixa de 64 bits na linha {numero}.")
+            if valor not in indice_inteiros:
+                indice_inteiros[valor] = len(inteiros)
+                inteiros.append(valor)
+        elif isinstance(valor, float):
+            if valor not in indice_reais:
+                indice_reais[valor] = len(reais)
+                reais.append(valor)
+        else:
+            raise ValueError(f"Constante inválida '{valor}' na linha {numero}.")
+
+    def inteiro_valido(valor):
+        return isinstance(valor, int) and -LIMITE_ARGUMENTO < valor < LIMITE_ARGUMENTO
+
+    for numero, linha in enumerate(linhas):
+        op, arg, nome = decodificar_linha(linha)
+        if op == DESCONHECIDA:
+            raise ValueError(f"Instrução desconhecida '{nome}' na linha {numero}: não pode ir para o formato binário.")
+
+        if arg is None:
+            arg_codificado = SEM_ARGUMENTO
+        elif op == CRCT:
+            registrar_constante(arg, numero)
+            constantes.append((instrucoes, len(instrucoes) + 1, arg))
+            arg_codificado = 0 # Preenchido abaixo, quando a tabela estiver completa
+        elif op in OPS_COM_DOIS_ARGUMENTOS and isinstance(arg, tuple):
+            arg_codificado = len(operandos)
+            posicao_constante = OPS_COM_DOIS_ARGUMENTOS[op]
+            for posicao, parte in enumerate(arg):
+                if posicao == posicao_constante:
+                    registrar_constante(parte, numero)
+                    constantes.append((operandos, len(operandos), parte))
+                    operandos.append(0)
+                elif inteiro_valido(parte):
+                    operandos.append(parte)
+                else:
+                    raise ValueError(f"Argumento inválido '{parte}' para {nome} na linha {numero}.")
+        elif inteiro_valido(arg):
+            arg_codificado = arg
+        else:
+            raise ValueError(f"Argumento inválido '{arg}' para {nome} na linha {numero}.")
+
+        instrucoes.append(op)
+        instrucoes.append(arg_codificado)
+
+    # Agora sei quantos inteiros existem: reais começam logo depois deles
+    for vetor, posicao, valor in constantes:
+        if isinstance(valor, int):
+            vetor[posicao] = indice_inteiros[valor]
+        else:
+            vetor[posicao] = len(inteiros) + indice_reais[valor]
+
+    secoes = dict(secoes or {})
+    if operandos:
+        secoes[SECAO_OPERANDOS] = operandos.tobytes()
+    partes = [
+        CABECALHO.pack(ASSINATURA, VERSAO, 0, len(instrucoes) // 2,
+                       len(inteiros), len(reais), len(secoes)),
+        array('q', inteiros).tobytes(),
+        array('d', reais).tobytes(),
+        instrucoes.tobytes(),
+    ]
+    for nome, conteudo in secoes.items():
+        partes.append(CABECALHO_SECAO.pack(nome, len(conteudo)))
+        partes.append(conteudo)
+
+    return b''.join(partes)
+
+
+def salvar(linhas, caminho, secoes=None):
+    """ Grava as linhas de código objeto no arquivo binário 'caminho' """
+    with open(caminho, 'wb') as f:
+        f.write(montar(linhas, secoes))
+
+
+def ler(caminho):
+    """
+    Carrega um arquivo binário através de mmap/memoryview, sem processar
+    texto. Devolve (opcodes, argumentos, secoes), no mesmo formato das listas
+    que a MaquinaHipotetica usa (argumento None quando não existe).
+    """
+    with open(caminho, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            with memoryview(mapa) as memoria:
+                return _ler_memoria(memoria)
+
+
+def _ler_memoria(memoria):
+    (assinatura, versao, _, n_instrucoes, n_inteiros, n_reais,
+     n_secoes) = CABECALHO.unpack_from(memoria, 0)
+    if assinatura != ASSINATURA:
+        raise ValueError("Arquivo não está no formato binário LALG.")
+    if versao != VERSAO:
+        raise ValueError(f"Versão {versao} do formato binário não suportada.")
+
+    # Cada bloco é só uma "janela" sobre o arquivo mapeado (cast sem cópia)
+    inicio = CABECALHO.size
+    fim = inicio + 8 * n_inteiros
+    with memoria[inicio:fim].cast('q') as bloco:
+        constantes = bloco.tolist()
+    inicio, fim = fim, fim + 8 * n_reais
+    with memoria[inicio:fim].cast('d') as bloco:
+        constantes += bloco.tolist()
+    inicio, fim = fim, fim + 8 * n_instrucoes
+    with memoria[inicio:fim].cast('i') as bloco:
+        opcodes = bloco[0::2].tolist()
+        argumentos = bloco[1::2].tolist()
+
+    secoes = {}
+    posicao = fim
+    for _ in range(n_secoes):
+        nome, tamanho = CABECALHO_SECAO.unpack_from(memoria, posicao)
+        posicao += CABECALHO_SECAO.size
+        secoes[nome] = bytes(memoria[posicao:posicao + tamanho])
+        posicao += tamanho
+    operandos = array('i', secoes.pop(SECAO_OPERANDOS, b''))
+
+    # Troco o marcador de "sem argumento", os índices do CRCT e os operandos
+    # das superinstruções pelos valores de verdade
+    for pc, arg in enumerate(argumentos):
+        if arg == SEM_ARGUMENTO:
+            argumentos[pc] = None
+        elif opcodes[pc] == CRCT:
+            argumentos[pc] = constantes[arg]
+        elif opcodes[pc] in OPS_COM_DOIS_ARGUMENTOS:
+            posicao_constante = OPS_COM_DOIS_ARGUMENTOS[opcodes[pc]]
+            argumentos[pc] = tuple(
+                constantes[parte] if posicao == posicao_constante else parte
+                for posicao, parte in enumerate(operandos[arg:arg + 2]))
+
+    return opcodes, argumentos, secoes
+
+
+def desmontar(caminho):
+    """ Converte o arquivo binário de volta para as linhas de texto (depuração) """
+    opcodes, argumentos, _ = ler(caminho)
+    return [formatar_instrucao(op, arg) if op != NADA else '#'
+            for op, arg in zip(opcodes, argumentos)]
+
+
+if __name__ == "__main__":
+    # Uso: python formatoBinario.py programa.bin [saida.txt]
+    # Mostra (ou grava) o código objeto em texto, no formato do codigo_objeto.txt
+    if len(sys.argv) < 2:
+        print("Uso: python formatoBinario.py <arquivo binário> [arquivo de saída .txt]")
+        sys.exit(1)
+    linhas = desmontar(sys.argv[1])
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], 'w') as f:
+            for linha in linhas: f.write(linha + '\n')
+    else:
+        for linha in linhas: print(linha)
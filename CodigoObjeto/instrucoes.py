@@ -0,0 +1,108 @@
+# ==============================================================================
+# CONJUNTO DE INSTRUÇÕES DA MÁQUINA HIPOTÉTICA
+# ==============================================================================
+# Aqui fica a tabela oficial de opcodes. O código objeto continua sendo texto
+# (ex: "CRCT 10"), mas a máquina decodifica cada linha UMA única vez para um
+# número inteiro (opcode) e um argumento já convertido para int/float.
+# A ordem da tupla NOMES define o número de cada opcode: só acrescente novas
+# instruções no final para não mudar os números das antigas.
+
+NOMES = (
+    'INPP', 'PARA', 'ALME', 'CRCT', 'CRVL', 'ARMZ',
+    'SOMA', 'SUBT', 'MULT', 'DIVI', 'IMPR', 'LEIT',
+    'DSVF', 'DSVI', 'CPIG', 'CDIF', 'CMAI', 'CMEN',
+    'CPMI', 'CPMA', 'PUSHER', 'PARAM', 'CHPR', 'RTPR',
+    'DESM',
+    'NADA',         # Uso interno: linha que só tinha comentário
+    'DESCONHECIDA', # Uso interno: instrução que a máquina não conhece
+    # Superinstruções (geradas pelo otimizador peephole, ver otimizador.py).
+    # Cada uma faz o trabalho de duas instruções com um único despacho.
+    'CRV2',         # CRVL a; CRVL b       -> CRV2 a b
+    'CVCT',         # CRVL a; CRCT k       -> CVCT a k
+    'ARCT',         # CRCT k; ARMZ a       -> ARCT k a
+    'COPI',         # CRVL a; ARMZ b       -> COPI a b
+    'SOAR', 'SUAR', 'MUAR', 'DIAR',          # SOMA/SUBT/MULT/DIVI; ARMZ a -> xxAR a
+    'DFIG', 'DFDF', 'DFMA', 'DFME', 'DFMI', 'DFPA', # CPIG/CDIF/CMAI/CMEN/CPMI/CPMA; DSVF L -> DFxx L
+    'LEAR',         # LEIT; ARMZ a         -> LEAR a
+    'CVIM',         # CRVL a; IMPR         -> CVIM a
+    # Quadro de ativação dos procedimentos: as n posições a partir do
+    # endereço a (parâmetros e locais) guardadas na entrada e devolvidas na saída
+    'ENPR',         # Entrar no procedimento -> ENPR a n
+    'SAPR',         # Sair do procedimento   -> SAPR a n
+)
+
+# Constantes com o número de cada opcode (INPP = 0, PARA = 1, ...)
+(INPP, PARA, ALME, CRCT, CRVL, ARMZ,
+ SOMA, SUBT, MULT, DIVI, IMPR, LEIT,
+ DSVF, DSVI, CPIG, CDIF, CMAI, CMEN,
+ CPMI, CPMA, PUSHER, PARAM, CHPR, RTPR,
+ DESM,
+ NADA,
+ DESCONHECIDA,
+ CRV2, CVCT, ARCT, COPI,
+ SOAR, SUAR, MUAR, DIAR,
+ DFIG, DFDF, DFMA, DFME, DFMI, DFPA,
+ LEAR, CVIM,
+ ENPR, SAPR) = range(len(NOMES))
+
+# Dicionário inverso: nome -> número do opcode
+CODIGOS = {nome: numero for numero, nome in enumerate(NOMES)}
+
+# Instruções cujo argumento é um endereço/quantidade inteira (validado na carga)
+OPS_COM_ENDERECO = frozenset((ALME, CRVL, ARMZ, DSVF, DSVI, PUSHER, PARAM, CHPR,
+                              SOAR, SUAR, MUAR, DIAR,
+                              DFIG, DFDF, DFMA, DFME, DFMI, DFPA,
+                              LEAR, CVIM))
+
+# Instruções com dois operandos (o argumento é uma tupla, ex: "CRV2 3 4").
+# O valor indica a posição da constante dentro da tupla (None = só endereços).
+OPS_COM_DOIS_ARGUMENTOS = {CRV2: None, CVCT: 1, ARCT: 0, COPI: None, ENPR: None, SAPR: None}
+
+# Instruções cujo argumento é o endereço de outra instrução (desvios, chamadas
+# e endereços de retorno). Qualquer passo que mude a posição das instruções
+# precisa corrigir esses argumentos.
+OPS_DESVIO = frozenset((DSVF, DSVI, PUSHER, CHPR,
+                        DFIG, DFDF, DFMA, DFME, DFMI, DFPA))
+
+
+def converter_argumento(texto):
+    """ Converte o argumento textual para int ou float (ou mantém a string) """
+    try:
+        valor = float(texto)
+        if valor.is_integer(): valor = int(valor)
+        return valor
+    except ValueError:
+        return texto # Mantém como string se não for número
+
+
+def decodificar_linha(linha):
+    """
+    Transforma uma linha de código objeto em (opcode, argumento, nome).
+    Ex: "CRCT 10" vira (CRCT, 10, 'CRCT'). O nome original é devolvido para
+    que a máquina consiga avisar sobre instruções desconhecidas.
+    """
+    # Remove comentários inline (tudo após '#')
+    if '#' in linha:
+        linha = linha.split('#')[0].strip()
+
+    # Linha que só tinha comentário continua ocupando um endereço
+    if not linha:
+        return NADA, None, ''
+
+    partes = linha.split()
+    nome = partes[0]
+    if len(partes) > 2 and CODIGOS.get(nome) in OPS_COM_DOIS_ARGUMENTOS:
+        arg = tuple(converter_argumento(parte) for parte in partes[1:])
+    else:
+        arg = converter_argumento(partes[1]) if len(partes) > 1 else None
+    return CODIGOS.get(nome, DESCONHECIDA), arg, nome
+
+
+def formatar_instrucao(op, arg):
+    """ Operação inversa de decodificar_linha: (opcode, argumento) -> texto """
+    nome = NOMES[op]
+    if arg is None:
+        return nome
+    if isinstance(arg, tuple):
+        return f"{nome} {' '.join(str(parte) for parte in arg)}"
+    return f"{nome} {arg}"
@@ -0,0 +1,101 @@
+# ==============================================================================
+# MAPA DO CÓDIGO OBJETO PARA O CÓDIGO FONTE (DEPURAÇÃO)
+# ==============================================================================
+# O GeradorCodigo anota, para cada instrução emitida, a linha do código LALG
+# que a gerou, e guarda o intervalo de linhas de cada procedimento. Com isso a
+# máquina consegue mostrar erros e perfis por linha do fonte e por
+# procedimento, e não só pelo PC.
+#
+# O mapa é guardado de forma compacta: as linhas por PC viram uma lista de
+# repetições ("3*2" = duas instruções seguidas da linha 3) e cada
+# procedimento vira "nome:início-fim". Exemplo de mapa codificado:
+#
+#     1,4*3,9*12,10|um:8-20,dois:22-35
+#
+# Ele viaja junto com o código objeto: no formato texto, como comentário na
+# primeira linha ("INPP # dados: IIR # fonte: 1,4*3,..."); no binário, na
+# seção 'FONT'.
+
+MARCADOR_FONTE = '# fonte:'
+SECAO_FONTE = b'FONT'
+
+# Linha usada quando a instrução não veio de nenhuma linha conhecida
+SEM_LINHA = 0
+
+
+class MapaFonte:
+    """ Linha do fonte de cada PC e intervalo de linhas de cada procedimento """
+    __slots__ = ('linhas', 'procedimentos')
+
+    def __init__(self, linhas, procedimentos=()):
+        self.linhas = list(linhas)                 # linhas[pc] = linha do fonte
+        self.procedimentos = list(procedimentos)   # [(nome, primeira linha, última linha)]
+
+    def linha(self, pc):
+        """ Linha do fonte da instrução 'pc' (SEM_LINHA se não souber) """
+        if isinstance(pc, int) and 0 <= pc < len(self.linhas):
+            return self.linhas[pc]
+        return SEM_LINHA
+
+    def procedimento_da_linha(self, linha):
+        """ Nome do procedimento que contém a linha (None = programa principal) """
+        for nome, inicio, fim in self.procedimentos:
+            if inicio <= linha <= fim:
+                return nome
+        return None
+
+    def descrever(self, pc):
+        """ Texto curto com a origem do PC, ex: "fonte: linha 14, procedimento 'um'" """
+        linha = self.linha(pc)
+        if linha == SEM_LINHA:
+            return ''
+        nome = self.procedimento_da_linha(linha)
+        if nome is None:
+            return f"fonte: linha {linha}"
+        return f"fonte: linha {linha}, procedimento '{nome}'"
+
+    def codificar(self):
+        """ Mapa em texto compacto (ver o exemplo no topo do arquivo) """
+        partes = []
+        i = 0
+        while i < len(self.linhas):
+            j = i
+            while j + 1 < len(self.linhas) and self.linhas[j + 1] == self.linhas[i]:
+                j += 1
+            quantidade = j - i + 1
+            partes.append(str(self.linhas[i]) if quantidade == 1 else f"{self.linhas[i]}*{quantidade}")
+            i = j + 1
+        procedimentos = ','.join(f"{nome}:{inicio}-{fim}" for nome, inicio, fim in self.procedimentos)
+        return f"{','.join(partes)}|{procedimentos}"
+
+    @classmethod
+    def decodificar(cls, texto):
+        """ Operação inversa de codificar """
+        try:
+            parte_linhas, parte_procedimentos = texto.strip().split('|')
+            linhas = []
+            for parte in filter(None, parte_linhas.split(',')):
+                linha, _, quantidade = parte.partition('*')
+                linhas.extend([int(linha)] * int(quantidade or 1))
+            procedimentos = []
+            for parte in filter(None, parte_procedimentos.split(',')):
+                nome, intervalo = parte.rsplit(':', 1)
+                inicio, fim = intervalo.split('-')
+                procedimentos.append((nome, int(inicio), int(fim)))
+        except ValueError:
+            raise ValueError(f"Mapa do código fonte inválido: '{texto}'.")
+        return cls(linhas, procedimentos)
+
+
+def anotar_mapa(linhas, mapa):
+    """ Devolve as linhas de código objeto com o mapa comentado no fim da primeira linha """
+    if not linhas or mapa is None:
+        return list(linhas)
+    return [f"{linhas[0]} {MARCADOR_FONTE} {mapa.codificar()}"] + list(linhas[1:])
+
+
+def extrair_mapa(linhas):
+    """ Procura o mapa no comentário da primeira linha (None se não houver) """
+    if linhas and MARCADOR_FONTE in linhas[0]:
+        return MapaFonte.decodificar(linhas[0].split(MARCADOR_FONTE, 1)[1].split('#')[0])
+    return None
@@ -0,0 +1,132 @@
+import sys
+import os
+from array import array
+
+# Adiciona a pasta atual ao path para importar a tabela de instruções
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from instrucoes import *
+
+# ==============================================================================
+# MEMÓRIA DE DADOS TIPADA
+# ==============================================================================
+# Por padrão a máquina guarda as variáveis numa lista Python (self.dados), que
+# cresce com ALME e encolhe com DESM. Cada posição é um objeto int/float
+# completo, e todo acesso fora do tamanho atual faz a lista crescer.
+#
+# O compilador sabe o tipo e o endereço de todas as variáveis, e os endereços
+# nunca são reaproveitados. Com essa tabela (o "layout"), a máquina pode
+# reservar toda a memória de uma vez, na carga:
+#   - variáveis INTEGER ficam num array('q') (8 bytes cada);
+#   - variáveis REAL ficam num array('d') (8 bytes cada);
+#   - cada endereço vira um par (vetor, índice) resolvido antes da execução,
+#     então não existe mais checagem de tamanho nem crescimento;
+#   - ALME e DESM não precisam fazer nada: a memória já está toda reservada;
+#   - o quadro de ativação de um procedimento (ENPR/SAPR a n) vira uma fatia
+#     de cada vetor: os endereços dele são seguidos, e cada vetor guarda as
+#     suas variáveis na ordem dos endereços.
+#
+# Na memória tipada um REAL sempre é float (um REAL lido como "2" é impresso
+# como 2.0) e guardar um valor real com parte fracionária numa variável
+# INTEGER é erro de execução.
+#
+# O layout viaja junto com o código objeto: no formato texto, como comentário
+# na primeira linha ("INPP # dados: IIRR..."); no binário, na seção 'DADO'.
+
+INTEIRO = 'I'
+REAL = 'R'
+MARCADOR_LAYOUT = '# dados:'
+SECAO_LAYOUT = b'DADO'
+
+# Instruções cujo argumento é um endereço de memória
+OPS_ENDERECO_MEMORIA = frozenset((CRVL, ARMZ, PARAM, SOAR, SUAR, MUAR, DIAR, LEAR, CVIM))
+
+
+def layout_do_semantico(tipos):
+    """ Converte a lista de tipos do semântico ('INTEGER'/'REAL') para o layout 'IR...' """
+    return ''.join(REAL if tipo == 'REAL' else INTEIRO for tipo in tipos)
+
+
+def anotar_layout(linhas, layout):
+    """ Devolve as linhas de código objeto com o layout comentado na primeira linha """
+    if not linhas or not layout:
+        return list(linhas)
+    primeira = linhas[0].split('#')[0].strip()
+    return [f"{primeira} {MARCADOR_LAYOUT} {layout}"] + list(linhas[1:])
+
+
+def extrair_layout(linhas):
+    """ Procura o layout no comentário da primeira linha (None se não houver) """
+    if linhas and MARCADOR_LAYOUT in linhas[0]:
+        # O layout vai até o próximo comentário (ex: o mapa do fonte, ver mapaFonte.py)
+        layout = linhas[0].split(MARCADOR_LAYOUT, 1)[1].split('#')[0].strip()
+        if layout.strip(INTEIRO + REAL):
+            raise ValueError(f"Layout de dados inválido: '{layout}'.")
+        return layout
+    return None
+
+
+class MemoriaTipada:
+    """ Memória de dados reservada na carga a partir do layout """
+    __slots__ = ('layout', 'inteiros', 'reais', 'celulas')
+
+    def __init__(self, layout):
+        self.layout = layout
+        self.inteiros = array('q', bytes(8 * layout.count(INTEIRO)))
+        self.reais = array('d', bytes(8 * layout.count(REAL)))
+        # celulas[endereço] = (vetor, índice dentro do vetor)
+        self.celulas = []
+        contagem = {INTEIRO: 0, REAL: 0}
+        for tipo in layout:
+            vetor = self.inteiros if tipo == INTEIRO else self.reais
+            self.celulas.append((vetor, contagem[tipo]))
+            contagem[tipo] += 1
+
+    def celula(self, endereco, pc):
+        if not isinstance(endereco, int) or not 0 <= endereco < len(self.celulas):
+            raise ValueError(f"Endereço {endereco} fora do layout de dados na linha {pc}.")
+        return self.celulas[endereco]
+
+    def quadro(self, arg, pc):
+        """
+        Quadro (a, n) de ENPR/SAPR -> (i0, i1, zeros, r0, r1, zeros): as
+        fatias [i0:i1] dos inteiros e [r0:r1] dos reais, e os vetores de
+        zeros que limpam cada uma
+        """
+        a, n = arg
+        if n < 0 or not 0 <= a <= a + n <= len(self.layout):
+            raise ValueError(f"Quadro {a} {n} fora do layout de dados na linha {pc}.")
+        i0 = self.layout.count(INTEIRO, 0, a)
+        r0 = a - i0
+        i1 = i0 + self.layout.count(INTEIRO, a, a + n)
+        r1 = r0 + n - (i1 - i0)
+        return (i0, i1, array('q', bytes(8 * (i1 - i0))),
+                r0, r1, array('d', bytes(8 * (r1 - r0))))
+
+    def resolver(self, opcodes, argumentos):
+        """
+        Troca os endereços dos argumentos pelas células (vetor, índice), uma
+        única vez antes da execução. Devolve a nova lista de argumentos.
+        """
+        resolvidos = list(argumentos)
+        for pc, (op, arg) in enumerate(zip(opcodes, argumentos)):
+            if op in OPS_ENDERECO_MEMORIA:
+                resolvidos[pc] = self.celula(arg, pc)
+            elif op in (CRV2, COPI):
+                resolvidos[pc] = (self.celula(arg[0], pc), self.celula(arg[1], pc))
+            elif op == CVCT:
+                resolvidos[pc] = (self.celula(arg[0], pc), arg[1])
+            elif op == ARCT:
+                resolvidos[pc] = (arg[0], self.celula(arg[1], pc))
+            elif op == ENPR or op == SAPR:
+                resolvidos[pc] = self.quadro(arg, pc)
+        return resolvidos
+
+    def valores(self):
+        """ Conteúdo da memória como lista (mesmo formato de MaquinaHipotetica.dados) """
+        return [vetor[indice] for vetor, indice in self.celulas]
+
+    def tamanho_bytes(self):
+        """ Bytes ocupados pelos valores (sem contar a tabela de células) """
+        return (len(self.inteiros) * self.inteiros.itemsize +
+                len(self.reais) * self.reais.itemsize)
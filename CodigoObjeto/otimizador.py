@@ -0,0 +1,426 @@
+import sys
+import os
+
+# Adiciona a pasta atual ao path para importar a tabela de instruções
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from instrucoes import *
+
+# ==============================================================================
+# OTIMIZADOR DO CÓDIGO OBJETO
+# ==============================================================================
+# Passos de otimização que rodam DEPOIS da geração de código, direto sobre a
+# lista de instruções do GeradorCodigo. Como os desvios (DSVF, DSVI, CHPR,
+# PUSHER) usam endereços absolutos, todo passo que remove ou junta instruções
+# precisa recalcular esses endereços no final.
+
+# Pares de instruções que viram uma superinstrução: (primeira, segunda) -> nova
+SUPERINSTRUCOES = {
+    (CRVL, CRVL): CRV2,
+    (CRVL, CRCT): CVCT,
+    (CRCT, ARMZ): ARCT,
+    (CRVL, ARMZ): COPI,
+    (SOMA, ARMZ): SOAR,
+    (SUBT, ARMZ): SUAR,
+    (MULT, ARMZ): MUAR,
+    (DIVI, ARMZ): DIAR,
+    (CPIG, DSVF): DFIG,
+    (CDIF, DSVF): DFDF,
+    (CMAI, DSVF): DFMA,
+    (CMEN, DSVF): DFME,
+    (CPMI, DSVF): DFMI,
+    (CPMA, DSVF): DFPA,
+    (LEIT, ARMZ): LEAR,
+    (CRVL, IMPR): CVIM,
+}
+
+# Caminho inverso: superinstrução -> par original
+PARES_DAS_SUPERINSTRUCOES = {super_op: par for par, super_op in SUPERINSTRUCOES.items()}
+
+
+def expandir_superinstrucao(op, arg):
+    """
+    Desfaz uma superinstrução, devolvendo a lista [(op, arg), (op, arg)] das
+    duas instruções simples equivalentes. Instruções simples voltam sozinhas
+    na lista. Serve para quem só sabe tratar o conjunto básico de instruções.
+    """
+    par = PARES_DAS_SUPERINSTRUCOES.get(op)
+    if par is None:
+        return [(op, arg)]
+    primeira, segunda = par
+    if op in OPS_COM_DOIS_ARGUMENTOS:
+        return [(primeira, arg[0]), (segunda, arg[1])]
+    # Só uma das duas tem argumento (ex: SOAR a -> SOMA; ARMZ a)
+    if primeira in OPS_COM_ENDERECO:
+        return [(primeira, arg), (segunda, None)]
+    return [(primeira, None), (segunda, arg)]
+
+
+class Instrucao:
+    """
+    Uma instrução decodificada; 'texto' guarda a linha original de instruções
+    desconhecidas e 'linha' a linha do código LALG que a gerou (ver mapaFonte.py)
+    """
+    __slots__ = ('op', 'arg', 'texto', 'linha')
+
+    def __init__(self, op, arg, texto=None, linha=None):
+        self.op = op
+        self.arg = arg
+        self.texto = texto
+        self.linha = linha
+
+    def formatar(self):
+        if self.texto is not None:
+            return self.texto
+        return formatar_instrucao(self.op, self.arg)
+
+
+def decodificar_programa(linhas, linhas_fonte=None):
+    """ Converte as linhas de texto em uma lista de Instrucao """
+    programa = []
+    for numero, linha in enumerate(linhas):
+        op, arg, _ = decodificar_linha(linha)
+        texto = linha if op in (DESCONHECIDA, NADA) else None
+        programa.append(Instrucao(op, arg, texto, linhas_fonte[numero] if linhas_fonte else None))
+    return programa
+
+
+def alvos_de_desvio(programa):
+    """ Conjunto de endereços para onde algum desvio, chamada ou retorno aponta """
+    return {instrucao.arg for instrucao in programa
+            if instrucao.op in OPS_DESVIO and isinstance(instrucao.arg, int)}
+
+
+def realocar_desvios(programa, novo_endereco):
+    """
+    Corrige os argumentos de desvio depois que as instruções mudaram de lugar.
+    'novo_endereco' é uma lista: novo_endereco[endereço antigo] = endereço novo
+    (com uma posição extra para o endereço logo após o fim do programa).
+    """
+    for instrucao in programa:
+        if instrucao.op in OPS_DESVIO and isinstance(instrucao.arg, int):
+            if 0 <= instrucao.arg < len(novo_endereco):
+                instrucao.arg = novo_endereco[instrucao.arg]
+
+
+# Procedimentos com até LIMITE_EXPANSAO instruções (do início até o RTPR) são
+# expandidos no lugar das chamadas
+LIMITE_EXPANSAO = 24
+
+
+def procedimentos_expansiveis(programa, procedimentos):
+    """
+    Procedimentos da tabela do gerador (nome -> {'endereco', 'params', ...})
+    que podem ser expandidos: entrada -> (endereços dos parâmetros, endereço
+    do RTPR). Só os pequenos e sem chamadas dentro (a cópia não tem PUSHER
+    para realocar, e um procedimento recursivo tem chamada dentro), com o
+    começo no formato do gerador: o ENPR do quadro de ativação (se houver)
+    e um ARMZ por parâmetro, e desvios só para dentro do próprio corpo.
+    """
+    expansiveis = {}
+    for info in procedimentos.values():
+        inicio, params = info['endereco'], info['params']
+        k = len(params)
+        fim = inicio
+        while fim < len(programa) and programa[fim].op != RTPR:
+            fim += 1
+        if fim == len(programa) or fim - inicio > LIMITE_EXPANSAO:
+            continue
+        corpo = programa[inicio:fim]
+        if any(instrucao.op in (PUSHER, CHPR) for instrucao in corpo):
+            continue
+        prologo = 1 if corpo and corpo[0].op == ENPR else 0
+        if (k and not prologo) or len(corpo) < prologo + k:
+            continue
+        if any(corpo[prologo + m].op != ARMZ or corpo[prologo + m].arg != params[m] for m in range(k)):
+            continue
+        if any(instrucao.op in (DSVF, DSVI) and not inicio <= instrucao.arg <= fim for instrucao in corpo):
+            continue
+        expansiveis[inicio] = (params, prologo, fim)
+    return expansiveis
+
+
+def expandir_procedimentos(programa, procedimentos):
+    """
+    Inlining: a chamada (PUSHER r; PARAM...; CHPR e) de um procedimento
+    pequeno vira uma cópia do corpo dele, sem o PUSHER, o CHPR e o RTPR. O
+    ENPR e o SAPR do procedimento ficam, para as locais começarem zeradas
+    como na chamada. Quando nem o parâmetro nem a variável passada mudam no
+    corpo, o PARAM e o ARMZ do parâmetro também saem e a cópia lê direto a
+    variável passada. Roda antes do peephole (ainda sem superinstruções) e
+    antes do passo de fluxo, que depois remove os procedimentos que ficaram
+    sem chamada. Devolve (novo programa, chamadas expandidas, instruções de
+    chamada removidas).
+    """
+    expansiveis = procedimentos_expansiveis(programa, procedimentos)
+    novo = []
+    originais = [] # As instruções copiadas já saem com os desvios no endereço novo
+    novo_endereco = []
+    expandidas = removidas = 0
+    total = len(programa)
+    pc = 0
+    while pc < total:
+        instrucao = programa[pc]
+        chpr = pc + 1
+        while chpr < total and programa[chpr].op == PARAM:
+            chpr += 1
+        if (instrucao.op != PUSHER or chpr == total or programa[chpr].op != CHPR
+                or programa[chpr].arg not in expansiveis or instrucao.arg != chpr + 1
+                or len(expansiveis[programa[chpr].arg][0]) != chpr - pc - 1):
+            novo_endereco.append(len(novo))
+            novo.append(instrucao)
+            originais.append(instrucao)
+            pc += 1
+            continue
+
+        entrada = programa[chpr].arg
+        params, prologo, fim = expansiveis[entrada]
+        k = len(params)
+        inicio_corpo = entrada + prologo + k # Depois do ENPR e dos ARMZ dos parâmetros
+        # Os PARAM vêm do último argumento para o primeiro
+        argumentos = [programa[i].arg for i in range(chpr - 1, pc, -1)]
+        escritas = {copia.arg for copia in programa[inicio_corpo:fim] if copia.op == ARMZ}
+        troca = {p: a for p, a in zip(params, argumentos) if p not in escritas and a not in escritas}
+
+        # Quem desviava para o PUSHER agora cai no começo da cópia
+        novo_endereco.extend([len(novo)] * (chpr + 1 - pc))
+        for m in range(k - 1, -1, -1):
+            if params[m] not in troca:
+                param = programa[chpr - 1 - m]
+                novo.append(Instrucao(PARAM, param.arg, linha=param.linha))
+
+        inicio_copia = len(novo)
+        destino = {}
+        copias = []
+        for endereco in range(entrada, fim):
+            destino[endereco] = inicio_copia + len(copias)
+            original = programa[endereco]
+            if entrada + prologo <= endereco < inicio_corpo and original.arg in troca:
+                continue # ARMZ do parâmetro trocado pela variável passada
+            arg = troca.get(original.arg, original.arg) if original.op == CRVL else original.arg
+            copias.append(Instrucao(original.op, arg, original.texto, original.linha))
+        destino[fim] = inicio_copia + len(copias) # Desviar para o RTPR = sair da cópia
+        for copia in copias:
+            if copia.op in (DSVF, DSVI):
+                copia.arg = destino[copia.arg]
+        novo.extend(copias)
+
+        expandidas += 1
+        removidas += 3 + 2 * len(troca) # PUSHER, CHPR e RTPR; PARAM e ARMZ de cada parâmetro trocado
+        pc = chpr + 1
+    novo_endereco.append(len(novo)) # Endereço "depois do fim"
+    realocar_desvios(originais, novo_endereco)
+    return novo, expandidas, removidas
+
+
+# Desvios que podem seguir em frente (condicionais) ou ir para o argumento
+OPS_DESVIO_CONDICIONAL = frozenset((DSVF, DFIG, DFDF, DFMA, DFME, DFMI, DFPA))
+
+
+def destino_final(programa, destino):
+    """ Segue a cadeia de DSVI que começa em 'destino' e devolve onde ela termina """
+    vistos = set()
+    while (isinstance(destino, int) and 0 <= destino < len(programa) and destino not in vistos
+           and programa[destino].op == DSVI and isinstance(programa[destino].arg, int)):
+        vistos.add(destino) # Um laço de DSVI (DSVI 5 no endereço 5) não trava o passo
+        destino = programa[destino].arg
+    return destino
+
+
+def encadear_desvios(programa):
+    """
+    Jump threading: um desvio (ou chamada, ou endereço de retorno do PUSHER)
+    que cai num DSVI passa a apontar direto para o fim da cadeia. Ex: o DSVI
+    que pula um procedimento e cai no DSVI que pula o próximo, ou o fim do
+    THEN de um if dentro de outro. Devolve quantos desvios mudaram.
+    """
+    alterados = 0
+    for instrucao in programa:
+        if instrucao.op in OPS_DESVIO and isinstance(instrucao.arg, int):
+            final = destino_final(programa, instrucao.arg)
+            if final != instrucao.arg:
+                instrucao.arg = final
+                alterados += 1
+    return alterados
+
+
+def alcancaveis(programa):
+    """
+    Marca as instruções que a execução pode alcançar a partir do endereço 0.
+    O RTPR volta para um endereço empilhado por um PUSHER: o argumento de todo
+    PUSHER alcançável entra como ponto de partida, e o RTPR não segue em frente
+    (no código do compilador, todo CHPR vem logo depois do seu PUSHER).
+    """
+    total = len(programa)
+    vivas = [False] * total
+    pendentes = [0]
+    while pendentes:
+        pc = pendentes.pop()
+        while 0 <= pc < total and not vivas[pc]:
+            vivas[pc] = True
+            instrucao = programa[pc]
+            op = instrucao.op
+            if op in OPS_DESVIO and isinstance(instrucao.arg, int):
+                if op == DSVI or op == CHPR:
+                    pc = instrucao.arg
+                    continue
+                pendentes.append(instrucao.arg) # Destino do desvio condicional ou retorno do PUSHER
+            elif op == PARA or op == RTPR:
+                break
+            pc += 1
+    return vivas
+
+
+def remover_inalcancaveis(programa):
+    """
+    Remove as instruções que nunca são executadas (os procedimentos que
+    ninguém chama, os DSVI que ficaram sem ninguém chegar neles depois do
+    encadeamento) e os DSVI que só pulam para a próxima instrução que sobrou.
+    Devolve (novo programa, instruções removidas, procedimentos removidos).
+    """
+    total = len(programa)
+    vivas = alcancaveis(programa)
+
+    # De trás para frente: proxima[i] = primeira instrução viva a partir de i.
+    # Um DSVI para frente cujo destino dá na mesma instrução viva que a
+    # seguinte a ele não faz nada (os destinos à frente já estão decididos)
+    proxima = [total] * (total + 1)
+    for pc in range(total - 1, -1, -1):
+        instrucao = programa[pc]
+        if vivas[pc] and instrucao.op == DSVI and isinstance(instrucao.arg, int) \
+                and pc < instrucao.arg <= total and proxima[instrucao.arg] == proxima[pc + 1]:
+            vivas[pc] = False
+        proxima[pc] = pc if vivas[pc] else proxima[pc + 1]
+
+    novo = []
+    novo_endereco = []
+    procedimentos = 0
+    for pc, instrucao in enumerate(programa):
+        novo_endereco.append(len(novo))
+        if vivas[pc]:
+            novo.append(instrucao)
+        elif instrucao.op == RTPR:
+            procedimentos += 1 # Cada procedimento termina em um único RTPR
+    novo_endereco.append(len(novo)) # Endereço "depois do fim"
+    # Quem apontava para uma instrução removida passa a apontar para a próxima que ficou
+    realocar_desvios(novo, novo_endereco)
+    return novo, total - len(novo), procedimentos
+
+
+def peephole(programa):
+    """
+    Olha o código por uma "janela" de duas instruções:
+      - sequências de ALME viram um único ALME com a soma;
+      - pares frequentes viram superinstruções (ver SUPERINSTRUCOES).
+    Uma instrução que é alvo de desvio nunca é juntada com a anterior, pois
+    alguém pode pular direto para ela.
+    Devolve (novo programa, contagem de cada superinstrução criada).
+    """
+    alvos = alvos_de_desvio(programa)
+    novo = []
+    novo_endereco = []
+    contagem = {}
+    i = 0
+    while i < len(programa):
+        atual = programa[i]
+        novo_endereco.append(len(novo))
+
+        # ALME 1; ALME 1; ALME 1 -> ALME 3
+        if atual.op == ALME and isinstance(atual.arg, int):
+            total = atual.arg
+            while (i + 1 < len(programa) and i + 1 not in alvos and
+                   programa[i + 1].op == ALME and isinstance(programa[i + 1].arg, int)):
+                i += 1
+                total += programa[i].arg
+                novo_endereco.append(len(novo))
+            if total != atual.arg:
+                contagem['ALME'] = contagem.get('ALME', 0) + 1
+            novo.append(Instrucao(ALME, total, linha=atual.linha))
+            i += 1
+            continue
+
+        # Par de instruções -> superinstrução
+        if i + 1 < len(programa) and i + 1 not in alvos:
+            seguinte = programa[i + 1]
+            super_op = SUPERINSTRUCOES.get((atual.op, seguinte.op))
+            if super_op is not None:
+                if super_op in OPS_COM_DOIS_ARGUMENTOS:
+                    arg = (atual.arg, seguinte.arg)
+                else:
+                    # Só um dos dois tem argumento (ex: SOMA; ARMZ a -> SOAR a)
+                    arg = seguinte.arg if seguinte.arg is not None else atual.arg
+                novo.append(Instrucao(super_op, arg, linha=atual.linha))
+                novo_endereco.append(len(novo) - 1)
+                contagem[NOMES[super_op]] = contagem.get(NOMES[super_op], 0) + 1
+                i += 2
+                continue
+
+        novo.append(atual)
+        i += 1
+
+    novo_endereco.append(len(novo)) # Endereço "depois do fim"
+    realocar_desvios(novo, novo_endereco)
+    return novo, contagem
+
+
+def otimizar(linhas, nivel=1, linhas_fonte=None, procedimentos=None):
+    """
+    Ponto de entrada do otimizador. Recebe as linhas do código objeto e
+    devolve (linhas otimizadas, relatório). O relatório é um dicionário com
+    o tamanho antes/depois e quantas vezes cada transformação foi aplicada.
+    Se 'linhas_fonte' (linha do código LALG de cada instrução) for passada,
+    o relatório também traz 'linhas_fonte' ajustada ao código otimizado: uma
+    instrução nova fica com a linha da primeira instrução que ela substituiu.
+    Com a tabela de procedimentos do gerador ('procedimentos', com os
+    endereços do código recebido), os procedimentos pequenos são expandidos
+    nas chamadas.
+    """
+    relatorio = {'antes': len(linhas), 'depois': len(linhas), 'expansao': {}, 'fluxo': {}, 'peephole': {}}
+    if nivel <= 0:
+        if linhas_fonte is not None:
+            relatorio['linhas_fonte'] = list(linhas_fonte)
+        return list(linhas), relatorio
+
+    programa = decodificar_programa(linhas, linhas_fonte)
+
+    # A expansão usa os endereços da tabela do gerador: vem antes de tudo
+    if procedimentos:
+        programa, expandidas, removidas = expandir_procedimentos(programa, procedimentos)
+        if expandidas:
+            relatorio['expansao'] = {'chamadas expandidas': expandidas,
+                                     'instruções de chamada removidas': removidas}
+
+    # Fluxo de controle primeiro: o peephole junta pares, e com menos desvios
+    # e menos alvos sobram mais pares para juntar
+    encadeados = encadear_desvios(programa)
+    programa, removidas, procedimentos = remover_inalcancaveis(programa)
+    relatorio['fluxo'] = {nome: qtd for nome, qtd in (('desvios encadeados', encadeados),
+                                                       ('instruções inalcançáveis', removidas),
+                                                       ('procedimentos sem chamada', procedimentos)) if qtd}
+
+    programa, relatorio['peephole'] = peephole(programa)
+
+    relatorio['depois'] = len(programa)
+    if linhas_fonte is not None:
+        relatorio['linhas_fonte'] = [instrucao.linha for instrucao in programa]
+    return [instrucao.formatar() for instrucao in programa], relatorio
+
+
+def formatar_relatorio(relatorio):
+    """ Texto curto com o resultado da otimização (usado pelo main.py) """
+    removidas = relatorio['antes'] - relatorio['depois']
+    texto = f"{relatorio['antes']} -> {relatorio['depois']} instruções ({removidas} removidas)"
+    if relatorio.get('expansao'):
+        detalhes = ', '.join(f"{nome}: {qtd}" for nome, qtd in relatorio['expansao'].items())
+        texto += f"\n        expansão: {detalhes}"
+    if relatorio.get('fluxo'):
+        detalhes = ', '.join(f"{nome}: {qtd}" for nome, qtd in relatorio['fluxo'].items())
+        texto += f"\n        fluxo: {detalhes}"
+    if relatorio.get('arvore'):
+        # Passos sobre a árvore sintática, que o Compilador junta ao relatório (ver otimizadorArvore.py)
+        detalhes = ', '.join(f"{nome}: {qtd}" for nome, qtd in sorted(relatorio['arvore'].items()))
+        texto += f"\n        árvore: {detalhes}"
+    if relatorio['peephole']:
+        detalhes = ', '.join(f"{nome}: {qtd}" for nome, qtd in sorted(relatorio['peephole'].items()))
+        texto += f"\n        peephole: {detalhes}"
+    return texto
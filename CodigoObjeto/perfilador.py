@@ -0,0 +1,131 @@
+import sys
+import os
+import json
+
+# Adiciona a pasta atual ao path para importar a tabela de instruções
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from instrucoes import *
+
+# ==============================================================================
+# PERFIL DE EXECUÇÃO DA MÁQUINA
+# ==============================================================================
+# Com MaquinaHipotetica(perfilar=True), o executar usa um laço instrumentado
+# (separado do laço normal, que continua sem nenhum custo extra) que só conta
+# quantas vezes cada PC foi executado. Todo o resto é calculado depois, aqui:
+#   - execuções por opcode (soma das contagens dos PCs com aquele opcode);
+#   - os PCs mais executados;
+#   - os laços mais quentes: cada DSVI que volta para trás fecha um laço
+#     (o corpo de um while), e o número de execuções dele é o de voltas;
+#   - se o código objeto trouxer o mapa do fonte (ver mapaFonte.py), as
+#     execuções por linha do código LALG e por procedimento.
+#
+# O relatório sai como tabela (texto) ou como JSON, para comparar versões.
+
+VERSAO_PERFIL = 1
+
+
+class Perfil:
+    """ Resultado de uma execução perfilada """
+
+    def __init__(self, opcodes, argumentos, contagem_pc, tempo, mapa=None):
+        self.opcodes = list(opcodes)
+        self.argumentos = list(argumentos)
+        self.contagem_pc = list(contagem_pc) # contagem_pc[pc] = execuções daquela linha
+        self.tempo = tempo                   # Tempo total do laço de execução (s)
+        self.mapa = mapa                     # MapaFonte do programa (None = sem mapa)
+
+    def total_instrucoes(self):
+        return sum(self.contagem_pc)
+
+    def por_opcode(self):
+        """ Dicionário nome do opcode -> execuções, do mais executado para o menos """
+        contagem = {}
+        for op, vezes in zip(self.opcodes, self.contagem_pc):
+            if vezes:
+                contagem[NOMES[op]] = contagem.get(NOMES[op], 0) + vezes
+        return dict(sorted(contagem.items(), key=lambda item: -item[1]))
+
+    def pcs_mais_executados(self, limite=10):
+        """ Lista [(pc, instrução em texto, execuções)] dos PCs mais executados """
+        ordem = sorted((pc for pc, vezes in enumerate(self.contagem_pc) if vezes),
+                       key=lambda pc: (-self.contagem_pc[pc], pc))
+        return [(pc, formatar_instrucao(self.opcodes[pc], self.argumentos[pc]), self.contagem_pc[pc])
+                for pc in ordem[:limite]]
+
+    def lacos(self, limite=10):
+        """ Lista [(início, pc do DSVI, voltas)] dos laços mais executados """
+        lacos = [(self.argumentos[pc], pc, vezes)
+                 for pc, (op, vezes) in enumerate(zip(self.opcodes, self.contagem_pc))
+                 if op == DSVI and vezes and isinstance(self.argumentos[pc], int)
+                 and self.argumentos[pc] <= pc]
+        lacos.sort(key=lambda laco: (-laco[2], laco[0]))
+        return lacos[:limite]
+
+    def por_linha_fonte(self):
+        """ Dicionário linha do fonte -> execuções, da mais executada para a menos (precisa do mapa) """
+        contagem = {}
+        if self.mapa is not None:
+            for pc, vezes in enumerate(self.contagem_pc):
+                if vezes:
+                    linha = self.mapa.linha(pc)
+                    contagem[linha] = contagem.get(linha, 0) + vezes
+        return dict(sorted(contagem.items(), key=lambda item: (-item[1], item[0])))
+
+    def por_procedimento(self):
+        """ Dicionário procedimento -> execuções ('(principal)' = fora de procedimentos) """
+        contagem = {}
+        if self.mapa is not None:
+            for linha, vezes in self.por_linha_fonte().items():
+                nome = self.mapa.procedimento_da_linha(linha) or '(principal)'
+                contagem[nome] = contagem.get(nome, 0) + vezes
+        return dict(sorted(contagem.items(), key=lambda item: -item[1]))
+
+    def como_dicionario(self, limite=10):
+        """ O relatório em dicionário (é isso que vai para o JSON) """
+        return {
+            'versao': VERSAO_PERFIL,
+            'tempo_s': self.tempo,
+            'instrucoes_executadas': self.total_instrucoes(),
+            'por_opcode': self.por_opcode(),
+            'por_pc': {str(pc): vezes for pc, vezes in enumerate(self.contagem_pc) if vezes},
+            'pcs_mais_executados': [{'pc': pc, 'instrucao': texto, 'execucoes': vezes}
+                                    for pc, texto, vezes in self.pcs_mais_executados(limite)],
+            'lacos': [{'inicio': inicio, 'fim': fim, 'voltas': voltas}
+                      for inicio, fim, voltas in self.lacos(limite)],
+            'por_linha_fonte': {str(linha): vezes for linha, vezes in self.por_linha_fonte().items()},
+            'por_procedimento': self.por_procedimento(),
+        }
+
+    def salvar_json(self, caminho, limite=10):
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(self.como_dicionario(limite), f, indent=2, ensure_ascii=False)
+
+    def formatar_tabela(self, limite=10):
+        """ Relatório em texto, no estilo das tabelas dos benchmarks """
+        total = self.total_instrucoes()
+        velocidade = total / self.tempo if self.tempo > 0 else 0
+        linhas = [f"Instruções executadas: {total:,} em {self.tempo:.4f} s ({velocidade:,.0f} instr/s)",
+                  "",
+                  f"{'Opcode':<14} {'Execuções':>12} {'%':>7}"]
+        for nome, vezes in self.por_opcode().items():
+            linhas.append(f"{nome:<14} {vezes:>12,} {100 * vezes / total:6.2f}%")
+
+        linhas += ["", f"{'PC':>6}  {'Instrução':<22} {'Execuções':>12}"]
+        for pc, texto, vezes in self.pcs_mais_executados(limite):
+            linhas.append(f"{pc:>6}  {texto:<22} {vezes:>12,}")
+
+        lacos = self.lacos(limite)
+        if lacos:
+            linhas += ["", f"{'Laço (início-fim)':<22} {'Voltas':>12}"]
+            for inicio, fim, voltas in lacos:
+                linhas.append(f"{f'{inicio}-{fim}':<22} {voltas:>12,}")
+
+        if self.mapa is not None:
+            linhas += ["", f"{'Linha do fonte':<14} {'Execuções':>12} {'%':>7}"]
+            for linha, vezes in list(self.por_linha_fonte().items())[:limite]:
+                linhas.append(f"{linha:<14} {vezes:>12,} {100 * vezes / total:6.2f}%")
+            linhas += ["", f"{'Procedimento':<14} {'Execuções':>12} {'%':>7}"]
+            for nome, vezes in self.por_procedimento().items():
+                linhas.append(f"{nome:<14} {vezes:>12,} {100 * vezes / total:6.2f}%")
+        return '\n'.join(linhas)
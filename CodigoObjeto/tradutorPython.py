@@ -0,0 +1,480 @@
+import sys
+import os
+import math
+import marshal
+import hashlib
+import importlib.util
+
+# Adiciona a pasta atual ao path para importar a tabela de instruções
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from instrucoes import *
+from otimizador import expandir_superinstrucao
+
+# ==============================================================================
+# TRADUTOR DO CÓDIGO OBJETO PARA PYTHON
+# ==============================================================================
+# Backend alternativo à MaquinaHipotetica.executar: em vez de interpretar uma
+# instrução por vez, eu traduzo o programa inteiro para o código-fonte de UMA
+# função Python, compilo essa função uma única vez e chamo ela.
+#
+# Como a tradução funciona:
+#   - O programa é dividido em blocos básicos (trechos sem desvios no meio).
+#     Um bloco que só é alcançado "caindo" do bloco anterior é colado nele.
+#   - Dentro de um bloco, a pilha de operandos é simulada NA TRADUÇÃO: a
+#     sequência "CRVL 3; CRCT 1; SOMA; ARMZ 3" vira a linha "d[3] = d[3] + 1".
+#     Só os valores que sobram na pilha no fim de um bloco (ex: os PARAM antes
+#     de um CHPR) vão para uma lista de verdade.
+#   - Os blocos ficam dentro de um "while True" que escolhe o próximo bloco
+#     pelo endereço (b). A escolha é uma árvore de if, não uma cadeia linear.
+#   - Um bloco que desvia de volta para o próprio início (o corpo de um while
+#     do LALG) ganha um "while True" só dele, sem passar pela escolha.
+#
+# O resultado é idêntico ao do interpretador, inclusive o crescimento
+# "permissivo" da memória quando um endereço ainda não foi alocado.
+# O código compilado fica em cache (.pyc), indexado pelo hash do programa.
+
+# Mude este número sempre que a tradução mudar, para invalidar o cache
+VERSAO_TRADUTOR = 7
+
+NOME_FUNCAO = 'executar_programa'
+
+# Instruções que encerram um bloco básico; as sem o DSVF nunca seguem para a
+# linha seguinte
+OPS_FIM_DE_BLOCO = frozenset((DSVF, DSVI, CHPR, RTPR, PARA))
+OPS_SEM_QUEDA = OPS_FIM_DE_BLOCO - {DSVF}
+
+OPERADORES = {SOMA: '+', SUBT: '-', MULT: '*'}
+COMPARACOES = {CPIG: '==', CDIF: '!=', CMAI: '>', CMEN: '<', CPMI: '<=', CPMA: '>='}
+
+
+def expandir_programa(opcodes, argumentos):
+    """ Lista (por PC) das instruções simples de cada linha, sem superinstruções """
+    return [expandir_superinstrucao(op, arg) for op, arg in zip(opcodes, argumentos)]
+
+
+def encontrar_blocos(programa):
+    """
+    Divide o programa expandido em blocos básicos.
+    Devolve (lideres, predecessores, alvos_dinamicos):
+      - lideres: endereços onde algum bloco começa, em ordem;
+      - predecessores: endereço -> quantos desvios/quedas chegam nele;
+      - alvos_dinamicos: endereços de retorno (PUSHER), alcançados via RTPR.
+    """
+    total = len(programa)
+    lideres = {0}
+    predecessores = {}
+    alvos_dinamicos = set()
+
+    def contar(destino):
+        predecessores[destino] = predecessores.get(destino, 0) + 1
+
+    for pc, simples in enumerate(programa):
+        for op, arg in simples:
+            if op == PUSHER and isinstance(arg, int):
+                alvos_dinamicos.add(arg)
+                lideres.add(arg)
+            elif op in (DSVF, DSVI, CHPR) and isinstance(arg, int):
+                lideres.add(arg)
+                contar(arg)
+        ultimo_op = simples[-1][0]
+        if ultimo_op in OPS_FIM_DE_BLOCO:
+            lideres.add(pc + 1)
+            if ultimo_op == DSVF:
+                contar(pc + 1) # O caminho "verdadeiro" cai no próximo bloco
+
+    lideres = sorted(l for l in lideres if 0 <= l < total)
+    # Blocos que começam por causa de um alvo também recebem a queda do anterior
+    for inicio in lideres[1:]:
+        if programa[inicio - 1][-1][0] not in OPS_FIM_DE_BLOCO:
+            contar(inicio)
+    return lideres, predecessores, alvos_dinamicos
+
+
+class _Valor:
+    """
+    Um valor na pilha simulada durante a tradução.
+    'texto' é a expressão Python; 'memoria' diz se ela lê a memória d (e
+    portanto precisa ser calculada antes de uma escrita); 'condicao' guarda a
+    comparação "crua" (sem o 1/0), usada direto pelo DSVF.
+    """
+    __slots__ = ('texto', 'memoria', 'condicao', 'constante')
+
+    def __init__(self, texto, memoria=False, condicao=None, constante=None):
+        self.texto = texto
+        self.memoria = memoria
+        self.condicao = condicao
+        self.constante = constante # Valor, quando a expressão é uma constante
+
+
+class TradutorPython:
+    """ Gera o código-fonte Python de um programa da máquina hipotética """
+
+    def __init__(self, opcodes, argumentos):
+        self.programa = expandir_programa(opcodes, argumentos)
+        self.total = len(self.programa)
+        self.linhas = []
+        self.constantes = [] # Valores que não têm repr válido em Python (inf, nan)
+        self.temporarios = 0
+
+    # --- Emissão de código ---
+
+    def emitir(self, nivel, texto):
+        self.linhas.append('    ' * nivel + texto)
+
+    def novo_temporario(self):
+        self.temporarios += 1
+        return f"t{self.temporarios}"
+
+    def constante(self, valor):
+        if isinstance(valor, float) and not math.isfinite(valor):
+            self.constantes.append(valor)
+            return f"k[{len(self.constantes) - 1}]"
+        return repr(valor)
+
+    # --- Pilha simulada ---
+
+    def empilhar(self, valor):
+        self.pilha.append(valor)
+
+    def desempilhar(self, nivel):
+        if self.pilha:
+            return self.pilha.pop()
+        # A pilha simulada acabou: o valor veio de um bloco anterior. O
+        # verificador já garantiu que a pilha real tem esse valor (ver
+        # executar_compilado), então o pop não confere se ela está vazia
+        temporario = self.novo_temporario()
+        self.emitir(nivel, f"{temporario} = s.pop()")
+        return _Valor(temporario)
+
+    def calcular_leituras(self, nivel):
+        """ Calcula agora os valores pendentes que leem a memória (antes de escrever nela) """
+        for valor in self.pilha:
+            if valor.memoria:
+                temporario = self.novo_temporario()
+                self.emitir(nivel, f"{temporario} = {valor.texto}")
+                valor.texto, valor.memoria, valor.condicao = temporario, False, None
+
+    def descarregar_pilha(self, nivel):
+        """ Passa o que sobrou na pilha simulada para a pilha real (s) """
+        for valor in self.pilha:
+            self.emitir(nivel, f"s.append({valor.texto})")
+        self.pilha = []
+
+    # --- Memória: garantia de tamanho ---
+    # O interpretador aumenta a memória quando um endereço não alocado é usado.
+    # Aqui eu faço o mesmo UMA vez por trecho: antes de cada trecho sem
+    # ALME/DESM, uma linha garante o tamanho para o maior endereço usado nele.
+    # A linha é omitida quando um trecho anterior do mesmo caminho já garantiu
+    # esse tamanho (só o DESM diminui a memória).
+
+    def abrir_trecho(self, nivel):
+        self.posicao_garantia = len(self.linhas)
+        self.nivel_garantia = nivel
+        self.maior_endereco = -1
+        self.linhas.append(None) # Preenchido em fechar_trecho
+
+    def usar_endereco(self, endereco):
+        if endereco > self.maior_endereco:
+            self.maior_endereco = endereco
+
+    def fechar_trecho(self):
+        if self.maior_endereco > self.garantido:
+            self.linhas[self.posicao_garantia] = (
+                '    ' * self.nivel_garantia +
+                f"if len(d) <= {self.maior_endereco}: crescer(d, {self.maior_endereco})")
+            self.garantido = self.maior_endereco
+
+    def emitir_alocacao(self, nivel):
+        """ Emite os ALME acumulados como uma única extensão da memória """
+        if self.alocacao_pendente:
+            self.emitir(nivel, f"d.extend([0] * {self.alocacao_pendente})")
+            self.alocacao_pendente = 0
+            self.abrir_trecho(nivel)
+
+    def endereco(self, arg, nome, pc):
+        if not isinstance(arg, int):
+            raise ValueError(f"Argumento inválido '{arg}' para {nome} na linha {pc}.")
+        self.usar_endereco(arg)
+        return arg
+
+    # --- Desvios ---
+
+    def saltar(self, nivel, destino):
+        """ Linhas que levam a execução para o bloco 'destino' """
+        self.descarregar_pilha(nivel)
+        if self.em_laco and destino == self.inicio_regiao:
+            self.emitir(nivel, "continue")
+            return
+        self.emitir(nivel, f"b = {destino}")
+        self.emitir(nivel, "break" if self.em_laco else "continue")
+
+    # --- Tradução ---
+
+    def traduzir(self):
+        """ Devolve o código-fonte da função executar_programa """
+        lideres, predecessores, alvos_dinamicos = encontrar_blocos(self.programa)
+        fim_do_bloco = dict(zip(lideres, lideres[1:] + [self.total]))
+
+        # Um bloco que só é alcançado caindo do anterior é colado nele
+        colados = set()
+        for inicio in lideres[1:]:
+            if (inicio not in alvos_dinamicos and predecessores.get(inicio, 0) == 1 and
+                    self.programa[inicio - 1][-1][0] not in OPS_SEM_QUEDA):
+                colados.add(inicio)
+        regioes = [inicio for inicio in lideres if inicio not in colados]
+
+        self.emitir(0, f"def {NOME_FUNCAO}(d, s, r, q, k, ler_valor, escrever, divisao_por_zero, crescer, fim):")
+        self.emitir(1, "b = 0")
+        self.emitir(1, "while True:")
+        self.arvore(regioes, 2, fim_do_bloco, colados)
+        return '\n'.join(linha for linha in self.linhas if linha is not None) + '\n'
+
+    def arvore(self, regioes, nivel, fim_do_bloco, colados):
+        """ Escolha do bloco pelo valor de b: busca binária feita de if/else """
+        if len(regioes) <= 4:
+            for i, inicio in enumerate(regioes):
+                self.emitir(nivel, f"{'if' if i == 0 else 'elif'} b == {inicio}:")
+                self.traduzir_regiao(inicio, nivel + 1, fim_do_bloco, colados)
+            # Endereço fora do programa: a execução termina (igual ao interpretador)
+            if regioes:
+                self.emitir(nivel, "else:")
+                nivel += 1
+            self.emitir(nivel, "return b")
+            return
+        meio = len(regioes) // 2
+        self.emitir(nivel, f"if b < {regioes[meio]}:")
+        self.arvore(regioes[:meio], nivel + 1, fim_do_bloco, colados)
+        self.emitir(nivel, "else:")
+        self.arvore(regioes[meio:], nivel + 1, fim_do_bloco, colados)
+
+    def traduzir_regiao(self, inicio, nivel, fim_do_bloco, colados):
+        # Blocos da região: o primeiro e os que foram colados em seguida
+        blocos = [inicio]
+        while fim_do_bloco[blocos[-1]] in colados:
+            blocos.append(fim_do_bloco[blocos[-1]])
+
+        # A região vira um laço se algum desvio dela volta para o começo
+        self.inicio_regiao = inicio
+        self.em_laco = any(op in (DSVF, DSVI, CHPR) and arg == inicio
+                           for pc in range(inicio, fim_do_bloco[blocos[-1]])
+                           for op, arg in self.programa[pc])
+        if self.em_laco:
+            self.emitir(nivel, "while True:")
+            nivel += 1
+
+        self.pilha = []
+        self.alocacao_pendente = 0
+        self.garantido = -1
+        self.abrir_trecho(nivel)
+        continua = True
+        for pc in range(inicio, fim_do_bloco[blocos[-1]]):
+            for op, arg in self.programa[pc]:
+                if op != ALME:
+                    self.emitir_alocacao(nivel)
+                continua = self.traduzir_instrucao(op, arg, pc, nivel)
+        self.emitir_alocacao(nivel)
+        self.fechar_trecho()
+
+        # Caiu no fim da região sem desviar: segue para o próximo bloco
+        if continua:
+            self.saltar(nivel, fim_do_bloco[blocos[-1]])
+
+    def traduzir_instrucao(self, op, arg, pc, nivel):
+        """
+        Traduz uma instrução simples. Devolve False quando a instrução encerra
+        a região (depois dela a execução nunca segue para a linha seguinte).
+        """
+        nome = NOMES[op]
+
+        if op in (INPP, NADA):
+            pass
+
+        elif op == CRCT:
+            self.empilhar(_Valor(self.constante(arg), constante=arg))
+
+        elif op in (CRVL, PARAM):
+            self.empilhar(_Valor(f"d[{self.endereco(arg, nome, pc)}]", memoria=True))
+
+        elif op == ARMZ:
+            valor = self.desempilhar(nivel)
+            self.calcular_leituras(nivel)
+            self.emitir(nivel, f"d[{self.endereco(arg, nome, pc)}] = {valor.texto}")
+
+        elif op in OPERADORES:
+            direita = self.desempilhar(nivel)
+            esquerda = self.desempilhar(nivel)
+            self.empilhar(_Valor(f"({esquerda.texto} {OPERADORES[op]} {direita.texto})",
+                                 esquerda.memoria or direita.memoria))
+
+        elif op == DIVI:
+            # A checagem de divisão por zero precisa acontecer neste ponto
+            direita = self.desempilhar(nivel)
+            esquerda = self.desempilhar(nivel)
+            divisor = direita.texto
+            if not isinstance(direita.constante, (int, float)) or direita.constante == 0:
+                divisor = self.novo_temporario()
+                self.emitir(nivel, f"{divisor} = {direita.texto}")
+                self.emitir(nivel, f"if {divisor} == 0: divisao_por_zero({pc})")
+            self.empilhar(_Valor(f"({esquerda.texto} / {divisor})", esquerda.memoria))
+
+        elif op in COMPARACOES:
+            direita = self.desempilhar(nivel)
+            esquerda = self.desempilhar(nivel)
+            condicao = f"{esquerda.texto} {COMPARACOES[op]} {direita.texto}"
+            self.empilhar(_Valor(f"(1 if {condicao} else 0)",
+                                 esquerda.memoria or direita.memoria, condicao))
+
+        elif op == IMPR:
+            valor = self.desempilhar(nivel)
+            self.emitir(nivel, f"escrever({valor.texto})")
+
+        elif op == LEIT:
+            temporario = self.novo_temporario()
+            self.emitir(nivel, f"{temporario} = ler_valor()")
+            self.empilhar(_Valor(temporario))
+
+        elif op == ALME:
+            # ALMEs seguidos viram uma extensão só (ver emitir_alocacao)
+            if not self.alocacao_pendente:
+                self.calcular_leituras(nivel)
+                self.fechar_trecho()
+            if not isinstance(arg, int):
+                raise ValueError(f"Argumento inválido '{arg}' para {nome} na linha {pc}.")
+            self.alocacao_pendente += arg
+
+        elif op == DESM:
+            self.calcular_leituras(nivel)
+            self.fechar_trecho()
+            self.emitir(nivel, f"del d[max(len(d) - {int(arg or 1)}, 0):]")
+            self.garantido = -1
+            self.abrir_trecho(nivel)
+
+        elif op in (ENPR, SAPR):
+            # Quadro de ativação (ver o tratador enpr da máquina): q é a pilha de quadros
+            if (not isinstance(arg, tuple) or len(arg) != 2
+                    or not all(isinstance(parte, int) for parte in arg)):
+                raise ValueError(f"Argumentos inválidos '{arg}' para {nome} na linha {pc}.")
+            a, n = arg
+            self.calcular_leituras(nivel)
+            self.usar_endereco(a + n - 1)
+            if op == ENPR:
+                self.emitir(nivel, f"q.append(d[{a}:{a + n}])")
+                self.emitir(nivel, f"d[{a}:{a + n}] = [0] * {n}")
+            else:
+                self.emitir(nivel, f"d[{a}:{a + n}] = q.pop()")
+
+        elif op == PUSHER:
+            self.emitir(nivel, f"r.append({arg!r})")
+
+        elif op == DSVF:
+            valor = self.desempilhar(nivel)
+            condicao = valor.condicao if valor.condicao is not None else valor.texto
+            self.descarregar_pilha(nivel)
+            self.emitir(nivel, f"if not ({condicao}):")
+            self.saltar(nivel + 1, arg)
+            # Novo trecho: quem desviou não pode ver a memória crescer por
+            # causa de endereços que só o caminho "verdadeiro" usa
+            self.fechar_trecho()
+            self.abrir_trecho(nivel)
+
+        elif op in (DSVI, CHPR):
+            self.saltar(nivel, arg)
+            return False
+
+        elif op == RTPR:
+            self.descarregar_pilha(nivel)
+            self.emitir(nivel, f"b = r.pop() if r else {self.total}") # Sem retorno: fim do programa
+            self.emitir(nivel, "break" if self.em_laco else "continue")
+            return False
+
+        elif op == PARA:
+            self.descarregar_pilha(nivel)
+            self.emitir(nivel, "fim()")
+            self.emitir(nivel, f"return {self.total}")
+            return False
+
+        else: # DESCONHECIDA (o argumento guarda o nome lido)
+            mensagem = f"Aviso: Instrução '{arg}' não implementada ou desconhecida na linha {pc}."
+            self.emitir(nivel, f"print({mensagem!r})")
+
+        return True
+
+
+# ==============================================================================
+# COMPILAÇÃO E CACHE (.pyc)
+# ==============================================================================
+
+def chave_programa(opcodes, argumentos):
+    """ Hash do programa (e da versão do tradutor): nome do arquivo no cache """
+    conteudo = repr((VERSAO_TRADUTOR, list(opcodes), list(argumentos))).encode('utf-8')
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def _ler_cache(caminho, chave):
+    # Cabeçalho no formato de um .pyc "baseado em hash": número mágico da
+    # versão do Python, flags e 8 bytes do hash do programa
+    try:
+        with open(caminho, 'rb') as f:
+            conteudo = f.read()
+    except OSError:
+        return None
+    cabecalho = importlib.util.MAGIC_NUMBER + (1).to_bytes(4, 'little') + bytes.fromhex(chave[:16])
+    if not conteudo.startswith(cabecalho):
+        return None # Outra versão do Python ou arquivo corrompido: recompila
+    try:
+        return marshal.loads(conteudo[len(cabecalho):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _gravar_cache(caminho, chave, codigo, constantes):
+    cabecalho = importlib.util.MAGIC_NUMBER + (1).to_bytes(4, 'little') + bytes.fromhex(chave[:16])
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, 'wb') as f:
+        f.write(cabecalho + marshal.dumps((codigo, constantes)))
+    os.replace(temporario, caminho) # Troca atômica: ninguém lê um arquivo pela metade
+
+
+def traduzir(opcodes, argumentos):
+    """ Devolve (código-fonte Python, constantes especiais) do programa """
+    tradutor = TradutorPython(opcodes, argumentos)
+    return tradutor.traduzir(), tradutor.constantes
+
+
+def compilar(opcodes, argumentos, pasta_cache=None):
+    """
+    Traduz e compila o programa, devolvendo (função, constantes).
+    Com 'pasta_cache', o código compilado é guardado/reaproveitado em
+    <pasta_cache>/<hash do programa>.pyc, e um programa já visto não é
+    traduzido de novo.
+    """
+    chave = chave_programa(opcodes, argumentos)
+    caminho = os.path.join(pasta_cache, f"{chave}.pyc") if pasta_cache else None
+
+    carregado = _ler_cache(caminho, chave) if caminho else None
+    if carregado is not None:
+        codigo, constantes = carregado
+    else:
+        fonte, constantes = traduzir(opcodes, argumentos)
+        codigo = compile(fonte, f"<lalg {chave[:12]}>", 'exec')
+        if caminho:
+            _gravar_cache(caminho, chave, codigo, constantes)
+
+    namespace = {}
+    exec(codigo, namespace)
+    return namespace[NOME_FUNCAO], constantes
+
+
+if __name__ == "__main__":
+    # Uso: python tradutorPython.py codigo_objeto.txt
+    # Mostra o código Python gerado para o programa (depuração)
+    if len(sys.argv) < 2:
+        print("Uso: python tradutorPython.py <código objeto .txt>")
+        sys.exit(1)
+    with open(sys.argv[1], 'r') as f:
+        decodificadas = [decodificar_linha(linha.strip()) for linha in f if linha.strip()]
+    fonte, _ = traduzir([op for op, _, _ in decodificadas],
+                        [nome if op == DESCONHECIDA else arg for op, arg, nome in decodificadas])
+    print(fonte)
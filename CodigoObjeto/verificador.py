@@ -0,0 +1,201 @@
+import sys
+import os
+
+# Adiciona a pasta atual ao path para importar a tabela de instruções
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from instrucoes import *
+
+# ==============================================================================
+# VERIFICADOR DO CÓDIGO OBJETO
+# ==============================================================================
+# Antes da primeira instrução, a máquina confere o programa inteiro por
+# interpretação abstrata: em vez de valores, só a profundidade da pilha de
+# operandos em cada PC. Cada instrução tira e põe um número fixo de valores
+# (ver EFEITOS), então a profundidade na entrada de cada PC alcançável é
+# calculada seguindo os desvios a partir do início. O programa é recusado se:
+#   - alguma instrução tira mais valores do que a pilha tem (ex: SOMA com um);
+#   - dois caminhos chegam no mesmo PC com profundidades diferentes;
+#   - um desvio, chamada ou endereço de retorno aponta para fora do programa
+#     (o endereço logo depois do fim é válido: a execução termina);
+#   - um endereço de dados é negativo ou fora do layout da memória tipada,
+#     ou o argumento de uma instrução não tem o formato dela.
+# Um programa aceito nunca esvazia a pilha demais nem passa da profundidade
+# máxima calculada: a máquina reserva a pilha com esse tamanho e os
+# tratadores não conferem mais nada disso a cada instrução.
+#
+# Chamadas: o CHPR leva para a entrada do procedimento com a profundidade
+# atual, e o RTPR volta para qualquer endereço de retorno empilhado por um
+# PUSHER (sem nenhum, a execução termina). Como o verificador
+# não sabe qual chamada está voltando, todo RTPR e todo endereço de retorno
+# ficam com a mesma profundidade. O gerador sempre chama com a pilha vazia
+# (uma chamada é um comando), então isso vale para todo código dele.
+
+
+class ErroVerificacao(ValueError):
+    """ Programa recusado pelo verificador; 'pc' é a instrução com o problema """
+
+    def __init__(self, pc, mensagem):
+        super().__init__(f"{mensagem} (linha {pc})")
+        self.pc = pc
+        self.mensagem = mensagem
+
+
+# Efeito de cada instrução na pilha de operandos: (tira, põe)
+EFEITOS = {
+    INPP: (0, 0), PARA: (0, 0), ALME: (0, 0), DESM: (0, 0), NADA: (0, 0), DESCONHECIDA: (0, 0),
+    CRCT: (0, 1), CRVL: (0, 1), PARAM: (0, 1), LEIT: (0, 1),
+    ARMZ: (1, 0), IMPR: (1, 0), DSVF: (1, 0),
+    SOMA: (2, 1), SUBT: (2, 1), MULT: (2, 1), DIVI: (2, 1),
+    CPIG: (2, 1), CDIF: (2, 1), CMAI: (2, 1), CMEN: (2, 1), CPMI: (2, 1), CPMA: (2, 1),
+    DSVI: (0, 0), PUSHER: (0, 0), CHPR: (0, 0), RTPR: (0, 0),
+    CRV2: (0, 2), CVCT: (0, 2), ARCT: (0, 0), COPI: (0, 0),
+    SOAR: (2, 0), SUAR: (2, 0), MUAR: (2, 0), DIAR: (2, 0),
+    DFIG: (2, 0), DFDF: (2, 0), DFMA: (2, 0), DFME: (2, 0), DFMI: (2, 0), DFPA: (2, 0),
+    LEAR: (0, 0), CVIM: (0, 0),
+    ENPR: (0, 0), SAPR: (0, 0),
+}
+
+# Desvios que também podem seguir para a linha seguinte
+OPS_DESVIO_CONDICIONAL = frozenset((DSVF, DFIG, DFDF, DFMA, DFME, DFMI, DFPA))
+
+# Instruções com um endereço de dados como argumento
+OPS_ENDERECO_DADOS = frozenset((CRVL, ARMZ, PARAM, SOAR, SUAR, MUAR, DIAR, LEAR, CVIM))
+
+
+class Verificacao:
+    """ Resultado de um programa aceito pelo verificador """
+
+    def __init__(self, profundidades, profundidade_maxima):
+        # profundidades[pc] = valores na pilha antes da instrução (None = nunca executa)
+        self.profundidades = profundidades
+        # Maior número de valores na pilha em qualquer ponto da execução
+        self.profundidade_maxima = profundidade_maxima
+
+    def alcancaveis(self):
+        return sum(1 for profundidade in self.profundidades if profundidade is not None)
+
+
+def eh_numero(valor):
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+
+def conferir_argumentos(pc, op, arg, total, tamanho_dados):
+    """ Formato do argumento, destinos de desvio e endereços de dados de uma instrução """
+    nome = NOMES[op]
+
+    def endereco_dados(endereco):
+        if not isinstance(endereco, int) or endereco < 0:
+            raise ErroVerificacao(pc, f"Endereço de dados inválido '{endereco}' em {nome}")
+        if tamanho_dados is not None and endereco >= tamanho_dados:
+            raise ErroVerificacao(pc, f"Endereço de dados {endereco} fora do layout em {nome}")
+
+    def constante(valor):
+        if not eh_numero(valor):
+            raise ErroVerificacao(pc, f"Constante inválida '{valor}' em {nome}")
+
+    if op in OPS_DESVIO:
+        if not isinstance(arg, int) or not 0 <= arg <= total:
+            raise ErroVerificacao(pc, f"Destino '{arg}' de {nome} fora do programa")
+    elif op in OPS_ENDERECO_DADOS:
+        endereco_dados(arg)
+    elif op in OPS_COM_DOIS_ARGUMENTOS:
+        if not isinstance(arg, tuple) or len(arg) != 2:
+            raise ErroVerificacao(pc, f"Argumentos inválidos '{arg}' para {nome}")
+        if op in (CRV2, COPI):
+            endereco_dados(arg[0])
+            endereco_dados(arg[1])
+        elif op == CVCT:
+            endereco_dados(arg[0])
+            constante(arg[1])
+        elif op == ARCT:
+            constante(arg[0])
+            endereco_dados(arg[1])
+        else: # ENPR/SAPR a n: o quadro inteiro precisa caber
+            a, n = arg
+            if not isinstance(n, int) or n < 0:
+                raise ErroVerificacao(pc, f"Tamanho de quadro inválido '{n}' em {nome}")
+            endereco_dados(a)
+            if n:
+                endereco_dados(a + n - 1)
+    elif op == CRCT:
+        constante(arg)
+    elif op == ALME:
+        if not isinstance(arg, int) or arg < 0:
+            raise ErroVerificacao(pc, f"Quantidade inválida '{arg}' em ALME")
+    elif op == DESM:
+        if arg is not None and (not isinstance(arg, int) or arg < 0):
+            raise ErroVerificacao(pc, f"Quantidade inválida '{arg}' em DESM")
+
+
+def verificar(opcodes, argumentos, layout=None, inicio=0, profundidade=0, retornos=()):
+    """
+    Confere o programa e devolve a Verificacao (profundidade em cada PC e a
+    máxima), ou levanta ErroVerificacao. A execução começa em 'inicio' com
+    'profundidade' valores na pilha e os endereços 'retornos' já na pilha de
+    retorno (a máquina pode continuar uma execução). Com o 'layout' da
+    memória tipada, os endereços de dados também precisam estar nele.
+    """
+    total = len(opcodes)
+    tamanho_dados = len(layout) if layout is not None else None
+
+    # Todas as instruções têm os argumentos conferidos, alcançáveis ou não
+    destinos_retorno = set(retornos)
+    for pc in range(total):
+        op = opcodes[pc]
+        conferir_argumentos(pc, op, argumentos[pc], total, tamanho_dados)
+        if op == PUSHER:
+            destinos_retorno.add(argumentos[pc])
+    for destino in destinos_retorno:
+        if not isinstance(destino, int) or not 0 <= destino <= total:
+            raise ErroVerificacao(inicio, f"Endereço de retorno '{destino}' fora do programa")
+
+    profundidades = [None] * total
+    maxima = profundidade
+    retorno = None # Profundidade comum a todo RTPR e endereço de retorno
+    pendentes = []
+
+    def chegar(destino, valores, origem):
+        if destino >= total:
+            return # Depois do fim: a execução termina
+        atual = profundidades[destino]
+        if atual is None:
+            profundidades[destino] = valores
+            pendentes.append(destino)
+        elif atual != valores:
+            raise ErroVerificacao(destino, f"Pilha com {atual} e com {valores} valores nos caminhos "
+                                           f"que chegam aqui (um deles vem da linha {origem})")
+
+    if not 0 <= inicio <= total:
+        raise ErroVerificacao(inicio, "Início da execução fora do programa")
+    chegar(inicio, profundidade, inicio)
+    while pendentes:
+        pc = pendentes.pop()
+        op = opcodes[pc]
+        arg = argumentos[pc]
+        valores = profundidades[pc]
+        tira, poe = EFEITOS[op]
+        if valores < tira:
+            raise ErroVerificacao(pc, f"{NOMES[op]} precisa de {tira} valores na pilha, mas ela tem {valores}")
+        depois = valores - tira + poe
+        if depois > maxima:
+            maxima = depois
+
+        if op == PARA:
+            continue
+        if op == RTPR:
+            if retorno is None:
+                retorno = depois
+                for destino in destinos_retorno:
+                    chegar(destino, depois, pc)
+            elif retorno != depois:
+                raise ErroVerificacao(pc, f"RTPR com {depois} valores na pilha, mas outro RTPR volta com {retorno}")
+        elif op == DSVI or op == CHPR:
+            chegar(arg, depois, pc)
+        elif op in OPS_DESVIO_CONDICIONAL:
+            chegar(arg, depois, pc)
+            chegar(pc + 1, depois, pc)
+        else:
+            chegar(pc + 1, depois, pc)
+
+    return Verificacao(profundidades, maxima)
@@ -0,0 +1,99 @@
+import sys
+import os
+
+# Adiciona o diretório atual ao PATH (mesma ideia do main.py)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AnalisadorSintatico.analisadorSintatico import Compilador, ErroCompilacao, cacheCompilacao
+from CodigoObjeto import executor
+
+# ==============================================================================
+# COMPILADOR E MÁQUINA COMO BIBLIOTECA
+# ==============================================================================
+# Compila um texto LALG e entrega o código objeto direto para a máquina, na
+# memória: nada é lido nem gravado em Dados/ e nenhum erro encerra o processo.
+# Os arquivos (tokens.txt, codigo_objeto.txt, .bin) só são gravados quando o
+# caminho é passado. Nada é impresso: nem mensagens de progresso (a análise
+# concluída, o início e o fim da execução, que só aparecem no main.py com
+# verboso=True) nem os erros, que chegam como exceções com a mensagem:
+#   - ErroCompilacao: erro léxico, sintático ou semântico (as mensagens, uma por linha);
+#   - ErroVerificacao (um ValueError): código objeto recusado pelo verificador;
+#   - ErroExecucao: divisão por zero, falta de entrada, ...
+#
+#   import lalg
+#   resultado = lalg.executar(codigo_fonte, entrada=[3, 2.5])
+#   resultado.saidas   # [valores do 'write', na ordem]
+#
+# Com 'cache_compilacao' (uma pasta ou um CacheCompilacao), um fonte já
+# compilado sai do cache da compilação (ver AnalisadorSintatico/cacheCompilacao.py).
+
+# A máquina usa os módulos do CodigoObjeto pelo nome curto (ver executor.py):
+# as classes de erro e dos canais precisam vir de lá
+ErroExecucao = executor.ErroExecucao
+entradaSaida = executor.entradaSaida
+CacheCompilacao = cacheCompilacao.CacheCompilacao
+
+
+class Execucao:
+    """ Resultado de executar(): o programa compilado, a máquina e o que foi escrito """
+
+    def __init__(self, programa, maquina, saidas):
+        self.programa = programa  # ProgramaObjeto (linhas, layout, mapa, relatório)
+        self.maquina = maquina    # MaquinaHipotetica depois da execução (dados, perfil, ...)
+        self.saidas = saidas      # Valores do 'write', na ordem
+
+
+def compilar(codigo_fonte, nivel=0, lexer_rapido=False, arquivo_tokens=None, cache_compilacao=None):
+    """
+    Compila o texto e devolve o ProgramaObjeto. Os tokens só são gravados
+    se 'arquivo_tokens' (um caminho) for passado. 'cache_compilacao' é a
+    pasta do cache da compilação ou um CacheCompilacao (para ler os acertos).
+    """
+    if isinstance(cache_compilacao, (str, os.PathLike)):
+        cache_compilacao = CacheCompilacao(cache_compilacao)
+    compilador = Compilador(nivel, lexer_rapido=lexer_rapido, cache=cache_compilacao)
+    if arquivo_tokens is None:
+        return compilador.compilar(codigo_fonte)
+    with open(arquivo_tokens, 'w') as tokens:
+        return compilador.compilar(codigo_fonte, tokens=tokens)
+
+
+def carregar(programa, entrada=(), saida=None, memoria_tipada=False, perfilar=False):
+    """
+    Máquina com o programa já carregado da memória. 'entrada' é a lista dos
+    valores do 'read' (ou qualquer canal com ler()); sem 'saida', os valores
+    do 'write' ficam em maquina.saida.valores (ver entradaSaida.py).
+    """
+    if not hasattr(entrada, 'ler'):
+        entrada = entradaSaida.EntradaMemoria(entrada)
+    vm = executor.MaquinaHipotetica(memoria_tipada=memoria_tipada, entrada=entrada,
+                                    saida=saida if saida is not None else entradaSaida.SaidaMemoria(),
+                                    perfilar=perfilar)
+    vm.carregar_programa(programa)
+    return vm
+
+
+def executar(codigo_fonte, entrada=(), nivel=0, memoria_tipada=False, backend='interpretador',
+             lexer_rapido=False, pasta_cache=None, arquivo_tokens=None, arquivo_codigo_objeto=None,
+             arquivo_binario=None, cache_compilacao=None):
+    """
+    Compila e executa o texto, tudo na memória; devolve a Execucao. Com
+    backend='python', o programa é traduzido para uma função Python (ver
+    tradutorPython.py), reaproveitada de 'pasta_cache' se ela for passada.
+    Os 'arquivo_*' gravam os artefatos da compilação, como o main.py faz, e
+    'cache_compilacao' é o cache do código objeto (ver compilar).
+    """
+    if backend not in ('interpretador', 'python'):
+        raise ValueError(f"Backend desconhecido: '{backend}'")
+    programa = compilar(codigo_fonte, nivel, lexer_rapido, arquivo_tokens, cache_compilacao)
+    if arquivo_codigo_objeto is not None:
+        programa.salvar(arquivo_codigo_objeto)
+    if arquivo_binario is not None:
+        programa.salvar_binario(arquivo_binario)
+
+    vm = carregar(programa, entrada, memoria_tipada=memoria_tipada)
+    if backend == 'python':
+        vm.executar_compilado(pasta_cache)
+    else:
+        vm.executar()
+    return Execucao(programa, vm, vm.saida.valores)
@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 
 # Adiciona o diretório atual ao PATH para o Python encontrar as pastas
 diretorio_raiz = os.path.dirname(os.path.abspath(__file__))
@@ -9,6 +10,7 @@ sys.path.append(diretorio_raiz)
 try:
     from AnalisadorSintatico import analisadorSintatico
     from CodigoObjeto import executor # Import da Parte 2
+    from CodigoObjeto import otimizador
 except ImportError as e:
     print(f"ERRO DE IMPORTAÇÃO: {e}")
     print("Verifique se as pastas 'AnalisadorSintatico' e 'CodigoObjeto' existem e contêm os arquivos '__init__.py' (opcional) e os scripts corretos.")
@@ -17,6 +19,12 @@ except ImportError as e:
     print(f"Conteúdo do PATH: {sys.path}")
     sys.exit(1)
 
+# Os módulos que a máquina e o compilador usam, tirados deles (como no lalg.py):
+# as classes de erro e dos canais precisam ser as mesmas que eles usam
+entradaSaida = executor.entradaSaida
+verificador = executor.verificador
+cacheCompilacao = analisadorSintatico.cacheCompilacao
+
 def ler_codigo():
     """ Lê o arquivo codigo.txt da pasta Dados """
     caminho_dados = os.path.join(diretorio_raiz, 'Dados', 'codigo.txt')
@@ -27,7 +35,74 @@ def ler_codigo():
         print(f"ERRO: Arquivo '{caminho_dados}' não encontrado.")
         sys.exit(1)
 
+def ler_argumentos():
+    """ Opções de linha de comando do compilador """
+    parser = argparse.ArgumentParser(description="Compilador LALG - Pascal")
+    parser.add_argument('--binario', action='store_true',
+                        help="gera também Dados/codigo_objeto.bin e executa a partir dele")
+    parser.add_argument('-O', dest='nivel', type=int, nargs='?', const=1, default=0,
+                        help="nível de otimização (0 = sem otimização, 1 = dobra de constantes, código invariante, expansão de procedimentos, fluxo de controle e peephole)")
+    parser.add_argument('--backend', choices=('interpretador', 'python'), default='interpretador',
+                        help="como executar o código objeto: interpretado instrução por instrução "
+                             "ou traduzido para uma função Python (com cache em Dados/cache)")
+    parser.add_argument('--memoria-tipada', action='store_true',
+                        help="guarda as variáveis em vetores tipados (INTEGER/REAL) reservados na carga, "
+                             "a partir do layout de dados gerado pelo compilador")
+    parser.add_argument('--entrada', metavar='ARQUIVO',
+                        help="lê os valores do 'read' deste arquivo (todos de uma vez) em vez do terminal; "
+                             "serve para repetir uma entrada gravada com --gravar-entrada")
+    parser.add_argument('--gravar-entrada', metavar='ARQUIVO',
+                        help="grava neste arquivo os valores digitados no terminal")
+    parser.add_argument('--saida', metavar='ARQUIVO',
+                        help="escreve a saída do 'write' neste arquivo, em blocos")
+    parser.add_argument('--saida-bruta', action='store_true',
+                        help="escreve só os números da saída (sem 'SAÍDA: '), em blocos")
+    parser.add_argument('--perfil', action='store_true',
+                        help="mostra ao final quantas vezes cada opcode/PC foi executado e os laços mais quentes")
+    parser.add_argument('--perfil-json', metavar='ARQUIVO',
+                        help="grava o perfil da execução neste arquivo JSON")
+    parser.add_argument('--lexer', choices=('ply', 'rapido'), default='ply',
+                        help="analisador léxico: o do PLY ou o escrito à mão, mais rápido em fontes grandes "
+                             "(os tokens são os mesmos)")
+    parser.add_argument('--sem-tokens', action='store_true',
+                        help="não gera o Dados/tokens.txt (a análise léxica continua sendo feita, só não é gravada)")
+    parser.add_argument('--em-memoria', action='store_true',
+                        help="não grava nenhum arquivo em Dados/ (nem tokens.txt nem codigo_objeto.txt): "
+                             "o código objeto vai direto para a máquina")
+    parser.add_argument('--sem-cache', action='store_true',
+                        help="compila sempre do zero, sem usar o cache da compilação em Dados/cache_compilacao "
+                             "(que guarda o código objeto de cada fonte já compilado)")
+    opcoes = parser.parse_args()
+    if opcoes.em_memoria and opcoes.binario:
+        parser.error("--binario grava o código objeto: não combina com --em-memoria")
+    if opcoes.entrada and opcoes.gravar_entrada:
+        parser.error("use --entrada ou --gravar-entrada, não os dois")
+    if opcoes.memoria_tipada and opcoes.backend == 'python':
+        parser.error("--memoria-tipada só é suportada pelo backend interpretador")
+    if (opcoes.perfil or opcoes.perfil_json) and opcoes.backend == 'python':
+        parser.error("o perfil só é suportado pelo backend interpretador")
+    return opcoes
+
+def criar_canais(opcoes):
+    """ Canais de entrada e saída da máquina de acordo com as opções (ver entradaSaida.py) """
+    try:
+        if opcoes.entrada:
+            entrada = entradaSaida.EntradaArquivo(opcoes.entrada)
+        else:
+            entrada = entradaSaida.EntradaInterativa(gravar_em=opcoes.gravar_entrada)
+        if opcoes.saida or opcoes.saida_bruta:
+            destino = open(opcoes.saida, 'w') if opcoes.saida else None
+            saida = entradaSaida.SaidaBuffer(destino, bruta=opcoes.saida_bruta)
+        else:
+            saida = entradaSaida.SaidaPadrao()
+    except OSError as e:
+        print(f"ERRO: Não foi possível abrir o arquivo de entrada/saída: {e}")
+        sys.exit(1)
+    return entrada, saida
+
 def main():
+    opcoes = ler_argumentos()
+
     print("==============================================")
     print("      COMPILADOR LALG - PASCAL (PARTE 1)      ")
     print("==============================================\n")
@@ -35,55 +110,110 @@ def main():
     # Lê o código fonte (Pascal) do arquivo codigo.txt
     codigo_fonte = ler_codigo()
 
-    # --- ETAPA 1: ANÁLISE LÉXICA ---
-    try:
-        print(">>> Etapa 1: Análise Léxica...")
-        # Chamamos a função do sintatico.py que gera o tokens.txt
-        analisadorSintatico.gerar_arquivo_tokens_formatado(codigo_fonte)
-        print("   [OK] Tokens gerados em 'Dados/tokens.txt'.\n")
-    except Exception as e:
-        print(f"   [ERRO] Falha na Análise Léxica: {e}")
-        sys.exit(1)
-
-    # --- ETAPA 2, 3 e 4: SINTÁTICO, SEMÂNTICO E GERAÇÃO ---
-    # Com o compilador Ascendente (Bottom-Up), essas etapas ocorrem juntas.
+    # --- ETAPAS 1 a 4: LÉXICA, SINTÁTICA, SEMÂNTICA E GERAÇÃO ---
+    # Com o compilador Ascendente (Bottom-Up), a análise léxica e a sintática
+    # ocorrem juntas, numa única passada: o parser pede os tokens ao lexer e, de
+    # passagem, cada token é escrito no tokens.txt (a não ser com --sem-tokens).
+    # O parser monta a árvore sintática; a semântica e a geração de código são
+    # uma segunda passada, sobre a árvore.
+    arquivo_tokens = None
+    # Cache do código objeto (ver AnalisadorSintatico/cacheCompilacao.py); --em-memoria não grava nada
+    cache = None
+    if not (opcoes.sem_cache or opcoes.em_memoria):
+        cache = cacheCompilacao.CacheCompilacao(os.path.join(diretorio_raiz, 'Dados', 'cache_compilacao'))
     try:
+        print(">>> Etapa 1: Análise Léxica")
         print(">>> Etapa 2: Análise Sintática")
         print(">>> Etapa 3: Análise Semântica")
         print(">>> Etapa 4: Geração de Código Objeto")
+
+        if not (opcoes.sem_tokens or opcoes.em_memoria):
+            arquivo_tokens = open(analisadorSintatico.ARQUIVO_TOKENS, 'w')
         
-        # Reinicia o gerador de código para garantir limpeza
-        analisadorSintatico.gerador = analisadorSintatico.GeradorCodigo()
-        analisadorSintatico.gerador.adicionar_instrucao("INPP")
-        
-        # Executa o parser
-        analisadorSintatico.parser.parse(codigo_fonte, lexer=analisadorSintatico.lexer)
+        # Cada compilação usa o seu próprio lexer, parser e gerador de código
+        compilador = analisadorSintatico.Compilador(opcoes.nivel, lexer_rapido=(opcoes.lexer == 'rapido'),
+                                                    cache=cache, verboso=True)
+        programa = compilador.compilar(codigo_fonte, tokens=arquivo_tokens)
+        if cache is not None:
+            if cache.acertos:
+                print("   [OK] Código objeto reaproveitado do cache (etapas 1 a 4 puladas).")
+            elif cache.gravadas:
+                print("   [OK] Código objeto guardado no cache.")
+            else:
+                print("   [AVISO] Não foi possível gravar o código objeto no cache.")
+            print(f"   [OK] Cache da compilação: {cacheCompilacao.formatar_taxas(*cache.estatisticas())}")
+        if arquivo_tokens is not None:
+            print("   [OK] Tokens gerados em 'Dados/tokens.txt'.")
+
+        if programa.relatorio is not None:
+            print(f"   [OK] Otimização -O{opcoes.nivel}: {otimizador.formatar_relatorio(programa.relatorio)}")
         
-        # Salva o arquivo objeto
-        caminho_obj = os.path.join(diretorio_raiz, 'Dados', 'codigo_objeto.txt')
-        with open(caminho_obj, 'w') as f_out:
-            for linha in analisadorSintatico.gerador.codigo:
-                f_out.write(linha + '\n')
-                
-        print(f"   [OK] Código Objeto gerado em '{caminho_obj}'.\n")
+        # Salva o arquivo objeto (a máquina não lê de volta: recebe o programa da memória)
+        if not opcoes.em_memoria:
+            caminho_obj = os.path.join(diretorio_raiz, 'Dados', 'codigo_objeto.txt')
+            programa.salvar(caminho_obj)
+            print(f"   [OK] Código Objeto gerado em '{caminho_obj}'.\n")
+
+        if opcoes.binario:
+            caminho_bin = os.path.join(diretorio_raiz, 'Dados', 'codigo_objeto.bin')
+            programa.salvar_binario(caminho_bin)
+            print(f"   [OK] Código Objeto binário gerado em '{caminho_bin}'.\n")
         
+    except analisadorSintatico.ErroCompilacao as e:
+        # O compilador não imprime nada: os erros (um por linha) vêm na exceção
+        print(e)
+        print("   [ERRO] Falha durante a compilação.")
+        sys.exit(1)
     except Exception as e:
         print(f"   [ERRO] Falha durante a compilação: {e}")
         sys.exit(1)
+    finally:
+        if arquivo_tokens is not None:
+            arquivo_tokens.close()
 
     # --- PARTE 2: EXECUÇÃO ---
     print("==============================================")
     print(">>> Iniciando Parte 2: Execução da Máquina Hipotética")
     print("==============================================")
     
+    entrada, saida = criar_canais(opcoes)
     try:
-        vm = executor.MaquinaHipotetica()
-        # O executor já sabe onde buscar o arquivo gerado (na pasta Dados)
-        caminho_obj_completo = os.path.join(diretorio_raiz, 'Dados', 'codigo_objeto.txt')
-        vm.carregar(caminho_obj_completo)
-        vm.executar()
+        vm = executor.MaquinaHipotetica(memoria_tipada=opcoes.memoria_tipada,
+                                        entrada=entrada, saida=saida,
+                                        perfilar=bool(opcoes.perfil or opcoes.perfil_json),
+                                        verboso=True)
+        if opcoes.binario:
+            # Com --binario, a execução parte do arquivo binário gerado (carga com mmap)
+            vm.carregar(os.path.join(diretorio_raiz, 'Dados', 'codigo_objeto.bin'))
+        else:
+            # O programa compilado vai direto para a máquina, sem ler o codigo_objeto.txt de volta
+            vm.carregar_programa(programa)
+            print(f"Programa carregado com {len(vm.opcodes)} instruções.")
+        if opcoes.backend == 'python':
+            vm.executar_compilado(None if opcoes.em_memoria else os.path.join(diretorio_raiz, 'Dados', 'cache'))
+        else:
+            vm.executar()
+        if vm.perfil is not None:
+            if opcoes.perfil:
+                print("\n>>> Perfil da Execução")
+                print(vm.perfil.formatar_tabela())
+            if opcoes.perfil_json:
+                vm.perfil.salvar_json(opcoes.perfil_json)
+                print(f"   [OK] Perfil gravado em '{opcoes.perfil_json}'.")
+    except executor.ErroExecucao as e:
+        # Erro do programa (divisão por zero, entrada inválida, ...): a mensagem já diz onde
+        print(e)
+        sys.exit(1)
+    except verificador.ErroVerificacao as e:
+        # Código objeto recusado antes da primeira instrução (ver CodigoObjeto/verificador.py)
+        print(f"   [ERRO] Código objeto recusado pelo verificador: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"   [ERRO CRÍTICO NA EXECUÇÃO]: {e}")
+        sys.exit(1)
+    finally:
+        entrada.fechar()
+        if opcoes.saida: saida.destino.close()
 
     print("==============================================")
     print("      COMPILAÇÃO E EXECUÇÃO CONCLUÍDA COM SUCESSO!       ")